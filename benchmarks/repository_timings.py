@@ -0,0 +1,427 @@
+"""Seed a scratch database and time every repository method before/after db/migations/2.sql.
+
+Usage:
+    python -m benchmarks.repository_timings --dsn postgresql://localhost/matcha_bench
+
+The database must already contain the bot schema. The script refuses to touch a
+database that holds data it did not seed itself, because it drops and recreates
+the indexes of 2.sql to get the "before" numbers.
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import asyncpg
+
+from db.asyncpg_client import AsyncpgClient
+from repositories.bot_panel_repository import BotPanelRepository
+from repositories.clockin_repository import ClockinRepository
+from repositories.company_repository import CompanyRepository
+from repositories.leave_repository import (
+    DELETE_LEAVE_BY_MESSAGE_ID,
+    LeaveRepository,
+)
+from repositories.member_repository import UPDATE_USER_ROLE, MemberRepository
+from repositories.office_entry_repository import OfficeEntryRepository
+from repositories.standup_repository import (
+    DELETE_STANDUP_BY_MESSAGE_ID,
+    StandupRepository,
+)
+from repositories.voice_attendance_repository import VoiceAttendanceRepository
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "db" / "migations"
+INDEX_MIGRATION = MIGRATIONS_DIR / "2.sql"
+SEED_MARKER = "seeded by benchmarks.repository_timings"
+BANGKOK = timezone(timedelta(hours=7))
+LEAVE_CHANNEL_ID = "900000000000000001"
+
+LEAVE_TYPES = ["annual_leave", "sick_leave", "personal_leave", "birthday_leave"]
+PARTIAL_LEAVES = [None, None, "morning", "afternoon"]
+
+
+class Sample:
+    """Arguments picked from the seeded data that every timed call reuses."""
+
+    def __init__(self, author_id: str, channel_id: str, message_id: str,
+                 leave_message_id: str, task_id, target_date: date):
+        self.author_id = author_id
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.leave_message_id = leave_message_id
+        self.task_id = task_id
+        self.target_date = target_date
+
+
+async def ensure_scratch_database(conn: asyncpg.Connection) -> bool:
+    """Return True when the database is empty and needs seeding."""
+    if await conn.fetchval("SELECT to_regclass('public.message')") is None:
+        raise SystemExit(
+            "The bot schema is missing, apply db/migations/1.sql to the database first."
+        )
+
+    marker = await conn.fetchval(
+        "SELECT obj_description('public.message'::regclass, 'pg_class')"
+    )
+    if marker == SEED_MARKER:
+        return False
+
+    has_data = await conn.fetchval("SELECT EXISTS (SELECT 1 FROM public.message)")
+    if has_data:
+        raise SystemExit(
+            "The database already holds standups that were not seeded by this script."
+            " Point --dsn at a scratch database."
+        )
+    return True
+
+
+async def seed(conn: asyncpg.Connection, teams: int, members: int, days: int,
+               rng: random.Random) -> None:
+    today = datetime.now(BANGKOK).date()
+    start = today - timedelta(days=days)
+    workdays = [
+        start + timedelta(days=i)
+        for i in range(days + 1)
+        if (start + timedelta(days=i)).weekday() < 5
+    ]
+
+    team_rows = [
+        (str(800000000000000000 + i), f"team-{i:03d}", "700000000000000000",
+         "Bench Server", datetime.now(timezone.utc))
+        for i in range(teams)
+    ]
+    await conn.copy_records_to_table(
+        "team",
+        records=team_rows,
+        columns=["channel_id", "team_name", "server_id", "server_name", "timestamp"],
+    )
+
+    member_rows = []
+    member_channel: dict[str, str] = {}
+    for i in range(members):
+        author_id = str(600000000000000000 + i)
+        channel_id = team_rows[i % teams][0]
+        member_channel[author_id] = channel_id
+        role = "admin" if i < 3 else "user"
+        member_rows.append(
+            (channel_id, author_id, f"member-{i:04d}", role, datetime.now(timezone.utc))
+        )
+    await conn.copy_records_to_table(
+        "member_team",
+        records=member_rows,
+        columns=["channel_id", "author_id", "server_name", "role", "created_at"],
+    )
+
+    message_rows, task_rows, office_rows = [], [], []
+    leave_rows, activity_rows, clockin_rows = [], [], []
+    message_seq = 500000000000000000
+    for author_id, channel_id in member_channel.items():
+        for day in workdays:
+            if rng.random() < 0.04:
+                message_seq += 1
+                leave_rows.append(
+                    (str(message_seq), author_id, LEAVE_CHANNEL_ID, "leave",
+                     rng.choice(LEAVE_TYPES), rng.choice(PARTIAL_LEAVES), day,
+                     datetime.combine(day, datetime.min.time(), BANGKOK))
+                )
+                continue
+            if rng.random() > 0.9:
+                continue
+
+            message_seq += 1
+            message_id = str(message_seq)
+            posted_at = datetime.combine(day, datetime.min.time(), BANGKOK) + timedelta(
+                hours=8, minutes=rng.randint(0, 120)
+            )
+            tasks = [f"task {n} for {day.isoformat()}" for n in range(rng.randint(2, 6))]
+            message_rows.append(
+                (message_id, author_id, f"user-{author_id[-4:]}", "Bench Server",
+                 channel_id, "\n".join(tasks), day, posted_at, None)
+            )
+            task_rows.extend((message_id, author_id, day, task) for task in tasks)
+            if rng.random() < 0.3:
+                office_rows.append((author_id, message_id, day, posted_at))
+
+            joined_at = posted_at - timedelta(minutes=rng.randint(0, 40))
+            activity_rows.append((author_id, joined_at, "join", day))
+            activity_rows.append((author_id, joined_at + timedelta(hours=9), "leave", day))
+            clockin_rows.append((author_id, joined_at))
+
+    # With db/migations/5.sql applied, message and tasks are partitioned by month
+    # and tasks carries the message date.
+    partitioned = await conn.fetchval(
+        "SELECT to_regproc('public.create_standup_partitions') IS NOT NULL"
+    )
+    if partitioned:
+        await conn.execute("SELECT public.create_standup_partitions($1, $2)", start, today)
+    else:
+        task_rows = [(message_id, author_id, task) for message_id, author_id, _, task in task_rows]
+
+    await conn.copy_records_to_table(
+        "message",
+        records=message_rows,
+        columns=["message_id", "author_id", "username", "servername", "channel_id",
+                 "content", "message_date", "timestamp", "last_updated_at"],
+    )
+    await conn.copy_records_to_table(
+        "tasks",
+        records=task_rows,
+        columns=(
+            ["message_id", "author_id", "message_date", "task"]
+            if partitioned
+            else ["message_id", "author_id", "task"]
+        ),
+    )
+    await conn.copy_records_to_table(
+        "office_entries",
+        records=office_rows,
+        columns=["author_id", "message_id", "date", "created_at"],
+    )
+    await conn.copy_records_to_table(
+        "attendance",
+        records=leave_rows,
+        columns=["message_id", "author_id", "channel_id", "content", "leave_type",
+                 "partial_leave", "absent_date", "created_at"],
+    )
+    await conn.copy_records_to_table(
+        "attendance_activity",
+        records=activity_rows,
+        columns=["author_id", "event_time", "event_type", "date"],
+    )
+    await conn.copy_records_to_table(
+        "clockin_log", records=clockin_rows, columns=["author_id", "clock_in_time"]
+    )
+
+    holidays = sorted(rng.sample(workdays, min(15 * (days // 365 + 1), len(workdays))))
+    await conn.copy_records_to_table(
+        "company_holidays",
+        records=[(day, f"holiday {day.isoformat()}") for day in holidays],
+        columns=["holiday_date", "description"],
+    )
+
+    await conn.execute(f"COMMENT ON TABLE public.message IS '{SEED_MARKER}'")
+    print(
+        f"Seeded {len(member_rows)} members in {teams} teams, {len(message_rows)} standups,"
+        f" {len(task_rows)} tasks, {len(leave_rows)} leaves, {len(office_rows)} office entries,"
+        f" {len(activity_rows)} voice events."
+    )
+
+
+async def pick_sample(conn: asyncpg.Connection) -> Sample:
+    row = await conn.fetchrow(
+        """
+        SELECT m.author_id, m.channel_id, m.message_id, m.message_date
+        FROM message m
+        ORDER BY m.message_date DESC, m.message_id
+        LIMIT 1
+        """
+    )
+    leave_message_id = await conn.fetchval(
+        "SELECT message_id FROM attendance ORDER BY absent_date DESC LIMIT 1"
+    )
+    task_id = await conn.fetchval(
+        "SELECT id FROM tasks WHERE message_id = $1 LIMIT 1", row["message_id"]
+    )
+    return Sample(
+        author_id=row["author_id"],
+        channel_id=row["channel_id"],
+        message_id=row["message_id"],
+        leave_message_id=leave_message_id,
+        task_id=task_id,
+        target_date=row["message_date"],
+    )
+
+
+def build_cases(client: AsyncpgClient, s: Sample) -> dict[str, Callable[[], Awaitable]]:
+    standup = StandupRepository(client)
+    member = MemberRepository(client)
+    leave = LeaveRepository(client)
+    company = CompanyRepository(client)
+    office = OfficeEntryRepository(client)
+    voice = VoiceAttendanceRepository(client)
+    clockin = ClockinRepository(client)
+    bot_panel = BotPanelRepository(client)
+
+    month_start = s.target_date.replace(day=1)
+    year = s.target_date.year
+
+    async def rolled_back(statement, *args):
+        # Writes are timed inside a transaction that is rolled back so every run sees the same data.
+        conn = await client.get_connection()
+        try:
+            tr = conn.transaction()
+            await tr.start()
+            try:
+                await conn.execute(statement, *args)
+            finally:
+                await tr.rollback()
+        finally:
+            await client.release_connection(conn)
+
+    return {
+        "standup.get_task_by_id": lambda: standup.get_task_by_id(s.task_id),
+        "standup.get_standup_tasks_by_user_and_date": lambda: standup.get_standup_tasks_by_user_and_date(
+            s.author_id, month_start, s.target_date
+        ),
+        "standup.get_standup_channel_ids": standup.get_standup_channel_ids,
+        "standup.get_userid_wrote_standup_by_date": lambda: standup.get_userid_wrote_standup_by_date(
+            int(s.channel_id), s.target_date, s.target_date
+        ),
+        "standup.userid_in_standup_channel": lambda: standup.userid_in_standup_channel(
+            int(s.channel_id)
+        ),
+        "standup.get_standup_by_message_id": lambda: standup.get_standup_by_message_id(
+            s.message_id
+        ),
+        "standup.get_standups_by_user_and_date": lambda: standup.get_standups_by_user_and_date(
+            s.author_id, month_start, s.target_date
+        ),
+        "standup.delete_standup_by_message_id (rolled back)": lambda: rolled_back(
+            DELETE_STANDUP_BY_MESSAGE_ID, s.message_id
+        ),
+        "member.get_all_standup_members": member.get_all_standup_members,
+        "member.get_standup_members_by_channelid": lambda: member.get_standup_members_by_channelid(
+            s.channel_id
+        ),
+        "member.is_user_added_to_standup_channel": lambda: member.is_user_added_to_standup_channel(
+            int(s.channel_id), int(s.author_id)
+        ),
+        "member.get_user_role": lambda: member.get_user_role(s.author_id),
+        "member.get_standup_channels_by_user_id": lambda: member.get_standup_channels_by_user_id(
+            s.author_id
+        ),
+        "member.is_user_exists": lambda: member.is_user_exists(s.author_id),
+        "member.update_user_role (rolled back)": lambda: rolled_back(
+            UPDATE_USER_ROLE, "user", s.author_id
+        ),
+        "leave.get_fullday_leave_date_by_userid_and_year": lambda: leave.get_fullday_leave_date_by_userid_and_year(
+            s.author_id, year - 1, year
+        ),
+        "leave.is_user_on_leave_fullday": lambda: leave.is_user_on_leave_fullday(
+            s.author_id, s.target_date
+        ),
+        "leave.get_user_inleave": lambda: leave.get_user_inleave(s.channel_id, s.target_date),
+        "leave.get_daily_leaves": lambda: leave.get_daily_leaves(s.target_date),
+        "leave.get_leave_by_message_id": lambda: leave.get_leave_by_message_id(
+            s.leave_message_id
+        ),
+        "leave.get_leave_by_userid_and_date": lambda: leave.get_leave_by_userid_and_date(
+            s.author_id, date(year, 1, 1), date(year, 12, 31)
+        ),
+        "leave.delete_leave_by_message_id (rolled back)": lambda: rolled_back(
+            DELETE_LEAVE_BY_MESSAGE_ID, s.leave_message_id
+        ),
+        "company.get_holidays_by_year": lambda: company.get_holidays_by_year(year),
+        "company.get_holiday_date_by_year": lambda: company.get_holiday_date_by_year(year, year + 1),
+        "company.get_holiday_date_by_date": lambda: company.get_holiday_date_by_date(s.target_date),
+        "company.get_holidays_by_date_range": lambda: company.get_holidays_by_date_range(
+            month_start, s.target_date
+        ),
+        "office_entry.get_daily_office_entries": lambda: office.get_daily_office_entries(
+            s.target_date
+        ),
+        "office_entry.get_office_entry_by_author_id_and_date": lambda: office.get_office_entry_by_author_id_and_date(
+            s.author_id, s.target_date
+        ),
+        "voice_attendance.get_daily_attendance_summary_by_channel_id_and_date": lambda: voice.get_daily_attendance_summary_by_channel_id_and_date(
+            int(s.channel_id), s.target_date
+        ),
+        "voice_attendance.get_lested_event_type_by_author_id": lambda: voice.get_lested_event_type_by_author_id(
+            int(s.author_id)
+        ),
+        "clockin.get_clockin_by_author_and_date": lambda: clockin.get_clockin_by_author_and_date(
+            s.author_id, s.target_date
+        ),
+        "bot_panel.get_bot_panel": bot_panel.get_bot_panel,
+    }
+
+
+async def time_cases(dsn: str, sample: Sample, runs: int) -> dict[str, tuple[float, float]]:
+    client = AsyncpgClient(dsn, min_size=1, max_size=1, health_check_interval=0)
+    await client.connect()
+    try:
+        results = {}
+        for name, call in build_cases(client, sample).items():
+            for _ in range(3):
+                await call()
+            samples = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                await call()
+                samples.append((time.perf_counter() - started) * 1000)
+            samples.sort()
+            results[name] = (
+                statistics.median(samples),
+                samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            )
+        return results
+    finally:
+        await client.close()
+
+
+def index_names() -> list[str]:
+    return re.findall(r"CREATE INDEX IF NOT EXISTS (\w+)", INDEX_MIGRATION.read_text())
+
+
+def print_report(before: dict, after: dict) -> None:
+    width = max(len(name) for name in before)
+    print(
+        f"{'method':<{width}}  {'before p50':>10}  {'after p50':>10}"
+        f"  {'before p95':>10}  {'after p95':>10}  {'speedup':>7}"
+    )
+    for name, (before_p50, before_p95) in before.items():
+        after_p50, after_p95 = after[name]
+        speedup = before_p50 / after_p50 if after_p50 else float("inf")
+        print(
+            f"{name:<{width}}  {before_p50:>8.2f}ms  {after_p50:>8.2f}ms"
+            f"  {before_p95:>8.2f}ms  {after_p95:>8.2f}ms  {speedup:>6.1f}x"
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", required=True, help="DSN of a scratch database with the bot schema")
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--members", type=int, default=300)
+    parser.add_argument("--days", type=int, default=365, help="days of history to seed")
+    parser.add_argument("--runs", type=int, default=50, help="timed calls per method")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        if await ensure_scratch_database(conn):
+            await seed(conn, args.teams, args.members, args.days, random.Random(args.seed))
+        else:
+            print("Reusing previously seeded data.")
+
+        for name in index_names():
+            await conn.execute(f"DROP INDEX IF EXISTS public.{name}")
+        await conn.execute("ANALYZE")
+        sample = await pick_sample(conn)
+    finally:
+        await conn.close()
+
+    print(f"Timing {args.runs} calls per method without the 2.sql indexes...")
+    before = await time_cases(args.dsn, sample, args.runs)
+
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        await conn.execute(INDEX_MIGRATION.read_text())
+    finally:
+        await conn.close()
+
+    print(f"Timing {args.runs} calls per method with the 2.sql indexes...")
+    after = await time_cases(args.dsn, sample, args.runs)
+
+    print_report(before, after)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
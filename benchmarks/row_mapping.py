@@ -0,0 +1,123 @@
+"""Compare pydantic validation, model_construct and db.row_mapping on 10k asyncpg records.
+
+Usage:
+    python -m benchmarks.row_mapping --dsn postgresql://localhost/matcha_bench --rows 10000
+
+The rows are generated with generate_series using the column types of the bot
+schema (enum columns come back from asyncpg as str, so text stands in for them),
+so any PostgreSQL 13+ database works and nothing is written.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Callable
+
+import asyncpg
+
+from db.row_mapping import map_rows
+from models import (
+    DailyLeaveSummary,
+    LeaveByDateChannel,
+    MemberTeam,
+    StandupTask,
+    UserStandupReport,
+)
+
+QUERIES = {
+    UserStandupReport: """
+        SELECT
+            '- fixed the report export' || chr(10) || '- reviewed PR #' || i AS content,
+            current_date - (i % 365) AS message_date,
+            now() - make_interval(hours => i) AS timestamp,
+            CASE WHEN i % 3 = 0 THEN now() END AS last_updated_at
+        FROM generate_series(1, $1) AS i
+    """,
+    MemberTeam: """
+        SELECT (100000000000000000 + i)::text AS author_id, 'member ' || i AS server_name
+        FROM generate_series(1, $1) AS i
+    """,
+    LeaveByDateChannel: """
+        SELECT
+            (100000000000000000 + i)::text AS author_id,
+            (ARRAY['annual_leave', 'sick_leave', 'personal_leave', 'birthday_leave'])[i % 4 + 1] AS leave_type,
+            (ARRAY['morning', 'afternoon', NULL])[i % 3 + 1] AS partial_leave,
+            'ลาป่วย ' || i AS content
+        FROM generate_series(1, $1) AS i
+    """,
+    DailyLeaveSummary: """
+        SELECT
+            (100000000000000000 + i)::text AS author_id,
+            (ARRAY['annual_leave', 'sick_leave', 'personal_leave', 'birthday_leave'])[i % 4 + 1] AS leave_type,
+            (ARRAY['morning', 'afternoon', NULL])[i % 3 + 1] AS partial_leave,
+            'team ' || i % 20 AS team_name
+        FROM generate_series(1, $1) AS i
+    """,
+    StandupTask: """
+        SELECT
+            gen_random_uuid() AS id,
+            (200000000000000000 + i / 5)::text AS message_id,
+            (100000000000000000 + i % 300)::text AS author_id,
+            'task ' || i AS task,
+            (ARRAY['todo', 'in_progress', 'done'])[i % 3 + 1] AS status
+        FROM generate_series(1, $1) AS i
+    """,
+}
+
+
+def validated(model, rows):
+    return [model(**dict(row)) for row in rows]
+
+
+def constructed(model, rows):
+    construct = model.model_construct
+    return [construct(**row) for row in rows]
+
+
+def measure(mapper: Callable, model, rows: list, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        mapper(model, rows)
+        best = min(best, time.process_time() - started)
+
+    tracemalloc.start()
+    result = mapper(model, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best * 1000, peak
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", required=True)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        fetched = {
+            model: await conn.fetch(sql, args.rows) for model, sql in QUERIES.items()
+        }
+    finally:
+        await conn.close()
+
+    print(f"CPU ms (best of {args.repeat}) and peak KiB allocated for {args.rows} rows")
+    print(
+        f"{'model':<20} {'validated':>16} {'model_construct':>16}"
+        f" {'map_rows':>16} {'speedup':>8}"
+    )
+    for model, rows in fetched.items():
+        results = [
+            measure(mapper, model, rows, args.repeat)
+            for mapper in (validated, constructed, map_rows)
+        ]
+        cells = " ".join(f"{ms:>7.1f}/{peak / 1024:>8.0f}" for ms, peak in results)
+        print(f"{model.__name__:<20} {cells} {results[0][0] / results[2][0]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""Compare the plans of the old EXTRACT/DATE() filters with their half-open range rewrites.
+
+Usage:
+    python -m benchmarks.sargable_plans --dsn postgresql://localhost/matcha_bench
+
+Run it against a database seeded by benchmarks.repository_timings with
+db/migations/2.sql and 3.sql applied. Only EXPLAIN ANALYZE is executed, nothing is written.
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import date, timedelta, timezone
+
+import asyncpg
+
+from repositories.clockin_repository import GET_CLOCKIN_BY_AUTHOR_AND_DATE
+from repositories.company_repository import (
+    GET_HOLIDAY_DATE_BY_YEAR,
+    GET_HOLIDAYS_BY_YEAR,
+)
+from repositories.leave_repository import GET_FULLDAY_LEAVE_DATE_BY_USERID_AND_YEAR
+from utils.datetime_utils import get_day_bounds
+
+BANGKOK = timezone(timedelta(hours=7))
+
+OLD_FULLDAY_LEAVE_DATE_BY_USERID_AND_YEAR = """
+    SELECT absent_date
+        FROM attendance
+        WHERE  author_id = $1 AND EXTRACT(YEAR FROM absent_date) BETWEEN $2 AND $3
+        GROUP BY author_id, absent_date
+        HAVING
+            COUNT(*) FILTER (WHERE partial_leave IS NULL) > 0
+            OR (
+                COUNT(*) FILTER (WHERE partial_leave = 'morning') > 0
+                AND COUNT(*) FILTER (WHERE partial_leave = 'afternoon') > 0
+            )
+"""
+OLD_HOLIDAYS_BY_YEAR = "SELECT holiday_date, description FROM company_holidays WHERE EXTRACT(YEAR FROM holiday_date) = $1 ORDER BY holiday_date"
+OLD_HOLIDAY_DATE_BY_YEAR = """
+    SELECT holiday_date
+    FROM company_holidays
+    WHERE EXTRACT(YEAR FROM holiday_date) BETWEEN $1 AND $2
+    ORDER BY holiday_date;
+"""
+OLD_CLOCKIN_BY_AUTHOR_AND_DATE = """
+    SELECT id, author_id, clock_in_time
+    FROM clockin_log
+    WHERE author_id = $1 AND DATE(clock_in_time) = $2
+"""
+
+
+def scan_nodes(plan: dict) -> list[str]:
+    nodes = []
+    if "Scan" in plan["Node Type"]:
+        nodes.append(f"{plan['Node Type']} on {plan.get('Relation Name', '?')}"
+                     + (f" using {plan['Index Name']}" if "Index Name" in plan else ""))
+    for child in plan.get("Plans", []):
+        nodes.extend(scan_nodes(child))
+    return nodes
+
+
+async def explain(conn: asyncpg.Connection, sql: str, *args) -> tuple[list[str], float, int]:
+    raw = await conn.fetchval(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}", *args)
+    result = json.loads(raw)[0]
+    plan = result["Plan"]
+    buffers = plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0)
+    return scan_nodes(plan), result["Execution Time"], buffers
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", required=True)
+    args = parser.parse_args()
+
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        author_id, clocked_at = await conn.fetchrow(
+            "SELECT author_id, clock_in_time FROM clockin_log ORDER BY clock_in_time DESC LIMIT 1"
+        )
+        leave_author_id = await conn.fetchval(
+            "SELECT author_id FROM attendance GROUP BY author_id ORDER BY COUNT(*) DESC LIMIT 1"
+        )
+        year = clocked_at.year
+        day = clocked_at.astimezone(BANGKOK).date()
+
+        cases = [
+            (
+                "leave.get_fullday_leave_date_by_userid_and_year",
+                (OLD_FULLDAY_LEAVE_DATE_BY_USERID_AND_YEAR, (leave_author_id, year - 1, year)),
+                (GET_FULLDAY_LEAVE_DATE_BY_USERID_AND_YEAR.sql,
+                 (leave_author_id, date(year - 1, 1, 1), date(year + 1, 1, 1))),
+            ),
+            (
+                "company.get_holidays_by_year",
+                (OLD_HOLIDAYS_BY_YEAR, (year,)),
+                (GET_HOLIDAYS_BY_YEAR.sql, (date(year, 1, 1), date(year + 1, 1, 1))),
+            ),
+            (
+                "company.get_holiday_date_by_year",
+                (OLD_HOLIDAY_DATE_BY_YEAR, (year, year + 1)),
+                (GET_HOLIDAY_DATE_BY_YEAR.sql, (date(year, 1, 1), date(year + 2, 1, 1))),
+            ),
+            (
+                "clockin.get_clockin_by_author_and_date",
+                (OLD_CLOCKIN_BY_AUTHOR_AND_DATE, (author_id, day)),
+                (GET_CLOCKIN_BY_AUTHOR_AND_DATE.sql, (author_id, *get_day_bounds(day))),
+            ),
+        ]
+
+        for name, (old_sql, old_args), (new_sql, new_args) in cases:
+            print(name)
+            for label, sql, sql_args in (("before", old_sql, old_args), ("after", new_sql, new_args)):
+                nodes, elapsed_ms, buffers = await explain(conn, sql, *sql_args)
+                print(f"  {label:<6} {elapsed_ms:>8.3f}ms {buffers:>6} buffers  {'; '.join(nodes)}")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -30,6 +30,14 @@ class GatewayEvents(commands.Cog):
 
         print(f"We have logged in as {self.client.user.name}")
 
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.client.channel_resolver.discard(channel.id)
+
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        self.client.channel_resolver.discard(payload.thread_id)
+
 
 async def setup(client: "CustomBot"):
     await client.add_cog(GatewayEvents(client))
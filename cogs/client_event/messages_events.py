@@ -1,4 +1,6 @@
+import asyncio
 import re
+from collections import deque
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -7,17 +9,53 @@ from discord.ext import commands
 
 from config import IGNORED_BOT_IDS
 from datacache import DataCache
+from db.circuit_breaker import CircuitState, DatabaseUnavailableError
 from models import LeaveInfo
 from utils.datetime_utils import compare_date_with_today, get_date_now
-from utils.message_utils import clear_bot_reactions
 
 if TYPE_CHECKING:
     from core.custom_bot import CustomBot
 
+# Stand-ups and leaves that arrive while the database is unreachable are
+# parked here and replayed through on_message once it recovers.
+DEGRADED_QUEUE_SIZE = 500
+DEGRADED_REACTION = "⏳"
+
 
 class MessagesEvents(commands.Cog):
     def __init__(self, client: "CustomBot"):
         self.client = client
+        self.pending_messages: deque[discord.Message] = deque(maxlen=DEGRADED_QUEUE_SIZE)
+        self._replay_task: asyncio.Task | None = None
+        self.payload_edits = 0
+        self.edit_rest_fallbacks = 0
+        self.unchanged_edits = 0
+        self.client.db.add_state_listener(self._on_database_state)
+
+    def _on_database_state(self, state: CircuitState) -> None:
+        if state == "closed" and self.pending_messages:
+            if self._replay_task is None or self._replay_task.done():
+                self._replay_task = asyncio.create_task(self._replay_pending())
+
+    async def _defer_message(self, message: discord.Message) -> None:
+        if len(self.pending_messages) == self.pending_messages.maxlen:
+            dropped = self.pending_messages[0]
+            print(f"Degraded queue is full, dropping message {dropped.id}")
+        self.pending_messages.append(message)
+        try:
+            await message.add_reaction(DEGRADED_REACTION)
+        except discord.HTTPException as e:
+            print(f"Error marking message {message.id} as pending: {e}")
+
+    async def _replay_pending(self) -> None:
+        print(f"Database is back, replaying {len(self.pending_messages)} pending messages.")
+        while self.pending_messages and self.client.db.is_available:
+            message = self.pending_messages.popleft()
+            try:
+                await message.remove_reaction(DEGRADED_REACTION, self.client.user)
+            except discord.HTTPException:
+                pass
+            await self.on_message(message)
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -26,22 +64,32 @@ class MessagesEvents(commands.Cog):
         ):
             return
 
+        if (
+            message.channel.id in DataCache.STANDUP_CHANNELS
+            or message.channel.id in DataCache.ATTENDANCE_CHANNELS
+        ) and not self.client.db.is_available:
+            await self._defer_message(message)
+            return
+
         if message.channel.id in DataCache.STANDUP_CHANNELS:
             try:
                 time_status = await self.client.standup_service.track_standup(
                     message, check_is_exist=False
                 )
                 if time_status == "today":
-                    await message.add_reaction("✅")
+                    await self.client.reaction_manager.set_status(message, "✅")
                 elif time_status == "future":
-                    await message.add_reaction("☑️")
+                    await self.client.reaction_manager.set_status(message, "☑️")
+            except DatabaseUnavailableError:
+                await self._defer_message(message)
+                return
             except ValueError as e:
                 print(f"ValueError: {e}")
-                await message.add_reaction("❌")
+                await self.client.reaction_manager.set_status(message, "❌")
                 return
             except Exception as e:
                 print(f"Error tracking stand-up message: {e}")
-                await message.add_reaction("❌")
+                await self.client.reaction_manager.set_status(message, "❌")
                 return
 
             if (
@@ -50,7 +98,7 @@ class MessagesEvents(commands.Cog):
                     message.content
                 )
             ):
-                await self.client.office_entry_service.update_daily_office_entry_summary()
+                self.client.office_entry_service.request_daily_office_entry_summary_update()
 
         elif message.channel.id in DataCache.ATTENDANCE_CHANNELS:
             try:
@@ -60,23 +108,26 @@ class MessagesEvents(commands.Cog):
                 await self.client.leave_service.send_leave_confirmation(
                     leave_request, message
                 )
-                await message.add_reaction("😎")
+                await self.client.reaction_manager.set_status(message, "😎")
+            except DatabaseUnavailableError:
+                await self._defer_message(message)
+                return
             except ValueError as e:
                 print(f"ValueError: {e}")
-                await message.add_reaction("❌")
+                await self.client.reaction_manager.set_status(message, "❌")
             except discord.Forbidden as e:
                 print(f"Error tracking leave message Forbidden: {message.id} - {e}")
-                await message.add_reaction("⭕")
+                await self.client.reaction_manager.set_status(message, "⭕")
             except Exception as e:
                 print(f"Error tracking leave message: {e}")
-                await message.add_reaction("❌")
+                await self.client.reaction_manager.set_status(message, "❌")
 
             leave_date = set(leave.absent_date for leave in leave_request)
             current_date = get_date_now()
             if (current_date in DataCache.daily_leave_summary.keys()) and (
                 current_date in leave_date
             ):
-                await self.client.leave_service.update_daily_leave_summary(current_date)
+                self.client.leave_service.request_daily_leave_summary_update(current_date)
 
     # @commands.Cog.listener()
     # async def on_message_delete(self, message: discord.Message):
@@ -142,12 +193,29 @@ class MessagesEvents(commands.Cog):
     #             await clear_bot_reactions(updated_msg, self.client)
     #             await after.add_reaction("❌")
 
+    async def _resolve_edited_message(
+        self, payload: discord.RawMessageUpdateEvent
+    ) -> discord.Message | None:
+        # MESSAGE_UPDATE carries the whole edited message, which discord.py
+        # already builds into payload.message. Only fetch it when the gateway
+        # left out a field the stand-up and leave trackers read.
+        if "content" in payload.data and "author" in payload.data:
+            self.payload_edits += 1
+            return payload.message
+
+        self.edit_rest_fallbacks += 1
+        channel = await self.client.channel_resolver.resolve(payload.channel_id)
+        if not isinstance(
+            channel, (discord.TextChannel, discord.Thread, discord.DMChannel)
+        ):
+            return None
+        return await channel.fetch_message(payload.message_id)
+
     @commands.Cog.listener()
     async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
         if not payload.guild_id:
             return
 
-        message_id = payload.message_id
         channel_id = payload.channel_id
 
         if (
@@ -156,26 +224,26 @@ class MessagesEvents(commands.Cog):
         ):
             return
 
-        channel = await self.client.fetch_channel(channel_id)
-        if not channel:
-            return
-
-        if not isinstance(
-            channel, (discord.TextChannel, discord.Thread, discord.DMChannel)
-        ):
-            return
+        # A payload-built message has complete reactions only when MESSAGE_UPDATE
+        # carried the field; the reaction manager re-fetches otherwise.
+        reactions_known = "reactions" in payload.data
 
         if channel_id in DataCache.STANDUP_CHANNELS:
             try:
-                message = await channel.fetch_message(message_id)
+                message = await self._resolve_edited_message(payload)
                 if not message:
                     return
+                reactions_known = reactions_known or message is not payload.message
 
                 if (
                     message.author.bot and (message.author.id not in IGNORED_BOT_IDS)
                 ) or not message.guild:
                     return
 
+                if await self.client.standup_service.is_standup_unchanged(message):
+                    self.unchanged_edits += 1
+                    return
+
                 pattern = r"\b\d{2}/\d{2}/\d{4}\b"
                 message_content = message.content.strip()
 
@@ -195,42 +263,50 @@ class MessagesEvents(commands.Cog):
                 time_status = compare_date_with_today(message_date)
 
                 if time_status == "past":
-                    await clear_bot_reactions(message, self.client)
-                    await message.add_reaction("😶")
+                    await self.client.reaction_manager.set_status(
+                        message, "😶", reactions_known
+                    )
                     return
 
-                await self.client.standup_service.delete_standup_by_message_id(
-                    message.id
-                )
-                time_status = await self.client.standup_service.track_standup(
-                    message, check_is_exist=False, bypass_check_date=True
+                time_status = await self.client.standup_service.sync_edited_standup(
+                    message
                 )
-                await clear_bot_reactions(message, self.client)
                 if time_status == "today":
-                    await message.add_reaction("✅")
+                    await self.client.reaction_manager.set_status(
+                        message, "✅", reactions_known
+                    )
                 elif time_status == "future":
-                    await message.add_reaction("☑️")
+                    await self.client.reaction_manager.set_status(
+                        message, "☑️", reactions_known
+                    )
             except ValueError as e:
                 print(f"ValueError: {e}")
-                await clear_bot_reactions(message, self.client)
-                await message.add_reaction("❌")
+                await self.client.reaction_manager.set_status(
+                    message, "❌", reactions_known
+                )
             except Exception as e:
                 print(f"Error tracking stand-up message: {e}")
-                await clear_bot_reactions(message, self.client)
-                await message.add_reaction("❌")
+                await self.client.reaction_manager.set_status(
+                    message, "❌", reactions_known
+                )
 
-            await self.client.office_entry_service.update_daily_office_entry_summary()
+            self.client.office_entry_service.request_daily_office_entry_summary_update()
         elif channel_id in DataCache.ATTENDANCE_CHANNELS:
             try:
-                message = await channel.fetch_message(message_id)
+                message = await self._resolve_edited_message(payload)
                 if not message:
                     return
+                reactions_known = reactions_known or message is not payload.message
 
                 if (
                     message.author.bot and (message.author.id not in IGNORED_BOT_IDS)
                 ) or not message.guild:
                     return
 
+                if await self.client.leave_service.is_leave_unchanged(message):
+                    self.unchanged_edits += 1
+                    return
+
                 await self.client.leave_service.delete_leave_by_message_id(message.id)
                 leave_request: list[LeaveInfo] = (
                     await self.client.leave_service.track_leave(message)
@@ -238,21 +314,26 @@ class MessagesEvents(commands.Cog):
                 await self.client.leave_service.send_edit_leave_comfirmation(
                     leave_request, message
                 )
-                await clear_bot_reactions(message, self.client)
-                await message.add_reaction("😎")
+                await self.client.reaction_manager.set_status(
+                    message, "😎", reactions_known
+                )
             except ValueError as e:
                 print(f"ValueError: {e}")
-                await clear_bot_reactions(message, self.client)
-                await message.add_reaction("❌")
+                await self.client.reaction_manager.set_status(
+                    message, "❌", reactions_known
+                )
             except discord.Forbidden as e:
                 print(f"Error tracking leave message Forbidden: {message.id} - {e}")
-                await message.add_reaction("⭕")
+                await self.client.reaction_manager.set_status(
+                    message, "⭕", reactions_known
+                )
             except Exception as e:
                 print(f"Error tracking leave message: {e}")
-                await clear_bot_reactions(message, self.client)
-                await message.add_reaction("❌")
+                await self.client.reaction_manager.set_status(
+                    message, "❌", reactions_known
+                )
 
-            await self.client.leave_service.update_daily_leave_summary()
+            self.client.leave_service.request_daily_leave_summary_update()
 
     @commands.Cog.listener()
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
@@ -261,6 +342,7 @@ class MessagesEvents(commands.Cog):
 
         message_id = payload.message_id
         channel_id = payload.channel_id
+        self.client.reaction_manager.discard(message_id)
 
         if (
             channel_id not in DataCache.STANDUP_CHANNELS
@@ -268,15 +350,6 @@ class MessagesEvents(commands.Cog):
         ):
             return
 
-        channel = await self.client.fetch_channel(channel_id)
-        if not channel:
-            return
-
-        if not isinstance(
-            channel, (discord.TextChannel, discord.Thread, discord.DMChannel)
-        ):
-            return
-
         if channel_id in DataCache.STANDUP_CHANNELS:
             try:
                 await self.client.standup_service.delete_standup_by_message_id(
@@ -285,7 +358,7 @@ class MessagesEvents(commands.Cog):
             except Exception as e:
                 print(f"Error deleting stand-up message: {e}")
 
-            await self.client.office_entry_service.update_daily_office_entry_summary()
+            self.client.office_entry_service.request_daily_office_entry_summary_update()
 
         elif channel_id in DataCache.ATTENDANCE_CHANNELS:
             try:
@@ -293,7 +366,7 @@ class MessagesEvents(commands.Cog):
             except Exception as e:
                 print(f"Error deleting leave message: {e}")
 
-            await self.client.leave_service.update_daily_leave_summary()
+            self.client.leave_service.request_daily_leave_summary_update()
 
 
 async def setup(client: "CustomBot"):
@@ -16,8 +16,8 @@ from utils.datetime_utils import (
     get_date_now,
     get_datetime_now,
     get_datetime_range,
-    get_previous_weekdays,
 )
+from utils.message_utils import edit_if_changed, remember_rendered
 from views.standup_task_update_view import StandupTaskUpdateView
 
 if TYPE_CHECKING:
@@ -63,12 +63,34 @@ class DailySummarySchedulerCog(commands.Cog):
             hour=6,
             minute=0,
         )
+        self.scheduler.add_job(
+            self.create_standup_partitions, trigger="cron", hour=3, minute=0
+        )
+        self.scheduler.add_job(
+            self.refresh_calendar, trigger="cron", hour=0, minute=1
+        )
         self.scheduler.start()
 
+    async def create_standup_partitions(self):
+        try:
+            created = await self.client.standup_service.ensure_standup_partitions()
+            if created:
+                print(f"Created {created} stand-up partitions.")
+        except Exception as e:
+            print(f"Error creating stand-up partitions: {e}")
+
+    async def refresh_calendar(self):
+        # Slides the cached holiday window into the new year; holiday edits
+        # arrive through company_holidays notifications.
+        try:
+            await self.client.calendar_service.refresh()
+        except Exception as e:
+            print(f"Error refreshing company calendar: {e}")
+
     async def send_previous_standup_remarks(self):
         current_date = get_date_now()
 
-        if await self.client.company_service.is_holiday_date(current_date):
+        if not await self.client.calendar_service.is_working_day(current_date):
             return
 
         all_user_in_standup = await self.client.member_service.get_all_standup_members()
@@ -80,10 +102,6 @@ class DailySummarySchedulerCog(commands.Cog):
         this_year = current_date.year
         last_year = (this_year - 1) if (this_year - 1 > 0) else 1
 
-        company_holidays = await self.client.company_service.get_holiday_date_by_year(
-            from_year=last_year, to_year=this_year
-        )
-
         for user in all_user_in_standup:
             if await self.client.leave_service.is_user_on_leave_fullday(
                 user.author_id, current_date
@@ -95,11 +113,9 @@ class DailySummarySchedulerCog(commands.Cog):
             )
 
             try:
-                target_date = get_previous_weekdays(current_date, num_days=2)[-1]
-                while (target_date in company_holidays) or (
-                    target_date in user_leave_dates
-                ):
-                    target_date = get_previous_weekdays(target_date, num_days=2)[-1]
+                target_date = await self.client.calendar_service.previous_working_day(
+                    current_date, skip=user_leave_dates
+                )
 
                 user_standup_tasks = await self.client.standup_service.get_standup_tasks_by_user_and_date(
                     author_id=user.author_id, from_date=target_date, to_date=target_date
@@ -166,7 +182,7 @@ class DailySummarySchedulerCog(commands.Cog):
     async def send_leave(self):
         current_date = get_date_now()
 
-        if await self.client.company_service.is_holiday_date(current_date):
+        if not await self.client.calendar_service.is_working_day(current_date):
             return
 
         leaves = await self.client.leave_service.get_daily_leaves(current_date)
@@ -175,11 +191,14 @@ class DailySummarySchedulerCog(commands.Cog):
         )
         if current_date not in DataCache.daily_leave_summary.keys():
             channel_id = LEAVE_SUMMARY_CHANNEL_ID
-            channel = await self.client.fetch_channel(channel_id)
+            channel = await self.client.channel_resolver.resolve(channel_id)
             if channel and isinstance(channel, discord.TextChannel):
                 try:
                     message = await channel.send(embed=embed)
-                    DataCache.daily_leave_summary = {current_date: message}
+                    remember_rendered(message, embed)
+                    await self.client.summary_message_service.remember(
+                        "leave", current_date, message
+                    )
                 except discord.Forbidden:
                     print(f"Cannot send message to channel {channel_id}: Forbidden")
                 except Exception as e:
@@ -187,17 +206,20 @@ class DailySummarySchedulerCog(commands.Cog):
         else:
             message = DataCache.daily_leave_summary[current_date]
             try:
-                await message.edit(embed=embed)
+                await edit_if_changed(message, embed)
             except discord.NotFound:
                 print(
                     f"Message for date {current_date} not found, sending new message."
                 )
                 channel_id = LEAVE_SUMMARY_CHANNEL_ID
-                channel = await self.client.fetch_channel(channel_id)
+                channel = await self.client.channel_resolver.resolve(channel_id)
                 if channel and isinstance(channel, discord.TextChannel):
                     try:
                         message = await channel.send(embed=embed)
-                        DataCache.daily_leave_summary[current_date] = message
+                        remember_rendered(message, embed)
+                        await self.client.summary_message_service.remember(
+                            "leave", current_date, message
+                        )
                     except discord.Forbidden:
                         print(f"Cannot send message to channel {channel_id}: Forbidden")
                     except Exception as e:
@@ -208,7 +230,7 @@ class DailySummarySchedulerCog(commands.Cog):
     async def send_standup(self):
         date = get_date_now()
 
-        if await self.client.company_service.is_holiday_date(date):
+        if not await self.client.calendar_service.is_working_day(date):
             return
 
         # from_datetime, to_datetime = get_datetime_range(date)
@@ -218,7 +240,7 @@ class DailySummarySchedulerCog(commands.Cog):
         DELEY_SECONDS = 2
 
         async def process_channel(channel_id):
-            channel = await self.client.fetch_channel(channel_id)
+            channel = await self.client.channel_resolver.resolve(channel_id)
             if channel and isinstance(channel, discord.TextChannel):
                 try:
                     userid_wrote_standup = await self.client.standup_service.get_userid_wrote_standup_by_date(
@@ -255,7 +277,7 @@ class DailySummarySchedulerCog(commands.Cog):
     async def clear_inactive_standup_members(self):
         date = get_date_now()
 
-        if await self.client.company_service.is_holiday_date(date):
+        if not await self.client.calendar_service.is_working_day(date):
             return
 
         num_days = 5
@@ -292,7 +314,7 @@ class DailySummarySchedulerCog(commands.Cog):
     async def send_office_entry(self):
         date = get_date_now()
 
-        if await self.client.company_service.is_holiday_date(date):
+        if not await self.client.calendar_service.is_working_day(date):
             return
 
         entries = await self.client.office_entry_service.get_daily_office_entries(date)
@@ -301,11 +323,14 @@ class DailySummarySchedulerCog(commands.Cog):
         )
         if date not in DataCache.daily_office_entry_summary:
             channel_id = OFFICE_ENTRY_SUMMARY_CHANNEL_ID
-            channel = await self.client.fetch_channel(channel_id)
+            channel = await self.client.channel_resolver.resolve(channel_id)
             if channel and isinstance(channel, discord.TextChannel):
                 try:
                     message = await channel.send(embed=embed)
-                    DataCache.daily_office_entry_summary = {date: message}
+                    remember_rendered(message, embed)
+                    await self.client.summary_message_service.remember(
+                        "office_entry", date, message
+                    )
                 except discord.Forbidden:
                     print(f"Cannot send message to channel {channel_id}: Forbidden")
                 except Exception as e:
@@ -315,15 +340,18 @@ class DailySummarySchedulerCog(commands.Cog):
         else:
             message = DataCache.daily_office_entry_summary[date]
             try:
-                await message.edit(embed=embed)
+                await edit_if_changed(message, embed)
             except discord.NotFound:
                 print(f"Message for date {date} not found, sending new message.")
                 channel_id = OFFICE_ENTRY_SUMMARY_CHANNEL_ID
-                channel = await self.client.fetch_channel(channel_id)
+                channel = await self.client.channel_resolver.resolve(channel_id)
                 if channel and isinstance(channel, discord.TextChannel):
                     try:
                         message = await channel.send(embed=embed)
-                        DataCache.daily_office_entry_summary[date] = message
+                        remember_rendered(message, embed)
+                        await self.client.summary_message_service.remember(
+                            "office_entry", date, message
+                        )
                     except discord.Forbidden:
                         print(f"Cannot send message to channel {channel_id}: Forbidden")
                     except Exception as e:
@@ -0,0 +1,104 @@
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import discord
+from discord.ext import commands
+
+from config import IGNORED_BOT_IDS
+from datacache import DataCache
+from utils.datetime_utils import is_valid_date_format
+from utils.decorators import is_admin
+
+if TYPE_CHECKING:
+    from core.custom_bot import CustomBot
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+class Backfill(commands.Cog):
+    def __init__(self, client: "CustomBot"):
+        self.client = client
+
+    @commands.command(name="backfill_standups")
+    @is_admin()
+    async def backfill_standups(
+        self, ctx: commands.Context, channel: discord.TextChannel, from_date: str
+    ):
+        if channel.id not in DataCache.STANDUP_CHANNELS:
+            await ctx.reply("ช่องนี้ไม่ใช่ช่อง Stand-Up")
+            return
+        if not is_valid_date_format(from_date):
+            await ctx.reply("Usage: `!backfill_standups #channel YYYY-MM-DD`")
+            return
+
+        after = datetime.strptime(from_date, "%Y-%m-%d")
+        started = time.perf_counter()
+        totals = [0, 0, 0, 0]
+        batch: list[discord.Message] = []
+
+        async def flush():
+            written = await self.client.standup_service.bulk_track_standups(batch)
+            for i, count in enumerate(written):
+                totals[i] += count
+            batch.clear()
+
+        async for message in channel.history(limit=None, after=after, oldest_first=True):
+            if message.author.bot and message.author.id not in IGNORED_BOT_IDS:
+                continue
+            batch.append(message)
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                await flush()
+        if batch:
+            await flush()
+
+        messages_written, tasks_written, office_entries_written, skipped = totals
+        await ctx.reply(
+            f"Backfilled {messages_written} stand-ups ({tasks_written} tasks,"
+            f" {office_entries_written} office entries) from {channel.mention}"
+            f" in {time.perf_counter() - started:.1f}s. Skipped {skipped} messages"
+            " that are not valid stand-ups."
+        )
+
+    @commands.command(name="backfill_leaves")
+    @is_admin()
+    async def backfill_leaves(
+        self, ctx: commands.Context, channel: discord.TextChannel, from_date: str
+    ):
+        if channel.id not in DataCache.ATTENDANCE_CHANNELS:
+            await ctx.reply("ช่องนี้ไม่ใช่ช่องแจ้งลา")
+            return
+        if not is_valid_date_format(from_date):
+            await ctx.reply("Usage: `!backfill_leaves #channel YYYY-MM-DD`")
+            return
+
+        after = datetime.strptime(from_date, "%Y-%m-%d")
+        started = time.perf_counter()
+        totals = [0, 0, 0]
+        batch: list[discord.Message] = []
+
+        async def flush():
+            written = await self.client.leave_service.bulk_track_leaves(batch)
+            for i, count in enumerate(written):
+                totals[i] += count
+            batch.clear()
+
+        async for message in channel.history(limit=None, after=after, oldest_first=True):
+            if message.author.bot and message.author.id not in IGNORED_BOT_IDS:
+                continue
+            batch.append(message)
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                await flush()
+        if batch:
+            await flush()
+
+        leaves_written, already_tracked, skipped = totals
+        await ctx.reply(
+            f"Backfilled {leaves_written} leaves from {channel.mention}"
+            f" in {time.perf_counter() - started:.1f}s. {already_tracked} messages"
+            f" were already tracked and {skipped} could not be analyzed."
+        )
+
+
+async def setup(client: "CustomBot"):
+    await client.add_cog(Backfill(client))
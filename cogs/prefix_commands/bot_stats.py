@@ -0,0 +1,39 @@
+from typing import TYPE_CHECKING
+
+from discord.ext import commands
+
+from utils.decorators import is_admin
+from utils.message_utils import rendered_messages
+
+if TYPE_CHECKING:
+    from core.custom_bot import CustomBot
+
+
+class BotStats(commands.Cog):
+    def __init__(self, client: "CustomBot"):
+        self.client = client
+
+    @commands.command(name="botstats")
+    @is_admin()
+    async def botstats(self, ctx: commands.Context):
+        report = "\n".join(
+            [
+                self.client.channel_resolver.format_status(),
+                self.client.reaction_manager.format_status(),
+                self.client.leave_service.summary_refresher.format_status(),
+                self.client.office_entry_service.summary_refresher.format_status(),
+                rendered_messages.format_status(),
+            ]
+        )
+        messages_events = self.client.get_cog("MessagesEvents")
+        if messages_events:
+            report += (
+                f"\nEdits: from_payload={messages_events.payload_edits}"
+                f" rest_fallbacks={messages_events.edit_rest_fallbacks}"
+                f" unchanged_skipped={messages_events.unchanged_edits}"
+            )
+        await ctx.reply(f"```\n{report}\n```")
+
+
+async def setup(client: "CustomBot"):
+    await client.add_cog(BotStats(client))
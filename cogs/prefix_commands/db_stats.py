@@ -0,0 +1,58 @@
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+import discord
+from discord.ext import commands
+
+from datacache import DataCache
+from utils.decorators import is_admin
+
+if TYPE_CHECKING:
+    from core.custom_bot import CustomBot
+
+
+class DbStats(commands.Cog):
+    def __init__(self, client: "CustomBot"):
+        self.client = client
+
+    @commands.command(name="dbstats")
+    @is_admin()
+    async def dbstats(
+        self, ctx: commands.Context, option: str = "total", limit: int = 10
+    ):
+        if option == "reset":
+            self.client.db.stats.reset()
+            await ctx.reply("Query statistics have been reset.")
+            return
+
+        try:
+            report = (
+                self.client.db.format_pool_metrics()
+                + "\n"
+                + self.client.change_listener.format_status()
+                + "\n"
+                + DataCache.member_roster.format_status()
+                + "\n"
+                + self.client.calendar_service.format_status()
+                + "\n"
+                + self.client.db.stats.format_report(limit=limit, order_by=option)
+            )
+        except ValueError:
+            await ctx.reply(
+                "Usage: `!dbstats [total|avg|max|calls] [limit]` or `!dbstats reset`"
+            )
+            return
+
+        if len(report) > 1900:
+            await ctx.reply(
+                "Query statistics:",
+                file=discord.File(
+                    BytesIO(report.encode("utf-8")), filename="dbstats.txt"
+                ),
+            )
+        else:
+            await ctx.reply(f"```\n{report}\n```")
+
+
+async def setup(client: "CustomBot"):
+    await client.add_cog(DbStats(client))
@@ -62,15 +62,19 @@ class CheckStandup(commands.Cog):
                 )
             )
 
-            holiday_days = await self.client.company_service.get_holiday_days(
-                from_date=from_date, to_date=to_date
-            )
+            calendar = self.client.calendar_service
+            if await calendar.ensure_covers(from_date, to_date):
+                month_weekdeys = calendar.working_days_in(from_date, to_date)
+            else:
+                holiday_days = await self.client.company_service.get_holiday_days(
+                    from_date=from_date, to_date=to_date
+                )
 
-            month_weekdeys = get_weekdays_in_month(month)
+                month_weekdeys = get_weekdays_in_month(month)
 
-            month_weekdeys = [
-                day for day in month_weekdeys if day not in holiday_days
-            ]
+                month_weekdeys = [
+                    day for day in month_weekdeys if day not in holiday_days
+                ]
 
             embed = await self.client.standup_service.get_monthly_standup_embed(
                 user_standup_data=user_standup_data,
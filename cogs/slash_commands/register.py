@@ -46,7 +46,7 @@ class Register(commands.Cog):
             server_name=interaction.guild.name,
             timestamp=interaction.created_at,
         )
-        DataCache.STANDUP_CHANNELS.append(interaction.channel.id)
+        DataCache.add_standup_channel(interaction.channel.id)
         await interaction.edit_original_response(
             content="ช่องนี้ได้ลงทะเบียนเป็นช่อง Stand-Up เรียบร้อยแล้ว"
         )
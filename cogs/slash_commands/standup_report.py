@@ -113,18 +113,17 @@ class StandupReport(commands.Cog):
                 target_user_id = target_user.author_id
                 target_user_name = target_user.server_name
 
-                user_standups = (
-                    await self.client.standup_service.get_standups_by_user_and_date(
+                report_buffer = await self.client.standup_report_generator.generate_report_from_stream(
+                    make_name_safe(target_user_name),
+                    month,
+                    self.client.standup_service.iter_standups_by_user_and_date(
                         int(target_user_id), from_date, to_date
-                    )
+                    ),
                 )
 
-                if not user_standups:
+                if report_buffer is None:
                     continue
 
-                report_buffer = self.client.standup_report_generator.generate_report(
-                    make_name_safe(target_user_name), month, user_standups
-                )
                 report_filename = f"standup_{make_name_safe(target_user_name)}_{target_user_id}_{month}.xlsx"
                 all_attachments.append((report_filename, report_buffer))
                 reports_generated += 1
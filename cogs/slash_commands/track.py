@@ -6,7 +6,6 @@ from discord.ext import commands
 
 from datacache import DataCache
 from utils.decorators import is_admin
-from utils.message_utils import clear_bot_reactions
 
 if TYPE_CHECKING:
     from core.custom_bot import CustomBot
@@ -50,11 +49,10 @@ class Track(commands.Cog):
             time_status = await self.client.standup_service.track_standup(
                 message, bypass_check_date=True
             )
-            await clear_bot_reactions(message, self.client)
             if time_status == "today":
-                await message.add_reaction("✅")
+                await self.client.reaction_manager.set_status(message, "✅")
             elif time_status == "future":
-                await message.add_reaction("☑️")
+                await self.client.reaction_manager.set_status(message, "☑️")
             await interaction.edit_original_response(
                 content="ติดตาม Stand-Up Message เรียบร้อยแล้ว"
             )
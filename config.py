@@ -6,6 +6,26 @@ load_dotenv(override=True)
 
 BOT_TOKEN = os.getenv("BOT_TOKEN", "")
 DATABASE_URL = os.getenv("DATABASE_URL", "")
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL", "")
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "10"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_POOL_WARMUP_SIZE = int(os.getenv("DB_POOL_WARMUP_SIZE", "0")) or None
+DB_POOL_MAX_INACTIVE_LIFETIME = float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", "0"))
+DB_POOL_ACQUIRE_TIMEOUT = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", "0")) or None
+DB_COMMAND_TIMEOUT = float(os.getenv("DB_COMMAND_TIMEOUT", "0")) or None
+DB_HEALTH_CHECK_INTERVAL = float(os.getenv("DB_HEALTH_CHECK_INTERVAL", "30"))
+DB_REPLICA_POOL_MIN_SIZE = int(os.getenv("DB_REPLICA_POOL_MIN_SIZE", "1"))
+DB_REPLICA_POOL_MAX_SIZE = int(os.getenv("DB_REPLICA_POOL_MAX_SIZE", "5"))
+DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "30"))
+DB_CURSOR_PREFETCH = int(os.getenv("DB_CURSOR_PREFETCH", "500"))
+DB_BREAKER_FAILURE_THRESHOLD = int(os.getenv("DB_BREAKER_FAILURE_THRESHOLD", "3"))
+DB_BREAKER_RESET_TIMEOUT = float(os.getenv("DB_BREAKER_RESET_TIMEOUT", "2"))
+DB_BREAKER_MAX_RESET_TIMEOUT = float(os.getenv("DB_BREAKER_MAX_RESET_TIMEOUT", "60"))
+SUMMARY_REFRESH_DELAY_SECONDS = float(os.getenv("SUMMARY_REFRESH_DELAY_SECONDS", "3"))
+SUMMARY_MIN_EDIT_INTERVAL_SECONDS = float(os.getenv("SUMMARY_MIN_EDIT_INTERVAL_SECONDS", "5"))
+ROLE_CACHE_TTL_SECONDS = float(os.getenv("ROLE_CACHE_TTL_SECONDS", "60"))
+STANDUP_PARTITION_MONTHS_AHEAD = int(os.getenv("STANDUP_PARTITION_MONTHS_AHEAD", "3"))
 ATTENDANCE_TRAINEE_CHANNEL_ID = int(os.getenv("ATTENDANCE_TRAINEE_CHANNEL_ID", ""))
 ATTENDANCE_EMPLOYEE_CHANNEL_ID = int(os.getenv("ATTENDANCE_EMPLOYEE_CHANNEL_ID", ""))
 OFFICE_ENTRY_SUMMARY_CHANNEL_ID = int(os.getenv("OFFICE_ENTRY_SUMMARY_CHANNEL_ID", ""))
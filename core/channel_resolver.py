@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Union
+
+import discord
+
+if TYPE_CHECKING:
+    from discord.ext import commands
+
+Channel = Union[discord.abc.GuildChannel, discord.Thread, discord.abc.PrivateChannel]
+
+
+class ChannelResolver:
+    """Drop-in for ``client.fetch_channel`` that avoids the REST call when it can.
+
+    Looks in the gateway cache (``get_channel``) first, then in a small LRU of
+    channels fetched earlier (threads and channels the gateway has not sent us),
+    and only then fetches over REST. Raises what ``fetch_channel`` raises.
+    """
+
+    def __init__(self, client: "commands.Bot", max_size: int = 256):
+        self.client = client
+        self.max_size = max_size
+        self._fetched: OrderedDict[int, Channel] = OrderedDict()
+        self.gateway_hits = 0
+        self.lru_hits = 0
+        self.misses = 0
+
+    async def resolve(self, channel_id: int) -> Channel:
+        channel_id = int(channel_id)
+        channel = self.client.get_channel(channel_id)
+        if channel is not None:
+            self.gateway_hits += 1
+            return channel
+
+        channel = self._fetched.get(channel_id)
+        if channel is not None:
+            self._fetched.move_to_end(channel_id)
+            self.lru_hits += 1
+            return channel
+
+        self.misses += 1
+        channel = await self.client.fetch_channel(channel_id)
+        self._fetched[channel_id] = channel
+        if len(self._fetched) > self.max_size:
+            self._fetched.popitem(last=False)
+        return channel
+
+    def discard(self, channel_id: int) -> None:
+        self._fetched.pop(int(channel_id), None)
+
+    def format_status(self) -> str:
+        total = self.gateway_hits + self.lru_hits + self.misses
+        hit_rate = (self.gateway_hits + self.lru_hits) / total * 100 if total else 0.0
+        return (
+            f"Channels: gateway_hits={self.gateway_hits} lru_hits={self.lru_hits}"
+            f" rest_fetches={self.misses} hit_rate={hit_rate:.1f}%"
+            f" lru={len(self._fetched)}/{self.max_size}"
+        )
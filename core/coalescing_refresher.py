@@ -0,0 +1,62 @@
+import asyncio
+import time
+from datetime import date
+from typing import Awaitable, Callable
+
+
+class CoalescingRefresher:
+    """Merges bursts of refresh requests for a live summary into few refreshes.
+
+    ``request(date)`` only marks that date dirty. A single worker task waits
+    ``delay`` seconds so a burst of requests collapses into one run, never
+    starts a run sooner than ``min_interval`` after the previous one (Discord
+    rate-limits edits to the same message), and keeps going while new
+    requests arrive during a run. Refreshes therefore never overlap.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        refresh: Callable[[date], Awaitable[None]],
+        delay: float = 3.0,
+        min_interval: float = 5.0,
+    ):
+        self.name = name
+        self.refresh = refresh
+        self.delay = delay
+        self.min_interval = min_interval
+
+        self.requested = 0
+        self.runs = 0
+        self.failures = 0
+        self._dirty: set[date] = set()
+        self._last_run = 0.0
+        self._task: asyncio.Task | None = None
+
+    def request(self, target_date: date) -> None:
+        self.requested += 1
+        self._dirty.add(target_date)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._dirty:
+            wait = max(self.delay, self._last_run + self.min_interval - time.monotonic())
+            await asyncio.sleep(wait)
+
+            dates, self._dirty = self._dirty, set()
+            self._last_run = time.monotonic()
+            for target_date in sorted(dates):
+                self.runs += 1
+                try:
+                    await self.refresh(target_date)
+                except Exception as e:
+                    self.failures += 1
+                    print(f"Error refreshing {self.name} for {target_date}: {e}")
+
+    def format_status(self) -> str:
+        return (
+            f"{self.name}: requested={self.requested} runs={self.runs}"
+            f" coalesced={self.requested - self.runs} failures={self.failures}"
+            f" pending={len(self._dirty)}"
+        )
@@ -1,14 +1,33 @@
 from discord.ext import commands
 
 from config import (
+    DATABASE_REPLICA_URL,
     DATABASE_URL,
+    DB_BREAKER_FAILURE_THRESHOLD,
+    DB_BREAKER_MAX_RESET_TIMEOUT,
+    DB_BREAKER_RESET_TIMEOUT,
+    DB_COMMAND_TIMEOUT,
+    DB_CURSOR_PREFETCH,
+    DB_HEALTH_CHECK_INTERVAL,
+    DB_POOL_ACQUIRE_TIMEOUT,
+    DB_POOL_MAX_INACTIVE_LIFETIME,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
+    DB_POOL_WARMUP_SIZE,
+    DB_REPLICA_MAX_LAG_SECONDS,
+    DB_REPLICA_POOL_MAX_SIZE,
+    DB_REPLICA_POOL_MIN_SIZE,
     GEMINI_API_KEY,
+    SLOW_QUERY_THRESHOLD_MS,
     SMTP_PASSWORD,
     SMTP_PORT,
     SMTP_SERVER,
     SMTP_USERNAME,
 )
+from core.channel_resolver import ChannelResolver
+from core.reaction_manager import ReactionManager
 from db.asyncpg_client import AsyncpgClient
+from db.change_listener import ChangeListener
 from repositories.bot_panel_repository import BotPanelRepository
 from repositories.clockin_repository import ClockinRepository
 from repositories.company_repository import CompanyRepository
@@ -16,8 +35,10 @@ from repositories.leave_repository import LeaveRepository
 from repositories.member_repository import MemberRepository
 from repositories.office_entry_repository import OfficeEntryRepository
 from repositories.standup_repository import StandupRepository
+from repositories.summary_message_repository import SummaryMessageRepository
 from repositories.voice_attendance_repository import VoiceAttendanceRepository
 from services.bot_panel_service import BotPanelService
+from services.calendar_service import CalendarService
 from services.clockin_service import ClockinService
 from services.company_service import CompanyService
 from services.email_service import EmailService
@@ -27,13 +48,35 @@ from services.member_service import MemberService
 from services.office_entry_service import OfficeEntryService
 from services.standup_report_generator import StandupReportGenerator
 from services.standup_service import StandupService
+from services.summary_message_service import SummaryMessageService
 from services.voice_attendance_service import VoiceAttendanceService
 
 
 class CustomBot(commands.Bot):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.db = AsyncpgClient(dsn=DATABASE_URL)
+        self.channel_resolver = ChannelResolver(self)
+        self.reaction_manager = ReactionManager(self)
+        self.db = AsyncpgClient(
+            dsn=DATABASE_URL,
+            slow_query_threshold_ms=SLOW_QUERY_THRESHOLD_MS,
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            max_inactive_connection_lifetime=DB_POOL_MAX_INACTIVE_LIFETIME,
+            command_timeout=DB_COMMAND_TIMEOUT,
+            acquire_timeout=DB_POOL_ACQUIRE_TIMEOUT,
+            warmup_size=DB_POOL_WARMUP_SIZE,
+            health_check_interval=DB_HEALTH_CHECK_INTERVAL,
+            replica_dsn=DATABASE_REPLICA_URL,
+            replica_min_size=DB_REPLICA_POOL_MIN_SIZE,
+            replica_max_size=DB_REPLICA_POOL_MAX_SIZE,
+            replica_max_lag_seconds=DB_REPLICA_MAX_LAG_SECONDS,
+            cursor_prefetch=DB_CURSOR_PREFETCH,
+            breaker_failure_threshold=DB_BREAKER_FAILURE_THRESHOLD,
+            breaker_reset_timeout=DB_BREAKER_RESET_TIMEOUT,
+            breaker_max_reset_timeout=DB_BREAKER_MAX_RESET_TIMEOUT,
+        )
+        self.change_listener = ChangeListener(DATABASE_URL)
         self.member_repository = MemberRepository(self.db)
         self.member_service = MemberService(self.member_repository, self)
         self.leave_repository = LeaveRepository(self.db)
@@ -45,12 +88,16 @@ class CustomBot(commands.Bot):
         self.leave_service = LeaveService(
             self.leave_repository, self.gemini_service, self
         )
+        self.company_repository = CompanyRepository(self.db)
+        self.company_service = CompanyService(self.company_repository, self)
+        self.calendar_service = CalendarService(self.company_repository)
         self.standup_repository = StandupRepository(self.db)
         self.standup_service = StandupService(
             self.standup_repository,
             self.member_service,
             self.leave_service,
             self.office_entry_service,
+            self.calendar_service,
         )
         self.standup_report_generator = StandupReportGenerator()
         self.email_service = EmailService(
@@ -59,8 +106,6 @@ class CustomBot(commands.Bot):
             smtp_username=SMTP_USERNAME,
             smtp_password=SMTP_PASSWORD,
         )
-        self.company_repository = CompanyRepository(self.db)
-        self.company_service = CompanyService(self.company_repository, self)
         self.voice_attendance_repository = VoiceAttendanceRepository(self.db)
         self.voice_attendance_service = VoiceAttendanceService(
             self.voice_attendance_repository, self
@@ -69,10 +114,15 @@ class CustomBot(commands.Bot):
         self.bot_panel_service = BotPanelService(self.bot_panel_repository, self)
         self.clockin_repository = ClockinRepository(self.db)
         self.clockin_service = ClockinService(self.clockin_repository, self)
+        self.summary_message_repository = SummaryMessageRepository(self.db)
+        self.summary_message_service = SummaryMessageService(
+            self.summary_message_repository, self
+        )
 
     async def close(self):
         print("Closing the bot and cleaning up resources.")
         await self.bot_panel_service.refresh_bot_panel(botAlive=False)
+        await self.change_listener.stop()
         if self.db.pool:
             await self.db.close()
         await super().close()
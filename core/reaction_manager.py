@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from discord.ext import commands
+
+# Reactions the bot uses to report how it handled a stand-up or leave message.
+# A tracked message carries at most one of them.
+STATUS_REACTIONS = ("✅", "☑️", "❌", "😎", "⭕", "😶")
+
+
+class ReactionManager:
+    """Keeps one status reaction per message without listing reaction users.
+
+    Remembers, in a small LRU, which status emoji the bot last put on each
+    message. For a message it has not seen (e.g. after a restart) the current
+    status is read from ``reaction.me`` on the message itself. Switching status
+    then costs at most one remove and one add, and nothing when it is unchanged.
+    """
+
+    def __init__(self, client: "commands.Bot", max_size: int = 2048):
+        self.client = client
+        self.max_size = max_size
+        self._applied: OrderedDict[int, str] = OrderedDict()
+        self.adds = 0
+        self.removes = 0
+        self.unchanged = 0
+        self.fetches = 0
+
+    async def _current(
+        self, message: discord.Message, emoji: str, reactions_known: bool
+    ) -> list[str]:
+        applied = self._applied.get(message.id)
+        if applied is not None:
+            self._applied.move_to_end(message.id)
+            return [applied]
+        if not reactions_known:
+            # Built from a payload that may have left reactions out: an empty
+            # list would add the new status next to the old one.
+            try:
+                message = await message.channel.fetch_message(message.id)
+                self.fetches += 1
+            except discord.HTTPException:
+                return [status for status in STATUS_REACTIONS if status != emoji]
+        return [
+            str(reaction.emoji)
+            for reaction in message.reactions
+            if reaction.me and str(reaction.emoji) in STATUS_REACTIONS
+        ]
+
+    async def set_status(
+        self, message: discord.Message, emoji: str, reactions_known: bool = True
+    ) -> None:
+        """Make ``emoji`` the message's only status reaction.
+
+        Pass ``reactions_known=False`` when ``message.reactions`` may be
+        incomplete (e.g. built from a MESSAGE_UPDATE payload); an untracked
+        message is then re-fetched once to read the bot's reactions.
+        """
+        current = await self._current(message, emoji, reactions_known)
+        if current == [emoji]:
+            self.unchanged += 1
+            self._remember(message.id, emoji)
+            return
+
+        for old in current:
+            if old == emoji:
+                continue
+            try:
+                await message.remove_reaction(old, self.client.user)  # type: ignore
+                self.removes += 1
+            except discord.HTTPException:
+                pass
+
+        # The status is forgotten until the add succeeds, so a failed add is
+        # re-read from the message next time instead of trusted.
+        self._applied.pop(message.id, None)
+        if emoji not in current:
+            await message.add_reaction(emoji)
+            self.adds += 1
+        self._remember(message.id, emoji)
+
+    def _remember(self, message_id: int, emoji: str) -> None:
+        self._applied[message_id] = emoji
+        self._applied.move_to_end(message_id)
+        if len(self._applied) > self.max_size:
+            self._applied.popitem(last=False)
+
+    def discard(self, message_id: int) -> None:
+        self._applied.pop(int(message_id), None)
+
+    def format_status(self) -> str:
+        return (
+            f"Reactions: adds={self.adds} removes={self.removes}"
+            f" unchanged={self.unchanged} fetches={self.fetches} tracked={len(self._applied)}/{self.max_size}"
+        )
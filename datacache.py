@@ -1,14 +1,94 @@
 import copy
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from config import ATTENDANCE_EMPLOYEE_CHANNEL_ID, ATTENDANCE_TRAINEE_CHANNEL_ID
 
 if TYPE_CHECKING:
-    from discord import Message
+    from discord import Message, PartialMessage
 
     from core.custom_bot import CustomBot
     from datetime import date
+    from db.change_listener import TableChange
+
+
+class MemberRoster:
+    """member_team held in memory: channel -> {member: server_name} and member -> channels.
+
+    Ids are strings, as stored in member_team. Until ``load`` succeeds,
+    ``loaded`` is False and callers should read from the database instead.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._by_channel: dict[str, dict[str, str]] = {}
+        self._by_member: dict[str, set[str]] = {}
+
+    def load(self, rows: list[dict]) -> None:
+        self._by_channel = {}
+        self._by_member = {}
+        for row in rows:
+            self.add(row["channel_id"], row["author_id"], row["server_name"])
+        self.loaded = True
+
+    def add(self, channel_id: str, author_id: str, server_name: str) -> None:
+        self._by_channel.setdefault(channel_id, {})[author_id] = server_name
+        self._by_member.setdefault(author_id, set()).add(channel_id)
+
+    def remove(self, channel_id: str, author_id: str) -> None:
+        members = self._by_channel.get(channel_id)
+        if members is not None:
+            members.pop(author_id, None)
+            if not members:
+                del self._by_channel[channel_id]
+        channels = self._by_member.get(author_id)
+        if channels is not None:
+            channels.discard(channel_id)
+            if not channels:
+                del self._by_member[author_id]
+
+    def remove_member(self, author_id: str) -> None:
+        for channel_id in list(self._by_member.get(author_id, ())):
+            self.remove(channel_id, author_id)
+
+    def rename_member(self, author_id: str, server_name: str) -> None:
+        for channel_id in self._by_member.get(author_id, ()):
+            self._by_channel[channel_id][author_id] = server_name
+
+    def members_of(self, channel_id: str) -> list[tuple[str, str]]:
+        """(author_id, server_name) pairs of a channel, ordered by server_name."""
+        return sorted(
+            self._by_channel.get(channel_id, {}).items(), key=lambda m: m[1]
+        )
+
+    def all_memberships(self) -> list[tuple[str, str]]:
+        """(author_id, server_name) per member_team row, like ``SELECT ... FROM member_team``."""
+        return [
+            (author_id, server_name)
+            for members in self._by_channel.values()
+            for author_id, server_name in members.items()
+        ]
+
+    def channels_of(self, author_id: str) -> set[str]:
+        return set(self._by_member.get(author_id, ()))
+
+    def is_member(self, channel_id: str, author_id: str) -> bool:
+        return author_id in self._by_channel.get(channel_id, {})
+
+    def exists(self, author_id: str) -> bool:
+        return author_id in self._by_member
+
+    def apply_change(self, old: Optional[dict], new: Optional[dict]) -> None:
+        if old:
+            self.remove(old["channel_id"], old["author_id"])
+        if new:
+            self.add(new["channel_id"], new["author_id"], new["server_name"])
+
+    def format_status(self) -> str:
+        return (
+            f"Roster: {'loaded' if self.loaded else 'not loaded'}"
+            f" channels={len(self._by_channel)} members={len(self._by_member)}"
+        )
 
 
 class DataCache:
@@ -17,12 +97,52 @@ class DataCache:
         ATTENDANCE_EMPLOYEE_CHANNEL_ID,
     ]
     STANDUP_CHANNELS: list[int] = []
-    daily_leave_summary: dict["date", "Message"] = {}
-    daily_office_entry_summary: dict["date", "Message"] = {}
+    # Values are PartialMessages when rehydrated from daily_summary_message at startup.
+    daily_leave_summary: dict["date", "Message | PartialMessage"] = {}
+    daily_office_entry_summary: dict["date", "Message | PartialMessage"] = {}
+    member_roster = MemberRoster()
 
     @classmethod
     async def initialize(cls, client: "CustomBot"):
+        async def on_team_change(change: "TableChange"):
+            await cls._apply_team_change(client, change)
+
+        async def on_member_team_change(change: "TableChange"):
+            await cls._apply_member_team_change(client, change)
+
+        async def on_company_holidays_change(change: "TableChange"):
+            await cls._load_calendar(client)
+
+        client.change_listener.subscribe("team", on_team_change)
+        client.change_listener.subscribe("member_team", on_member_team_change)
+        client.change_listener.subscribe("company_holidays", on_company_holidays_change)
         await cls._load_standup_channels(client)
+        await cls._load_member_roster(client)
+        await cls._load_calendar(client)
+        await cls._load_summary_messages(client)
+
+    @classmethod
+    def add_standup_channel(cls, channel_id: int):
+        if channel_id not in cls.STANDUP_CHANNELS:
+            cls.STANDUP_CHANNELS.append(channel_id)
+
+    @classmethod
+    def remove_standup_channel(cls, channel_id: int):
+        if channel_id in cls.STANDUP_CHANNELS:
+            cls.STANDUP_CHANNELS.remove(channel_id)
+
+    @classmethod
+    async def _apply_team_change(cls, client: "CustomBot", change: "TableChange"):
+        if change.is_full_reload:
+            await cls._load_standup_channels(client)
+            return
+
+        if change.old and (
+            not change.new or change.old["channel_id"] != change.new["channel_id"]
+        ):
+            cls.remove_standup_channel(int(change.old["channel_id"]))
+        if change.new:
+            cls.add_standup_channel(int(change.new["channel_id"]))
 
     @classmethod
     async def _load_standup_channels(cls, client: "CustomBot"):
@@ -34,3 +154,42 @@ class DataCache:
         except Exception as e:
             print(f"Error loading standup channels: {e}")
             return
+
+    @classmethod
+    async def _apply_member_team_change(
+        cls, client: "CustomBot", change: "TableChange"
+    ):
+        if change.is_full_reload:
+            client.member_service.invalidate_role()
+            await cls._load_member_roster(client)
+            return
+
+        cls.member_roster.apply_change(change.old, change.new)
+        for row in (change.old, change.new):
+            if row:
+                client.member_service.invalidate_role(row["author_id"])
+
+    @classmethod
+    async def _load_member_roster(cls, client: "CustomBot"):
+        try:
+            rows = await client.member_repository.get_member_roster()
+            cls.member_roster.load(rows)
+        except Exception as e:
+            print(f"Error loading member roster: {e}")
+            return
+
+    @classmethod
+    async def _load_calendar(cls, client: "CustomBot"):
+        try:
+            await client.calendar_service.refresh()
+        except Exception as e:
+            print(f"Error loading company calendar: {e}")
+            return
+
+    @classmethod
+    async def _load_summary_messages(cls, client: "CustomBot"):
+        try:
+            await client.summary_message_service.rehydrate()
+        except Exception as e:
+            print(f"Error loading daily summary messages: {e}")
+            return
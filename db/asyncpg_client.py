@@ -1,37 +1,439 @@
+import asyncio
+import time
+from typing import Callable
+
 import asyncpg
 
+from db.circuit_breaker import CircuitBreaker, CircuitState, DatabaseUnavailableError
+from db.instrumented_connection import InstrumentedConnection
+from db.query_stats import QueryStats
+from db.replica import REPLICA_LAG_QUERY, prefers_replica
+from db.statements import statements
+
+# Errors that mean the primary is unreachable or refusing connections, as
+# opposed to a bad query.
+CONNECTION_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.OperatorInterventionError,
+    asyncpg.TooManyConnectionsError,
+    asyncpg.ConnectionDoesNotExistError,
+)
+
+# How long a replaced pool waits for its checked-out connections to come back
+# before the stragglers are terminated.
+POOL_CLOSE_TIMEOUT = 30.0
+
 
 class AsyncpgClient:
-    def __init__(self, dsn: str):
+    def __init__(
+        self,
+        dsn: str,
+        slow_query_threshold_ms: float = 200.0,
+        min_size: int = 10,
+        max_size: int = 10,
+        max_inactive_connection_lifetime: float = 0,
+        command_timeout: float | None = None,
+        acquire_timeout: float | None = None,
+        warmup_size: int | None = None,
+        health_check_interval: float = 30.0,
+        replica_dsn: str | None = None,
+        replica_min_size: int = 1,
+        replica_max_size: int = 5,
+        replica_max_lag_seconds: float = 30.0,
+        cursor_prefetch: int = 500,
+        breaker_failure_threshold: int = 3,
+        breaker_reset_timeout: float = 2.0,
+        breaker_max_reset_timeout: float = 60.0,
+    ):
         self.dsn = dsn
         self.pool: asyncpg.Pool | None = None
+        self.stats = QueryStats(slow_query_threshold_ms=slow_query_threshold_ms)
+
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self.command_timeout = command_timeout
+        self.acquire_timeout = acquire_timeout
+        self.warmup_size = min(warmup_size or min_size, self.max_size)
+        self.health_check_interval = health_check_interval
+        self.cursor_prefetch = max(cursor_prefetch, 1)
+
+        self.waiting = 0
+        self.peak_in_use = 0
+        self.reconnects = 0
+        self.last_ping_ms: float | None = None
+        self.last_ping_ok_at: float | None = None
+        self.ping_failures = 0
+        self._health_task: asyncio.Task | None = None
+        self._reconnect_task: asyncio.Future | None = None
+        self._probe_connection: int | None = None
+        self.breaker = CircuitBreaker(
+            failure_threshold=breaker_failure_threshold,
+            reset_timeout=breaker_reset_timeout,
+            max_reset_timeout=breaker_max_reset_timeout,
+        )
+
+        self.replica_dsn = replica_dsn or None
+        self.replica_pool: asyncpg.Pool | None = None
+        self.replica_min_size = replica_min_size
+        self.replica_max_size = max(replica_max_size, replica_min_size)
+        self.replica_max_lag_seconds = replica_max_lag_seconds
+        self.replica_healthy = False
+        self.replica_lag_seconds: float | None = None
+        self.replica_reads = 0
+        self.replica_fallbacks = 0
+        # Pool each checked-out connection came from, so it goes back there
+        # even after the primary pool has been replaced.
+        self._connection_pools: dict[int, asyncpg.Pool] = {}
+
+    async def _init_connection(self, conn: asyncpg.Connection) -> None:
+        if isinstance(conn, InstrumentedConnection):
+            conn.query_stats = self.stats
+            conn.prepared = await statements.prepare_all(conn)
+            conn.on_outcome = self._record_query_outcome
+
+    async def _init_replica_connection(self, conn: asyncpg.Connection) -> None:
+        await self._init_connection(conn)
+        if isinstance(conn, InstrumentedConnection):
+            # The breaker guards the primary; replica errors only demote the replica.
+            conn.on_outcome = None
+
+    def _record_query_outcome(
+        self, conn: asyncpg.Connection, error: BaseException | None
+    ) -> None:
+        # Only a finished statement tells whether the primary is healthy: an
+        # acquired connection may still be dead, and a query error raised by
+        # the server still means the server answered. A command timeout is a
+        # slow statement on a live connection, not an outage, so it gives no
+        # verdict (TimeoutError is an OSError, hence checked first).
+        if error is None:
+            self.breaker.record_success()
+        elif isinstance(error, asyncio.TimeoutError):
+            return
+        elif isinstance(error, CONNECTION_ERRORS) or (
+            isinstance(error, asyncpg.InterfaceError) and conn.is_closed()
+        ):
+            self.breaker.record_failure()
+        elif isinstance(error, asyncpg.PostgresError):
+            self.breaker.record_success()
 
     async def connect(self) -> None:
         """Create a new pool if not exists."""
         if not self.pool or self.pool._closed:
             self.pool = await asyncpg.create_pool(
                 self.dsn,
-                max_inactive_connection_lifetime=0,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+                command_timeout=self.command_timeout,
+                connection_class=InstrumentedConnection,
+                init=self._init_connection,
             )
+        await self.connect_replica()
 
-    async def get_connection(self) -> asyncpg.Connection:
-        """Acquire a connection, reconnect if pool is closed."""
+    async def connect_replica(self) -> None:
+        """Create the optional read-only pool. Reads stay on the primary if it cannot be reached."""
+        if not self.replica_dsn:
+            return
+        if self.replica_pool and not self.replica_pool._closed:
+            return
+        try:
+            self.replica_pool = await asyncpg.create_pool(
+                self.replica_dsn,
+                min_size=self.replica_min_size,
+                max_size=self.replica_max_size,
+                max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+                command_timeout=self.command_timeout,
+                connection_class=InstrumentedConnection,
+                init=self._init_replica_connection,
+                server_settings={"default_transaction_read_only": "on"},
+            )
+        except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+            print(f"Read replica unavailable, reads stay on the primary: {e}")
+            self.replica_pool = None
+            self.replica_healthy = False
+            return
+        await self.check_replica()
+
+    async def check_replica(self) -> None:
+        if not self.replica_pool or self.replica_pool._closed:
+            self.replica_healthy = False
+            return
+
+        was_healthy = self.replica_healthy
+        try:
+            conn = await self._acquire(self.replica_pool)
+            try:
+                self.replica_lag_seconds = await conn.fetchval(REPLICA_LAG_QUERY)
+            finally:
+                await self.release_connection(conn)
+            self.replica_healthy = self.replica_lag_seconds <= self.replica_max_lag_seconds
+        except (OSError, asyncio.TimeoutError, asyncpg.PostgresError, ConnectionError) as e:
+            self.replica_lag_seconds = None
+            self.replica_healthy = False
+            print(f"Read replica health check failed: {e}")
+
+        if self.replica_healthy and not was_healthy:
+            print(f"Routing replica-safe reads to the read replica (lag {self.replica_lag_seconds:.1f}s).")
+        elif was_healthy and not self.replica_healthy:
+            print(
+                f"Read replica unhealthy (lag {self.replica_lag_seconds}s), routing reads to the primary."
+            )
+
+    async def warm_up(self) -> None:
+        """Open and touch ``warmup_size`` connections so the first burst skips TCP and auth."""
         if not self.pool or self.pool._closed:
             await self.connect()
+        if not self.pool:
+            return
+
+        started = time.perf_counter()
+        connections = await asyncio.gather(
+            *(self._acquire() for _ in range(self.warmup_size)),
+            return_exceptions=True,
+        )
         try:
-            if not self.pool:
-                raise ConnectionError("Connection pool is not initialized.")
-            return await self.pool.acquire()
-        except (asyncpg.PostgresError, ConnectionError):
-            await self.connect()
-            if not self.pool:
-                raise ConnectionError("Failed to acquire a connection from the pool.")
-            return await self.pool.acquire()
+            await asyncio.gather(
+                *(
+                    conn.execute("SELECT 1")
+                    for conn in connections
+                    if not isinstance(conn, BaseException)
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            for conn in connections:
+                if not isinstance(conn, BaseException):
+                    await self.release_connection(conn)
+
+        failed = sum(1 for conn in connections if isinstance(conn, BaseException))
+        print(
+            f"Warmed up {len(connections) - failed}/{self.warmup_size} database connections"
+            f" in {(time.perf_counter() - started) * 1000:.0f}ms."
+        )
+
+    async def _acquire(self, pool: asyncpg.Pool | None = None) -> asyncpg.Connection:
+        if pool is None:
+            pool = self.pool
+        if not pool:
+            raise ConnectionError("Connection pool is not initialized.")
+        if pool is not self.pool:
+            conn = await pool.acquire(timeout=self.acquire_timeout)
+            self._connection_pools[id(conn)] = pool
+            return conn
+
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            conn = await pool.acquire(timeout=self.acquire_timeout)
+        finally:
+            self.waiting -= 1
+        self.stats.record_acquire((time.perf_counter() - started) * 1000)
+        self._connection_pools[id(conn)] = pool
+
+        in_use = pool.get_size() - pool.get_idle_size()
+        if in_use > self.peak_in_use:
+            self.peak_in_use = in_use
+        return conn
+
+    async def _acquire_replica(self) -> asyncpg.Connection | None:
+        if not self.replica_pool or self.replica_pool._closed or not self.replica_healthy:
+            self.replica_fallbacks += 1
+            return None
+        try:
+            conn = await self._acquire(self.replica_pool)
+        except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+            print(f"Failed to acquire a read replica connection, using the primary: {e}")
+            self.replica_healthy = False
+            self.replica_fallbacks += 1
+            return None
+        self.replica_reads += 1
+        return conn
+
+    def add_state_listener(self, listener: Callable[[CircuitState], None]) -> None:
+        """Call ``listener`` with "closed", "open" or "half_open" whenever the primary's circuit changes state."""
+        self.breaker.add_listener(listener)
+
+    @property
+    def is_available(self) -> bool:
+        return self.breaker.is_available
+
+    async def _recreate_pool(self) -> None:
+        self.reconnects += 1
+        old_pool, self.pool = self.pool, None
+        if old_pool and not old_pool._closed:
+            # Callers may still hold its connections; let them finish and
+            # release before the old pool goes away.
+            asyncio.create_task(self._close_pool(old_pool))
+        await self.connect()
+
+    async def _close_pool(self, pool: asyncpg.Pool) -> None:
+        try:
+            await asyncio.wait_for(pool.close(), timeout=POOL_CLOSE_TIMEOUT)
+        except (asyncio.TimeoutError, OSError, asyncpg.PostgresError) as e:
+            print(f"Terminating the replaced connection pool: {e!r}")
+            pool.terminate()
+
+    async def _reconnect(self) -> None:
+        # Single flight: concurrent callers wait on the same pool recreation
+        # instead of each opening min_size connections of their own.
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.ensure_future(self._recreate_pool())
+        await asyncio.shield(self._reconnect_task)
+
+    async def get_connection(self) -> asyncpg.Connection:
+        """Acquire a connection, reconnect if pool is closed.
+
+        Inside a ``@replica_safe`` repository method the connection comes from the
+        read replica when one is configured and healthy. Raises
+        ``DatabaseUnavailableError`` straight away while the circuit is open.
+        """
+        if self.replica_dsn and prefers_replica():
+            conn = await self._acquire_replica()
+            if conn is not None:
+                return conn
+
+        self.breaker.check()
+        probing = self.breaker.state == "half_open"
+        try:
+            if not self.pool or self.pool._closed:
+                await self._reconnect()
+            conn = await self._acquire()
+        except CONNECTION_ERRORS as e:
+            if self.breaker.state != "open":
+                print(f"Failed to acquire a database connection: {e!r}")
+            self.breaker.record_failure()
+            raise DatabaseUnavailableError(
+                f"Failed to acquire a database connection: {e}"
+            ) from e
+        except BaseException:
+            self.breaker.abandon_probe()
+            raise
+        if probing:
+            # The probe's first statement closes or re-opens the circuit.
+            self._probe_connection = id(conn)
+        return conn
 
     async def release_connection(self, conn: asyncpg.Connection) -> None:
+        if id(conn) == self._probe_connection:
+            self._probe_connection = None
+            # No-op if a statement already gave the verdict; otherwise the
+            # probe ended without one and the next caller probes instead.
+            self.breaker.abandon_probe()
+        pool = self._connection_pools.pop(id(conn), None)
+        # A connection whose pool has since closed was already closed with it.
+        if pool is not None and not pool._closed:
+            await pool.release(conn)
+
+    async def ping(self) -> float:
+        conn = await self.get_connection()
+        try:
+            started = time.perf_counter()
+            # The connection reports the outcome of this statement to the breaker.
+            await conn.execute("SELECT 1")
+            return (time.perf_counter() - started) * 1000
+        finally:
+            await self.release_connection(conn)
+
+    def _next_health_check_delay(self) -> float:
+        # While the circuit is open, probe as soon as the backoff allows so
+        # degraded callers learn about the recovery without waiting a full interval.
+        if self.breaker.state == "open":
+            return min(max(self.breaker.retry_at - time.monotonic(), 0.5), self.health_check_interval)
+        return self.health_check_interval
+
+    async def _health_check_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._next_health_check_delay())
+            try:
+                self.last_ping_ms = await self.ping()
+                self.last_ping_ok_at = time.time()
+                self.ping_failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.ping_failures += 1
+                print(
+                    f"Database health check failed ({self.ping_failures} in a row): {e}"
+                )
+
+            if self.replica_dsn:
+                if not self.replica_pool or self.replica_pool._closed:
+                    await self.connect_replica()
+                else:
+                    await self.check_replica()
+
+    def start_health_check(self) -> None:
+        if self.health_check_interval <= 0:
+            return
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_check_loop())
+
+    def pool_metrics(self) -> dict:
+        size = idle = 0
         if self.pool and not self.pool._closed:
-            await self.pool.release(conn)
+            size = self.pool.get_size()
+            idle = self.pool.get_idle_size()
+
+        return {
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "peak_in_use": self.peak_in_use,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "waiting": self.waiting,
+            "acquire_wait_avg_ms": self.stats.acquire_wait.avg_ms,
+            "acquire_wait_p95_ms": self.stats.acquire_wait.percentile(0.95),
+            "acquire_wait_max_ms": self.stats.acquire_wait.max_ms,
+            "reconnects": self.reconnects,
+            "circuit": self.breaker.format_status(),
+            "last_ping_ms": self.last_ping_ms,
+            "ping_failures": self.ping_failures,
+            "replica_configured": bool(self.replica_dsn),
+            "replica_healthy": self.replica_healthy,
+            "replica_lag_seconds": self.replica_lag_seconds,
+            "replica_reads": self.replica_reads,
+            "replica_fallbacks": self.replica_fallbacks,
+        }
+
+    def format_pool_metrics(self) -> str:
+        metrics = self.pool_metrics()
+        last_ping = (
+            f"{metrics['last_ping_ms']:.1f}ms"
+            if metrics["last_ping_ms"] is not None
+            else "n/a"
+        )
+        report = (
+            f"Pool: in_use={metrics['in_use']} idle={metrics['idle']}"
+            f" size={metrics['size']} (min={metrics['min_size']}, max={metrics['max_size']})"
+            f" peak_in_use={metrics['peak_in_use']} waiting={metrics['waiting']}\n"
+            f"Acquire wait: avg={metrics['acquire_wait_avg_ms']:.1f}ms"
+            f" p95<={metrics['acquire_wait_p95_ms']:.1f}ms"
+            f" max={metrics['acquire_wait_max_ms']:.1f}ms"
+            f" | reconnects={metrics['reconnects']}"
+            f" | last ping={last_ping} failures={metrics['ping_failures']}\n"
+            f"{metrics['circuit']}"
+        )
+        if metrics["replica_configured"]:
+            lag = (
+                f"{metrics['replica_lag_seconds']:.1f}s"
+                if metrics["replica_lag_seconds"] is not None
+                else "n/a"
+            )
+            report += (
+                f"\nReplica: {'healthy' if metrics['replica_healthy'] else 'unavailable'}"
+                f" lag={lag} reads={metrics['replica_reads']}"
+                f" fallbacks={metrics['replica_fallbacks']}"
+            )
+        return report
 
     async def close(self) -> None:
+        if self._health_task and not self._health_task.done():
+            self._health_task.cancel()
+        if self.replica_pool and not self.replica_pool._closed:
+            await self.replica_pool.close()
         if self.pool and not self.pool._closed:
-            await self.pool.close()
\ No newline at end of file
+            await self.pool.close()
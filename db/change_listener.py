@@ -0,0 +1,148 @@
+import asyncio
+import json
+import random
+from typing import Awaitable, Callable, Optional
+
+import asyncpg
+
+CACHE_INVALIDATION_CHANNEL = "cache_invalidation"
+
+
+class TableChange:
+    """One row change published by the ``notify_cache_invalidation`` trigger (db/migations/4.sql).
+
+    ``op`` is INSERT, UPDATE, DELETE or TRUNCATE, or RESYNC after the listener
+    reconnects, when notifications may have been missed and caches must reload.
+    """
+
+    __slots__ = ("table", "op", "new", "old")
+
+    def __init__(
+        self,
+        table: str,
+        op: str,
+        new: Optional[dict] = None,
+        old: Optional[dict] = None,
+    ):
+        self.table = table
+        self.op = op
+        self.new = new
+        self.old = old
+
+    @property
+    def is_full_reload(self) -> bool:
+        return self.op in ("TRUNCATE", "RESYNC")
+
+    def __repr__(self) -> str:
+        return f"<TableChange {self.op} {self.table}>"
+
+
+ChangeHandler = Callable[[TableChange], Awaitable[None]]
+
+
+class ChangeListener:
+    """LISTENs for cache invalidations on a dedicated connection outside the pool.
+
+    Handlers run one at a time in notification order. After a reconnect every
+    subscribed table gets a RESYNC change, since notifications sent while the
+    connection was down are lost.
+    """
+
+    def __init__(self, dsn: str, reconnect_delay: float = 1.0, max_reconnect_delay: float = 60.0):
+        self.dsn = dsn
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.connected = False
+        self.received = 0
+        self.handler_failures = 0
+        self._handlers: dict[str, list[ChangeHandler]] = {}
+        self._queue: asyncio.Queue[TableChange] = asyncio.Queue()
+        self._conn: asyncpg.Connection | None = None
+        self._disconnected: asyncio.Event | None = None
+        self._listen_task: asyncio.Task | None = None
+        self._dispatch_task: asyncio.Task | None = None
+
+    def subscribe(self, table: str, handler: ChangeHandler) -> None:
+        self._handlers.setdefault(table, []).append(handler)
+
+    def start(self) -> None:
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.create_task(self._listen_loop())
+
+    async def stop(self) -> None:
+        for task in (self._listen_task, self._dispatch_task):
+            if task and not task.done():
+                task.cancel()
+        if self._conn and not self._conn.is_closed():
+            await self._conn.close()
+        self.connected = False
+
+    def _on_notification(
+        self, conn: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        try:
+            data = json.loads(payload)
+            change = TableChange(data["table"], data["op"], data.get("new"), data.get("old"))
+        except (ValueError, KeyError) as e:
+            print(f"Ignoring malformed cache invalidation payload {payload!r}: {e}")
+            return
+        self.received += 1
+        self._queue.put_nowait(change)
+
+    def _on_termination(self, conn: asyncpg.Connection) -> None:
+        self.connected = False
+        if self._disconnected:
+            self._disconnected.set()
+
+    async def _listen_loop(self) -> None:
+        delay = self.reconnect_delay
+        first_connect = True
+        while True:
+            try:
+                self._disconnected = asyncio.Event()
+                self._conn = await asyncpg.connect(self.dsn)
+                self._conn.add_termination_listener(self._on_termination)
+                await self._conn.add_listener(
+                    CACHE_INVALIDATION_CHANNEL, self._on_notification
+                )
+                self.connected = True
+                delay = self.reconnect_delay
+                print(f"Listening for cache invalidations on '{CACHE_INVALIDATION_CHANNEL}'.")
+
+                if not first_connect:
+                    for table in self._handlers:
+                        self._queue.put_nowait(TableChange(table, "RESYNC"))
+                first_connect = False
+
+                await self._disconnected.wait()
+                print("Cache invalidation listener disconnected, reconnecting.")
+            except asyncio.CancelledError:
+                raise
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+                self.connected = False
+                print(f"Cache invalidation listener failed to connect: {e}")
+
+            await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            change = await self._queue.get()
+            for handler in self._handlers.get(change.table, []):
+                try:
+                    await handler(change)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.handler_failures += 1
+                    print(f"Error applying {change!r} to the cache: {e}")
+
+    def format_status(self) -> str:
+        return (
+            f"Cache listener: {'connected' if self.connected else 'disconnected'}"
+            f" received={self.received} handler_failures={self.handler_failures}"
+            f" tables={','.join(sorted(self._handlers)) or '-'}"
+        )
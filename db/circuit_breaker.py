@@ -0,0 +1,111 @@
+import random
+import time
+from typing import Callable, Literal
+
+CircuitState = Literal["closed", "open", "half_open"]
+StateListener = Callable[[CircuitState], None]
+
+
+class DatabaseUnavailableError(ConnectionError):
+    """Raised without touching the network while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Fails fast after ``failure_threshold`` consecutive database failures.
+
+    While open, callers get ``DatabaseUnavailableError`` immediately. Once the
+    backoff elapses a single caller is let through as a probe (half-open); its
+    success closes the circuit, its failure re-opens it with a doubled, jittered
+    backoff capped at ``max_reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 2.0,
+        max_reset_timeout: float = 60.0,
+    ):
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+
+        self.state: CircuitState = "closed"
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self.rejected = 0
+        self.retry_at = 0.0
+        self._backoff_attempt = 0
+        self._probe_in_flight = False
+        self._listeners: list[StateListener] = []
+
+    def add_listener(self, listener: StateListener) -> None:
+        self._listeners.append(listener)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self.state:
+            return
+        self.state = state
+        for listener in self._listeners:
+            try:
+                listener(state)
+            except Exception as e:
+                print(f"Error in database state listener {listener!r}: {e}")
+
+    def check(self) -> None:
+        if self.state == "closed":
+            return
+        if self.state == "open" and time.monotonic() >= self.retry_at:
+            self._probe_in_flight = True
+            self._transition("half_open")
+            return
+        self.rejected += 1
+        raise DatabaseUnavailableError(
+            f"Database circuit is {self.state}, retrying in"
+            f" {max(self.retry_at - time.monotonic(), 0):.1f}s."
+        )
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self._backoff_attempt = 0
+        self._probe_in_flight = False
+        self._transition("closed")
+
+    def record_failure(self) -> None:
+        if self.state == "open":
+            # Callers that were already in flight when the circuit opened.
+            return
+        self.consecutive_failures += 1
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def abandon_probe(self) -> None:
+        """Give the probe slot back when the probing call ended without a verdict (e.g. cancelled)."""
+        if self.state == "half_open" and self._probe_in_flight:
+            self._probe_in_flight = False
+            self.retry_at = time.monotonic()
+            self._transition("open")
+
+    def _open(self) -> None:
+        delay = min(
+            self.reset_timeout * (2 ** self._backoff_attempt), self.max_reset_timeout
+        )
+        self._backoff_attempt += 1
+        self.retry_at = time.monotonic() + delay * random.uniform(0.5, 1.5)
+        self._probe_in_flight = False
+        if self.state == "closed":
+            self.opened_count += 1
+            print(
+                f"Database circuit opened after {self.consecutive_failures} failures,"
+                f" next attempt in {self.retry_at - time.monotonic():.1f}s."
+            )
+        self._transition("open")
+
+    @property
+    def is_available(self) -> bool:
+        return self.state == "closed"
+
+    def format_status(self) -> str:
+        status = f"Circuit: {self.state} failures={self.consecutive_failures} opened={self.opened_count} rejected={self.rejected}"
+        if self.state == "open":
+            status += f" retry_in={max(self.retry_at - time.monotonic(), 0):.1f}s"
+        return status
@@ -0,0 +1,152 @@
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import asyncpg
+
+from db.query_stats import rows_from_status
+from db.statements import Statement
+
+if TYPE_CHECKING:
+    from asyncpg.prepared_stmt import PreparedStatement
+
+    from db.query_stats import QueryStats
+
+
+class InstrumentedConnection(asyncpg.Connection):
+    """asyncpg connection that reports every statement to a QueryStats instance.
+
+    The pool assigns ``query_stats`` and ``prepared`` in its ``init`` hook, so
+    repositories keep calling ``conn.fetch``/``conn.execute``. Passing a
+    registered ``Statement`` instead of a SQL string runs the statement
+    prepared for this connection. ``on_outcome``, when set, is called as each
+    statement finishes, with the connection and ``None`` or the exception it
+    raised.
+    """
+
+    query_stats: Optional["QueryStats"] = None
+    prepared: dict[str, "PreparedStatement"] = {}
+    on_outcome: Optional[
+        Callable[["InstrumentedConnection", Optional[BaseException]], None]
+    ] = None
+
+    def _record(
+        self,
+        query: Any,
+        args: Any,
+        started: float,
+        rows: int,
+        failed: bool = False,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if self.on_outcome is not None and (error is not None or not failed):
+            self.on_outcome(self, error)
+        if self.query_stats is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        label = query.name if isinstance(query, Statement) else query
+        self.query_stats.record_query(label, args, elapsed_ms, rows, failed)
+
+    def _resolve(self, query: Any) -> tuple[Optional["PreparedStatement"], Any]:
+        if isinstance(query, Statement):
+            return self.prepared.get(query.name), query.sql
+        return None, query
+
+    async def fetch(self, query, *args, **kwargs):
+        stmt, sql = self._resolve(query)
+        started = time.perf_counter()
+        try:
+            if stmt is not None:
+                rows = await stmt.fetch(*args, timeout=kwargs.get("timeout"))
+            else:
+                rows = await super().fetch(sql, *args, **kwargs)
+        except Exception as e:
+            self._record(query, args, started, 0, failed=True, error=e)
+            raise
+        self._record(query, args, started, len(rows))
+        return rows
+
+    async def fetchrow(self, query, *args, **kwargs):
+        stmt, sql = self._resolve(query)
+        started = time.perf_counter()
+        try:
+            if stmt is not None:
+                row = await stmt.fetchrow(*args, timeout=kwargs.get("timeout"))
+            else:
+                row = await super().fetchrow(sql, *args, **kwargs)
+        except Exception as e:
+            self._record(query, args, started, 0, failed=True, error=e)
+            raise
+        self._record(query, args, started, 1 if row is not None else 0)
+        return row
+
+    async def fetchval(self, query, *args, **kwargs):
+        stmt, sql = self._resolve(query)
+        started = time.perf_counter()
+        try:
+            if stmt is not None:
+                value = await stmt.fetchval(
+                    *args,
+                    column=kwargs.get("column", 0),
+                    timeout=kwargs.get("timeout"),
+                )
+            else:
+                value = await super().fetchval(sql, *args, **kwargs)
+        except Exception as e:
+            self._record(query, args, started, 0, failed=True, error=e)
+            raise
+        self._record(query, args, started, 1)
+        return value
+
+    async def execute(self, query, *args, **kwargs):
+        stmt, sql = self._resolve(query)
+        started = time.perf_counter()
+        try:
+            if stmt is not None:
+                await stmt.fetch(*args, timeout=kwargs.get("timeout"))
+                status = stmt.get_statusmsg()
+            else:
+                status = await super().execute(sql, *args, **kwargs)
+        except Exception as e:
+            self._record(query, args, started, 0, failed=True, error=e)
+            raise
+        self._record(query, args, started, rows_from_status(status))
+        return status
+
+    async def executemany(self, command, args, **kwargs):
+        stmt, sql = self._resolve(command)
+        args = list(args)
+        started = time.perf_counter()
+        try:
+            if stmt is not None:
+                result = await stmt.executemany(args, timeout=kwargs.get("timeout"))
+            else:
+                result = await super().executemany(sql, args, **kwargs)
+        except Exception as e:
+            self._record(command, (), started, 0, failed=True, error=e)
+            raise
+        # Parameters of a batch are never logged, only its size.
+        self._record(command, (args,), started, len(args))
+        return result
+
+    async def stream(self, query, *args, prefetch: int = 500, timeout=None):
+        """Yield rows from a server-side cursor, ``prefetch`` rows per round trip.
+
+        Must run inside a transaction. The statement is recorded once, when the
+        cursor is exhausted or abandoned, with the number of rows yielded.
+        """
+        stmt, sql = self._resolve(query)
+        if stmt is not None:
+            cursor = stmt.cursor(*args, prefetch=prefetch, timeout=timeout)
+        else:
+            cursor = super().cursor(sql, *args, prefetch=prefetch, timeout=timeout)
+
+        started = time.perf_counter()
+        rows = 0
+        failed = True
+        try:
+            async for row in cursor:
+                rows += 1
+                yield row
+            failed = False
+        finally:
+            self._record(query, args, started, rows, failed=failed)
@@ -0,0 +1,54 @@
+-- Secondary indexes matching the access patterns in repositories/.
+-- Plain CREATE INDEX takes a write lock on each table while it builds; on a
+-- large live database run the statements one by one with CONCURRENTLY instead.
+
+-- StandupRepository.get_standups_by_user_and_date / get_standup_tasks_by_user_and_date
+CREATE INDEX IF NOT EXISTS message_author_id_message_date_idx
+  ON public.message (author_id, message_date);
+
+-- StandupRepository.get_userid_wrote_standup_by_date (index-only scan)
+CREATE INDEX IF NOT EXISTS message_channel_id_message_date_idx
+  ON public.message (channel_id, message_date) INCLUDE (author_id);
+
+-- LeaveRepository.is_user_on_leave_fullday / get_leave_by_userid_and_date /
+-- get_fullday_leave_date_by_userid_and_year
+CREATE INDEX IF NOT EXISTS attendance_author_id_absent_date_idx
+  ON public.attendance (author_id, absent_date) INCLUDE (partial_leave);
+
+-- LeaveRepository.get_daily_leaves / get_user_inleave. The primary key already
+-- leads with absent_date; this one lets the daily summaries skip the heap.
+CREATE INDEX IF NOT EXISTS attendance_absent_date_author_id_idx
+  ON public.attendance (absent_date, author_id) INCLUDE (leave_type, partial_leave);
+
+-- LeaveRepository.get_leave_by_message_id / delete_leave_by_message_id
+CREATE INDEX IF NOT EXISTS attendance_message_id_idx
+  ON public.attendance (message_id);
+
+-- MemberRepository.get_user_role / is_user_exists / get_standup_channels_by_user_id
+-- and the member_team joins of the daily summaries. The primary key only
+-- serves lookups by channel_id.
+CREATE INDEX IF NOT EXISTS member_team_author_id_idx
+  ON public.member_team (author_id) INCLUDE (role);
+
+-- ON DELETE CASCADE from message, and the tasks -> message join.
+CREATE INDEX IF NOT EXISTS tasks_message_id_author_id_idx
+  ON public.tasks (message_id, author_id);
+
+-- VoiceAttendanceRepository.get_lested_event_type_by_author_id (index-only scan)
+CREATE INDEX IF NOT EXISTS attendance_activity_author_id_event_time_idx
+  ON public.attendance_activity (author_id, event_time DESC) INCLUDE (event_type);
+
+-- VoiceAttendanceRepository.get_daily_attendance_summary_by_channel_id_and_date
+CREATE INDEX IF NOT EXISTS attendance_activity_date_author_id_event_time_idx
+  ON public.attendance_activity (date, author_id, event_time) INCLUDE (event_type);
+
+-- OfficeEntryRepository.get_daily_office_entries
+CREATE INDEX IF NOT EXISTS office_entries_date_idx
+  ON public.office_entries (date);
+
+-- ON DELETE CASCADE from message.
+CREATE INDEX IF NOT EXISTS office_entries_message_id_author_id_idx
+  ON public.office_entries (message_id, author_id);
+
+ANALYZE public.message, public.attendance, public.member_team, public.tasks,
+  public.attendance_activity, public.office_entries;
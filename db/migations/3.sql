@@ -0,0 +1,10 @@
+-- ClockinRepository.get_clockin_by_author_and_date filters on a half-open
+-- [Bangkok midnight, next Bangkok midnight) range of clock_in_time.
+CREATE INDEX IF NOT EXISTS clockin_log_author_id_clock_in_time_idx
+  ON public.clockin_log (author_id, clock_in_time);
+
+-- company_holidays.holiday_date is already covered by its UNIQUE constraint, and
+-- attendance (author_id, absent_date) by 2.sql; the year filters now use ranges
+-- on those columns instead of EXTRACT(YEAR FROM ...).
+
+ANALYZE public.clockin_log;
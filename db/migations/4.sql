@@ -0,0 +1,57 @@
+-- Publish changes to cached tables so every bot instance can refresh its
+-- in-memory copies (see db/change_listener.py). Payloads carry the old and new
+-- rows; all of these tables have small rows, well below the 8000 byte NOTIFY limit.
+CREATE OR REPLACE FUNCTION public.notify_cache_invalidation() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  IF TG_LEVEL = 'STATEMENT' THEN
+    PERFORM pg_notify(
+      'cache_invalidation',
+      json_build_object('table', TG_TABLE_NAME, 'op', TG_OP)::text
+    );
+    RETURN NULL;
+  END IF;
+
+  PERFORM pg_notify(
+    'cache_invalidation',
+    json_build_object(
+      'table', TG_TABLE_NAME,
+      'op', TG_OP,
+      'new', CASE WHEN TG_OP <> 'DELETE' THEN to_jsonb(NEW) END,
+      'old', CASE WHEN TG_OP <> 'INSERT' THEN to_jsonb(OLD) END
+    )::text
+  );
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS team_notify_cache_invalidation ON public.team;
+CREATE TRIGGER team_notify_cache_invalidation
+  AFTER INSERT OR UPDATE OR DELETE ON public.team
+  FOR EACH ROW EXECUTE FUNCTION public.notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS team_truncate_notify_cache_invalidation ON public.team;
+CREATE TRIGGER team_truncate_notify_cache_invalidation
+  AFTER TRUNCATE ON public.team
+  FOR EACH STATEMENT EXECUTE FUNCTION public.notify_cache_invalidation();
+
+-- Role changes are UPDATEs of member_team.role and are published by this trigger too.
+DROP TRIGGER IF EXISTS member_team_notify_cache_invalidation ON public.member_team;
+CREATE TRIGGER member_team_notify_cache_invalidation
+  AFTER INSERT OR UPDATE OR DELETE ON public.member_team
+  FOR EACH ROW EXECUTE FUNCTION public.notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS member_team_truncate_notify_cache_invalidation ON public.member_team;
+CREATE TRIGGER member_team_truncate_notify_cache_invalidation
+  AFTER TRUNCATE ON public.member_team
+  FOR EACH STATEMENT EXECUTE FUNCTION public.notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS company_holidays_notify_cache_invalidation ON public.company_holidays;
+CREATE TRIGGER company_holidays_notify_cache_invalidation
+  AFTER INSERT OR UPDATE OR DELETE ON public.company_holidays
+  FOR EACH ROW EXECUTE FUNCTION public.notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS company_holidays_truncate_notify_cache_invalidation ON public.company_holidays;
+CREATE TRIGGER company_holidays_truncate_notify_cache_invalidation
+  AFTER TRUNCATE ON public.company_holidays
+  FOR EACH STATEMENT EXECUTE FUNCTION public.notify_cache_invalidation();
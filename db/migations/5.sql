@@ -0,0 +1,149 @@
+-- Partition message and tasks by month of message_date.
+--
+-- Almost every stand-up read filters message_date to a day or a month, so with
+-- one partition per month those queries touch a single partition, and old
+-- months can be detached or dropped without a large DELETE.
+--
+-- Requires PostgreSQL 15+: editing a stand-up's date moves its message row to
+-- another partition, and only 15+ runs ON UPDATE CASCADE (instead of ON DELETE)
+-- for foreign keys when a referenced row moves between partitions.
+--
+-- The primary key of a partitioned table must contain the partition key, so
+-- message is keyed by (message_id, author_id, message_date), and tasks and
+-- office_entries reference that whole key. tasks gets a message_date column.
+--
+-- The tables are rewritten inside one transaction that blocks stand-up writes
+-- while it runs; stop the bot before applying this migration.
+
+BEGIN;
+
+-- Stand-ups always carry a date; the partition key cannot be NULL.
+UPDATE public.message
+SET message_date = (timestamp AT TIME ZONE 'Asia/Bangkok')::date
+WHERE message_date IS NULL;
+
+ALTER TABLE public.tasks DROP CONSTRAINT IF EXISTS tasks_message_id_author_id_fkey;
+ALTER TABLE public.office_entries DROP CONSTRAINT IF EXISTS office_entries_message_id_author_id_fkey;
+
+ALTER TABLE public.message RENAME TO message_unpartitioned;
+ALTER TABLE public.message_unpartitioned RENAME CONSTRAINT message_pkey TO message_unpartitioned_pkey;
+ALTER TABLE public.tasks RENAME TO tasks_unpartitioned;
+ALTER TABLE public.tasks_unpartitioned RENAME CONSTRAINT tasks_pkey TO tasks_unpartitioned_pkey;
+
+CREATE TABLE public.message (
+  message_id text NOT NULL,
+  author_id text NOT NULL,
+  username text,
+  servername text,
+  channel_id text NOT NULL,
+  content text NOT NULL,
+  message_date date NOT NULL,
+  timestamp timestamp with time zone NOT NULL DEFAULT now(),
+  last_updated_at timestamp with time zone NULL,
+  CONSTRAINT message_pkey PRIMARY KEY (message_id, author_id, message_date),
+  FOREIGN KEY (channel_id) REFERENCES public.team(channel_id)
+) PARTITION BY RANGE (message_date);
+
+CREATE TABLE public.tasks (
+  id UUID NOT NULL DEFAULT uuid_generate_v4(),
+  message_id TEXT NOT NULL,
+  author_id TEXT NOT NULL,
+  message_date date NOT NULL,
+  task TEXT NOT NULL,
+  status standup_task_status NOT NULL DEFAULT 'todo',
+  CONSTRAINT tasks_pkey PRIMARY KEY (id, message_date)
+) PARTITION BY RANGE (message_date);
+
+-- Catch-all partitions so a stand-up dated outside the prepared months is still
+-- stored. They should stay empty: create_standup_partitions() cannot create a
+-- month whose rows already sit in the default partition.
+CREATE TABLE public.message_default PARTITION OF public.message DEFAULT;
+CREATE TABLE public.tasks_default PARTITION OF public.tasks DEFAULT;
+
+-- Creates the monthly message and tasks partitions covering [from_date, to_date]
+-- that do not exist yet and returns how many were created. Run by the bot's
+-- daily partition job; safe to call repeatedly.
+CREATE OR REPLACE FUNCTION public.create_standup_partitions(from_date date, to_date date)
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+  month_start date;
+  parent text;
+  partition_name text;
+  created integer := 0;
+BEGIN
+  FOR month_start IN
+    SELECT generate_series(date_trunc('month', from_date), date_trunc('month', to_date), interval '1 month')::date
+  LOOP
+    FOREACH parent IN ARRAY ARRAY['message', 'tasks'] LOOP
+      partition_name := format('%s_%s', parent, to_char(month_start, 'YYYY_MM'));
+      IF to_regclass(format('public.%I', partition_name)) IS NULL THEN
+        EXECUTE format(
+          'CREATE TABLE public.%I PARTITION OF public.%I FOR VALUES FROM (%L) TO (%L)',
+          partition_name, parent, month_start, (month_start + interval '1 month')::date
+        );
+        created := created + 1;
+      END IF;
+    END LOOP;
+  END LOOP;
+  RETURN created;
+END;
+$$;
+
+SELECT public.create_standup_partitions(
+  LEAST((SELECT min(message_date) FROM public.message_unpartitioned), current_date),
+  GREATEST((SELECT max(message_date) FROM public.message_unpartitioned), current_date + 90)
+);
+
+INSERT INTO public.message (message_id, author_id, username, servername, channel_id, content, message_date, timestamp, last_updated_at)
+SELECT message_id, author_id, username, servername, channel_id, content, message_date, timestamp, last_updated_at
+FROM public.message_unpartitioned;
+
+INSERT INTO public.tasks (id, message_id, author_id, message_date, task, status)
+SELECT t.id, t.message_id, t.author_id, m.message_date, t.task, t.status
+FROM public.tasks_unpartitioned t
+JOIN public.message_unpartitioned m
+  ON m.message_id = t.message_id AND m.author_id = t.author_id;
+
+DROP TABLE public.tasks_unpartitioned;
+DROP TABLE public.message_unpartitioned;
+
+-- Same names as 2.sql, now partitioned indexes.
+CREATE INDEX message_author_id_message_date_idx
+  ON public.message (author_id, message_date);
+CREATE INDEX message_channel_id_message_date_idx
+  ON public.message (channel_id, message_date) INCLUDE (author_id);
+CREATE INDEX tasks_message_id_author_id_idx
+  ON public.tasks (message_id, author_id);
+
+-- StandupRepository.get_standup_tasks_by_user_and_date no longer joins message.
+CREATE INDEX tasks_author_id_message_date_idx
+  ON public.tasks (author_id, message_date);
+
+ALTER TABLE public.tasks
+  ADD CONSTRAINT tasks_message_fkey
+  FOREIGN KEY (message_id, author_id, message_date)
+  REFERENCES public.message (message_id, author_id, message_date)
+  ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- Office entries made from a stand-up are dated with the stand-up's date. Older
+-- rows where the two disagree keep the entry but lose the link to the message.
+UPDATE public.office_entries oe
+SET message_id = NULL
+WHERE oe.message_id IS NOT NULL
+  AND NOT EXISTS (
+    SELECT 1 FROM public.message m
+    WHERE m.message_id = oe.message_id
+      AND m.author_id = oe.author_id
+      AND m.message_date = oe.date
+  );
+
+ALTER TABLE public.office_entries
+  ADD CONSTRAINT office_entries_message_fkey
+  FOREIGN KEY (message_id, author_id, date)
+  REFERENCES public.message (message_id, author_id, message_date)
+  ON DELETE CASCADE ON UPDATE CASCADE;
+
+COMMIT;
+
+ANALYZE public.message, public.tasks, public.office_entries;
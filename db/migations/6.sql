@@ -0,0 +1,196 @@
+-- Per-day, per-team member status read by the 09:00 summaries, /team,
+-- /leave_summary and the office-entry summary.
+--
+-- One row per (date, team channel, member) that has at least one fact that day:
+-- a stand-up in that channel, a leave or an office entry. Rows follow the
+-- current member_team rows, like the joins they replace did at read time.
+-- Triggers keep it current, so the summaries read one date range of one index
+-- however much history the base tables hold.
+
+CREATE TABLE IF NOT EXISTS public.daily_member_status (
+  date date NOT NULL,
+  channel_id text NOT NULL,
+  author_id text NOT NULL,
+  server_name text NOT NULL,
+  team_name text NOT NULL,
+  wrote_standup boolean NOT NULL DEFAULT false,
+  -- A morning plus an afternoon leave on the same day count as a full day
+  -- (partial_leave NULL); leave_content joins the messages of every leave.
+  leave_type leave_type_enum,
+  partial_leave partial_leave_enum,
+  leave_content text,
+  office_entry boolean NOT NULL DEFAULT false,
+  CONSTRAINT daily_member_status_pkey PRIMARY KEY (date, channel_id, author_id)
+);
+
+-- Trigger refreshes and member_team changes look rows up by member.
+CREATE INDEX IF NOT EXISTS daily_member_status_author_id_date_idx
+  ON public.daily_member_status (author_id, date);
+
+-- The rows daily_member_status should hold for one member on one day.
+CREATE OR REPLACE FUNCTION public.daily_member_status_rows(p_author_id text, p_date date)
+RETURNS SETOF public.daily_member_status
+LANGUAGE sql STABLE AS $$
+  SELECT *
+  FROM (
+    SELECT
+      p_date,
+      mt.channel_id,
+      mt.author_id,
+      mt.server_name,
+      t.team_name,
+      EXISTS (
+        SELECT 1 FROM public.message m
+        WHERE m.message_date = p_date AND m.author_id = mt.author_id AND m.channel_id = mt.channel_id
+      ),
+      l.leave_type,
+      l.partial_leave,
+      l.leave_content,
+      EXISTS (
+        SELECT 1 FROM public.office_entries oe
+        WHERE oe.author_id = mt.author_id AND oe.date = p_date
+      )
+    FROM public.member_team mt
+    JOIN public.team t ON t.channel_id = mt.channel_id
+    LEFT JOIN LATERAL (
+      SELECT
+        (array_agg(a.leave_type ORDER BY a.partial_leave IS NULL DESC, a.created_at DESC))[1] AS leave_type,
+        CASE
+          WHEN bool_or(a.partial_leave IS NULL)
+            OR (bool_or(a.partial_leave = 'morning') AND bool_or(a.partial_leave = 'afternoon'))
+          THEN NULL
+          ELSE (array_agg(a.partial_leave ORDER BY a.created_at DESC))[1]
+        END AS partial_leave,
+        string_agg(DISTINCT a.content, E'\n') AS leave_content
+      FROM public.attendance a
+      WHERE a.author_id = mt.author_id AND a.absent_date = p_date
+      HAVING count(*) > 0
+    ) l ON true
+    WHERE mt.author_id = p_author_id
+  ) AS s (date, channel_id, author_id, server_name, team_name, wrote_standup,
+          leave_type, partial_leave, leave_content, office_entry)
+  WHERE s.wrote_standup OR s.leave_type IS NOT NULL OR s.office_entry;
+$$;
+
+-- The advisory lock serialises refreshes of one member-day: without it two
+-- transactions could both delete, both insert and fail the second on the
+-- primary key (two team stand-ups at once, a stand-up plus a leave, a backfill
+-- during live traffic), aborting the user's write. Each statement of a SQL
+-- function takes a new snapshot, so the DELETE sees what the holder committed.
+CREATE OR REPLACE FUNCTION public.refresh_daily_member_status(p_author_id text, p_date date)
+RETURNS void
+LANGUAGE sql AS $$
+  SELECT pg_advisory_xact_lock(hashtext(p_author_id), p_date - DATE '2000-01-01');
+  DELETE FROM public.daily_member_status WHERE author_id = p_author_id AND date = p_date;
+  INSERT INTO public.daily_member_status
+  SELECT * FROM public.daily_member_status_rows(p_author_id, p_date);
+$$;
+
+-- Shared by message, attendance and office_entries; TG_ARGV[0] names the date column.
+CREATE OR REPLACE FUNCTION public.daily_member_status_on_fact() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+  old_date date;
+  new_date date;
+BEGIN
+  IF TG_OP <> 'INSERT' THEN
+    old_date := (to_jsonb(OLD) ->> TG_ARGV[0])::date;
+    PERFORM public.refresh_daily_member_status(OLD.author_id, old_date);
+  END IF;
+  IF TG_OP = 'INSERT' THEN
+    new_date := (to_jsonb(NEW) ->> TG_ARGV[0])::date;
+    PERFORM public.refresh_daily_member_status(NEW.author_id, new_date);
+  ELSIF TG_OP = 'UPDATE' THEN
+    -- Unless the member or the day changed, refreshing OLD above covered NEW too.
+    new_date := (to_jsonb(NEW) ->> TG_ARGV[0])::date;
+    IF NEW.author_id IS DISTINCT FROM OLD.author_id OR new_date IS DISTINCT FROM old_date THEN
+      PERFORM public.refresh_daily_member_status(NEW.author_id, new_date);
+    END IF;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS message_daily_member_status ON public.message;
+CREATE TRIGGER message_daily_member_status
+  AFTER INSERT OR DELETE OR UPDATE OF author_id, channel_id, message_date ON public.message
+  FOR EACH ROW EXECUTE FUNCTION public.daily_member_status_on_fact('message_date');
+
+DROP TRIGGER IF EXISTS attendance_daily_member_status ON public.attendance;
+CREATE TRIGGER attendance_daily_member_status
+  AFTER INSERT OR DELETE OR UPDATE OF author_id, absent_date, leave_type, partial_leave, content ON public.attendance
+  FOR EACH ROW EXECUTE FUNCTION public.daily_member_status_on_fact('absent_date');
+
+DROP TRIGGER IF EXISTS office_entries_daily_member_status ON public.office_entries;
+CREATE TRIGGER office_entries_daily_member_status
+  AFTER INSERT OR DELETE OR UPDATE OF author_id, date ON public.office_entries
+  FOR EACH ROW EXECUTE FUNCTION public.daily_member_status_on_fact('date');
+
+-- Joining a team brings the member's history into it, leaving drops it, and
+-- display or team name changes are copied onto the existing rows.
+CREATE OR REPLACE FUNCTION public.daily_member_status_on_member_team() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+  fact_date date;
+BEGIN
+  IF TG_OP = 'UPDATE'
+    AND NEW.channel_id = OLD.channel_id AND NEW.author_id = OLD.author_id THEN
+    IF NEW.server_name IS DISTINCT FROM OLD.server_name THEN
+      UPDATE public.daily_member_status
+      SET server_name = NEW.server_name
+      WHERE author_id = NEW.author_id AND channel_id = NEW.channel_id;
+    END IF;
+    RETURN NULL;
+  END IF;
+
+  IF TG_OP <> 'INSERT' THEN
+    DELETE FROM public.daily_member_status
+    WHERE author_id = OLD.author_id AND channel_id = OLD.channel_id;
+  END IF;
+  IF TG_OP <> 'DELETE' THEN
+    FOR fact_date IN
+      SELECT message_date FROM public.message WHERE author_id = NEW.author_id AND channel_id = NEW.channel_id
+      UNION SELECT absent_date FROM public.attendance WHERE author_id = NEW.author_id
+      UNION SELECT date FROM public.office_entries WHERE author_id = NEW.author_id
+    LOOP
+      PERFORM public.refresh_daily_member_status(NEW.author_id, fact_date);
+    END LOOP;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS member_team_daily_member_status ON public.member_team;
+CREATE TRIGGER member_team_daily_member_status
+  AFTER INSERT OR DELETE OR UPDATE OF channel_id, author_id, server_name ON public.member_team
+  FOR EACH ROW EXECUTE FUNCTION public.daily_member_status_on_member_team();
+
+CREATE OR REPLACE FUNCTION public.daily_member_status_on_team() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  UPDATE public.daily_member_status
+  SET team_name = NEW.team_name
+  WHERE channel_id = NEW.channel_id;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS team_daily_member_status ON public.team;
+CREATE TRIGGER team_daily_member_status
+  AFTER UPDATE OF team_name ON public.team
+  FOR EACH ROW
+  WHEN (NEW.team_name IS DISTINCT FROM OLD.team_name)
+  EXECUTE FUNCTION public.daily_member_status_on_team();
+
+-- Backfill from the existing history.
+TRUNCATE public.daily_member_status;
+INSERT INTO public.daily_member_status
+SELECT r.*
+FROM (
+  SELECT author_id, message_date AS date FROM public.message
+  UNION SELECT author_id, absent_date FROM public.attendance
+  UNION SELECT author_id, date FROM public.office_entries
+) AS f
+CROSS JOIN LATERAL public.daily_member_status_rows(f.author_id, f.date) AS r;
+
+ANALYZE public.daily_member_status;
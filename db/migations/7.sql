@@ -0,0 +1,11 @@
+-- Daily summary messages the bot keeps editing during the day (leave and
+-- office-entry summaries). Persisted so a restarted bot keeps editing the
+-- message it already posted instead of losing it or posting a second one.
+CREATE TABLE IF NOT EXISTS public.daily_summary_message (
+  summary_kind text NOT NULL CHECK (summary_kind IN ('leave', 'office_entry')),
+  date date NOT NULL,
+  channel_id BIGINT NOT NULL,
+  message_id BIGINT NOT NULL,
+  created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  CONSTRAINT daily_summary_message_pkey PRIMARY KEY (summary_kind, date)
+);
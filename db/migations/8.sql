@@ -0,0 +1,16 @@
+-- Fingerprint of the stored (already stripped) content, so an edit event whose
+-- content did not change (embed unfurls, pins, flag changes) can be skipped
+-- with one indexed lookup. Must match utils.string_utils.content_fingerprint.
+--
+-- md5(text) rather than sha256: generated columns need an immutable
+-- expression, and text -> bytea conversion is not. This is a change detector,
+-- not a security boundary.
+--
+-- Adding a stored generated column rewrites both tables (every message
+-- partition); run it while the bot is stopped.
+
+ALTER TABLE public.message
+  ADD COLUMN IF NOT EXISTS content_hash text GENERATED ALWAYS AS (md5(content)) STORED;
+
+ALTER TABLE public.attendance
+  ADD COLUMN IF NOT EXISTS content_hash text GENERATED ALWAYS AS (md5(content)) STORED;
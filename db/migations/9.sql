@@ -0,0 +1,45 @@
+-- Global index of task ids for the month-partitioned tasks table (5.sql).
+--
+-- A partitioned table's primary key must contain the partition key, so tasks
+-- is keyed by (id, message_date): nothing keeps id unique across months, and a
+-- lookup by id alone probes every partition. /update_task_status only has the
+-- id. task_dates maps each id to its message_date, which enforces uniqueness
+-- (its primary key) and lets a lookup by id prune tasks to one partition.
+--
+-- Row triggers on partitioned tables need PostgreSQL 13+; 5.sql already
+-- requires 15+.
+
+CREATE TABLE IF NOT EXISTS public.task_dates (
+  id uuid NOT NULL,
+  message_date date NOT NULL,
+  CONSTRAINT task_dates_pkey PRIMARY KEY (id)
+);
+
+CREATE OR REPLACE FUNCTION public.task_dates_sync() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    INSERT INTO public.task_dates (id, message_date) VALUES (NEW.id, NEW.message_date);
+  ELSIF TG_OP = 'DELETE' THEN
+    DELETE FROM public.task_dates WHERE id = OLD.id;
+  ELSE
+    -- Editing a stand-up's date cascades onto its tasks' message_date.
+    UPDATE public.task_dates
+    SET id = NEW.id, message_date = NEW.message_date
+    WHERE id = OLD.id;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS tasks_task_dates ON public.tasks;
+CREATE TRIGGER tasks_task_dates
+  AFTER INSERT OR DELETE OR UPDATE OF id, message_date ON public.tasks
+  FOR EACH ROW EXECUTE FUNCTION public.task_dates_sync();
+
+-- Backfill; safe to re-run.
+INSERT INTO public.task_dates (id, message_date)
+SELECT id, message_date FROM public.tasks
+ON CONFLICT (id) DO NOTHING;
+
+ANALYZE public.task_dates;
@@ -0,0 +1,174 @@
+import time
+from typing import Any, Sequence
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+)
+
+
+def normalize_statement(query: str) -> str:
+    return " ".join(query.split())
+
+
+def redact_params(args: Sequence[Any]) -> str:
+    redacted = []
+    for i, arg in enumerate(args, start=1):
+        if arg is None:
+            redacted.append(f"${i}=NULL")
+        elif isinstance(arg, (list, tuple, set)):
+            redacted.append(f"${i}=<{type(arg).__name__}[{len(arg)}]>")
+        else:
+            redacted.append(f"${i}=<{type(arg).__name__}>")
+    return ", ".join(redacted)
+
+
+def rows_from_status(status: str | None) -> int:
+    # asyncpg returns command tags such as "INSERT 0 3", "UPDATE 2", "DELETE 0".
+    if not status:
+        return 0
+    last = status.rsplit(" ", 1)[-1]
+    return int(last) if last.isdigit() else 0
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (0 < q <= 1)."""
+        if not self.count:
+            return 0.0
+
+        target = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target:
+                if i < len(LATENCY_BUCKETS_MS):
+                    return min(LATENCY_BUCKETS_MS[i], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+
+class StatementStats:
+    def __init__(self, statement: str):
+        self.statement = statement
+        self.latency = LatencyHistogram()
+        self.rows = 0
+        self.errors = 0
+
+    def record(self, elapsed_ms: float, rows: int, failed: bool) -> None:
+        self.latency.observe(elapsed_ms)
+        self.rows += rows
+        if failed:
+            self.errors += 1
+
+
+class QueryStats:
+    def __init__(self, slow_query_threshold_ms: float = 200.0):
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.statements: dict[str, StatementStats] = {}
+        self.acquire_wait = LatencyHistogram()
+        self.slow_queries = 0
+        self.started_at = time.time()
+
+    def record_query(
+        self,
+        query: str,
+        args: Sequence[Any],
+        elapsed_ms: float,
+        rows: int,
+        failed: bool = False,
+    ) -> None:
+        statement = normalize_statement(query)
+        stats = self.statements.get(statement)
+        if stats is None:
+            stats = self.statements[statement] = StatementStats(statement)
+        stats.record(elapsed_ms, rows, failed)
+
+        if elapsed_ms >= self.slow_query_threshold_ms:
+            self.slow_queries += 1
+            print(
+                f"[SlowQuery] {elapsed_ms:.1f}ms rows={rows}"
+                f"{' FAILED' if failed else ''} {statement}"
+                f" | params: ({redact_params(args)})"
+            )
+
+    def record_acquire(self, elapsed_ms: float) -> None:
+        self.acquire_wait.observe(elapsed_ms)
+
+    def reset(self) -> None:
+        self.statements = {}
+        self.acquire_wait = LatencyHistogram()
+        self.slow_queries = 0
+        self.started_at = time.time()
+
+    def top_statements(
+        self, limit: int = 10, order_by: str = "total"
+    ) -> list[StatementStats]:
+        sort_keys = {
+            "total": lambda s: s.latency.total_ms,
+            "avg": lambda s: s.latency.avg_ms,
+            "max": lambda s: s.latency.max_ms,
+            "calls": lambda s: s.latency.count,
+        }
+        if order_by not in sort_keys:
+            raise ValueError(f"Invalid order: {order_by}")
+
+        return sorted(
+            self.statements.values(), key=sort_keys[order_by], reverse=True
+        )[:limit]
+
+    def format_report(self, limit: int = 10, order_by: str = "total") -> str:
+        uptime_min = (time.time() - self.started_at) / 60
+        total_calls = sum(s.latency.count for s in self.statements.values())
+        lines = [
+            f"Window: {uptime_min:.1f} min | statements: {len(self.statements)}"
+            f" | calls: {total_calls} | slow (>= {self.slow_query_threshold_ms:.0f}ms): {self.slow_queries}",
+            f"Pool acquire wait: n={self.acquire_wait.count}"
+            f" avg={self.acquire_wait.avg_ms:.1f}ms"
+            f" p95<={self.acquire_wait.percentile(0.95):.1f}ms"
+            f" max={self.acquire_wait.max_ms:.1f}ms",
+            "",
+        ]
+
+        for stats in self.top_statements(limit, order_by):
+            latency = stats.latency
+            lines.append(
+                f"calls={latency.count} total={latency.total_ms:.0f}ms"
+                f" avg={latency.avg_ms:.1f}ms p50<={latency.percentile(0.5):.1f}ms"
+                f" p95<={latency.percentile(0.95):.1f}ms max={latency.max_ms:.1f}ms"
+                f" rows={stats.rows} errors={stats.errors}"
+            )
+            lines.append(f"  {stats.statement[:160]}")
+
+        return "\n".join(lines)
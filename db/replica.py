@@ -0,0 +1,66 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_prefer_replica: ContextVar[bool] = ContextVar("prefer_replica", default=False)
+
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END::float8
+"""
+
+
+def replica_safe(func):
+    """Mark a read-only repository method whose result may lag the primary by a few seconds.
+
+    Connections acquired while the method runs come from the read replica when
+    one is configured and healthy, and from the primary otherwise. Async
+    generator methods are supported as well.
+    """
+    if inspect.isasyncgenfunction(func):
+        return _replica_safe_stream(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = _prefer_replica.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _prefer_replica.reset(token)
+
+    return wrapper
+
+
+def _replica_safe_stream(
+    func: Callable[P, AsyncIterator[R]]
+) -> Callable[P, AsyncIterator[R]]:
+    # The flag is set only while the generator body runs, never across a
+    # yield, so it cannot leak into the consumer between rows.
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> AsyncIterator[R]:
+        stream = func(*args, **kwargs)
+        try:
+            while True:
+                token = _prefer_replica.set(True)
+                try:
+                    item = await anext(stream)
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _prefer_replica.reset(token)
+                yield item
+        finally:
+            await stream.aclose()
+
+    return wrapper
+
+
+def prefers_replica() -> bool:
+    return _prefer_replica.get()
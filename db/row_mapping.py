@@ -0,0 +1,39 @@
+from typing import Iterable, Optional, TypeVar
+
+import asyncpg
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+def _construct(model: type[M], fields: set[str], row: asyncpg.Record) -> M:
+    # What BaseModel.model_construct ends up doing, minus its per-field Python
+    # loop. That loop makes model_construct slower than pydantic-core
+    # validation on pydantic 2, see benchmarks/row_mapping.py.
+    instance = _new(model)
+    _set(instance, "__dict__", dict(row))
+    _set(instance, "__pydantic_fields_set__", fields.copy())
+    _set(instance, "__pydantic_extra__", None)
+    _set(instance, "__pydantic_private__", None)
+    return instance
+
+
+def map_row(model: type[M], row: Optional[asyncpg.Record]) -> Optional[M]:
+    """Build ``model`` from a row without pydantic validation.
+
+    Only for rows read back from our own tables whose columns match the model
+    fields one to one and already have the model's types (text ids, enums as
+    str, dates, timestamptz). Anything coming from Discord or Gemini must still
+    go through ``Model(...)``.
+    """
+    if row is None:
+        return None
+    return _construct(model, set(model.model_fields), row)
+
+
+def map_rows(model: type[M], rows: Iterable[asyncpg.Record]) -> list[M]:
+    fields = set(model.model_fields)
+    return [_construct(model, fields, row) for row in rows]
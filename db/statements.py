@@ -0,0 +1,65 @@
+from typing import TYPE_CHECKING, Iterator
+
+import asyncpg
+
+if TYPE_CHECKING:
+    from asyncpg.prepared_stmt import PreparedStatement
+
+
+class Statement:
+    __slots__ = ("name", "sql")
+
+    def __init__(self, name: str, sql: str):
+        self.name = name
+        self.sql = sql
+
+    def __repr__(self) -> str:
+        return f"<Statement {self.name}>"
+
+
+class StatementRegistry:
+    """Inventory of every SQL statement the bot runs.
+
+    Repositories register their SQL at import time. Each pooled connection
+    prepares the whole inventory once in the pool ``init`` hook, and
+    ``InstrumentedConnection`` runs a ``Statement`` through its prepared
+    handle instead of re-parsing the text.
+    """
+
+    def __init__(self):
+        self._statements: dict[str, Statement] = {}
+
+    def register(self, name: str, sql: str) -> Statement:
+        existing = self._statements.get(name)
+        if existing is not None:
+            if existing.sql != sql:
+                raise ValueError(f"Statement {name} is already registered")
+            return existing
+
+        statement = Statement(name, sql)
+        self._statements[name] = statement
+        return statement
+
+    def get(self, name: str) -> Statement | None:
+        return self._statements.get(name)
+
+    def __iter__(self) -> Iterator[Statement]:
+        return iter(self._statements.values())
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    async def prepare_all(
+        self, conn: asyncpg.Connection
+    ) -> dict[str, "PreparedStatement"]:
+        prepared: dict[str, "PreparedStatement"] = {}
+        for statement in self._statements.values():
+            try:
+                prepared[statement.name] = await conn.prepare(statement.sql)
+            except asyncpg.PostgresError as e:
+                # Fall back to plain execution, e.g. when a migration has not been applied yet.
+                print(f"Failed to prepare statement {statement.name}: {e}")
+        return prepared
+
+
+statements = StatementRegistry()
@@ -31,8 +31,11 @@ async def load_all_cogs(client: CustomBot):
 async def main():
     async with client:
         await client.db.connect()
+        await client.db.warm_up()
+        client.db.start_health_check()
         await load_all_cogs(client)
         print("Connected to PostgreSQL successfully.")
+        client.change_listener.start()
         await DataCache.initialize(client)
         await client.start(BOT_TOKEN)
 
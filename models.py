@@ -130,6 +130,7 @@ class StandupTask(BaseModel):
     id: Optional[UUID] = None
     message_id: str
     author_id: str
+    message_date: Optional[date] = None
     task: str
     status: Literal["todo", "in_progress", "done"]
 
@@ -138,6 +139,14 @@ class BotPanel(BaseModel):
     message_id: int
     channel_id: int
 
+
+class DailySummaryMessage(BaseModel):
+    summary_kind: Literal["leave", "office_entry"]
+    date: date
+    channel_id: int
+    message_id: int
+
+
 class ClockinLog(BaseModel):
     id: Optional[int] = None
     author_id: str
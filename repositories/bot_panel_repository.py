@@ -1,12 +1,33 @@
 from datetime import date
 from typing import TYPE_CHECKING, Optional
 
+from db.statements import statements
 from models import BotPanel
 
 if TYPE_CHECKING:
     from db.asyncpg_client import AsyncpgClient
 
 
+GET_BOT_PANEL = statements.register(
+    "bot_panel.get_bot_panel",
+    "SELECT message_id, channel_id FROM bot_panel WHERE id = TRUE",
+)
+
+DELETE_BOT_PANEL = statements.register(
+    "bot_panel.delete_bot_panel",
+    "DELETE FROM bot_panel WHERE id = TRUE",
+)
+
+INSERT_BOT_PANEL = statements.register(
+    "bot_panel.insert_bot_panel",
+    """
+    INSERT INTO bot_panel (id, message_id, channel_id, created_at)
+    VALUES (TRUE, $1, $2, NOW())
+    ON CONFLICT (id) DO UPDATE SET message_id = EXCLUDED.message_id, channel_id = EXCLUDED.channel_id, created_at = EXCLUDED.created_at
+    """,
+)
+
+
 class BotPanelRepository:
     def __init__(self, asyncpg_client: "AsyncpgClient"):
         self.asyncpg_client = asyncpg_client
@@ -15,9 +36,7 @@ class BotPanelRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            row = await conn.fetchrow(
-                "SELECT message_id, channel_id FROM bot_panel WHERE id = TRUE"
-            )
+            row = await conn.fetchrow(GET_BOT_PANEL)
             if row:
                 return BotPanel(
                     message_id=row["message_id"], channel_id=row["channel_id"]
@@ -31,7 +50,7 @@ class BotPanelRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            await conn.execute("DELETE FROM bot_panel WHERE id = TRUE")
+            await conn.execute(DELETE_BOT_PANEL)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -40,15 +59,7 @@ class BotPanelRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            await conn.execute(
-                """
-                INSERT INTO bot_panel (id, message_id, channel_id, created_at)
-                VALUES (TRUE, $1, $2, NOW())
-                ON CONFLICT (id) DO UPDATE SET message_id = EXCLUDED.message_id, channel_id = EXCLUDED.channel_id, created_at = EXCLUDED.created_at
-                """,
-                message_id,
-                channel_id,
-            )
+            await conn.execute(INSERT_BOT_PANEL, message_id, channel_id)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -1,12 +1,32 @@
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
+from db.statements import statements
 from models import ClockinLog
+from utils.datetime_utils import get_day_bounds
 
 if TYPE_CHECKING:
     from db.asyncpg_client import AsyncpgClient
 
 
+CREATE_CLOCKIN_LOG = statements.register(
+    "clockin.create_clockin_log",
+    """
+    INSERT INTO clockin_log (author_id, clock_in_time)
+    VALUES ($1, $2)
+    """,
+)
+
+GET_CLOCKIN_BY_AUTHOR_AND_DATE = statements.register(
+    "clockin.get_clockin_by_author_and_date",
+    """
+    SELECT id, author_id, clock_in_time
+    FROM clockin_log
+    WHERE author_id = $1 AND clock_in_time >= $2 AND clock_in_time < $3
+    """,
+)
+
+
 class ClockinRepository:
     def __init__(self, asyncpg_client: "AsyncpgClient"):
         self.asyncpg_client = asyncpg_client
@@ -15,14 +35,7 @@ class ClockinRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            await conn.execute(
-                """
-                INSERT INTO clockin_log (author_id, clock_in_time)
-                VALUES ($1, $2)
-                """,
-                author_id,
-                clockin_time,
-            )
+            await conn.execute(CREATE_CLOCKIN_LOG, author_id, clockin_time)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -31,14 +44,9 @@ class ClockinRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
+            day_start, next_day_start = get_day_bounds(target_date)
             row = await conn.fetchrow(
-                """
-                SELECT id, author_id, clock_in_time
-                FROM clockin_log
-                WHERE author_id = $1 AND DATE(clock_in_time) = $2
-                """,
-                author_id,
-                target_date,
+                GET_CLOCKIN_BY_AUTHOR_AND_DATE, author_id, day_start, next_day_start
             )
             if row:
                 return ClockinLog(
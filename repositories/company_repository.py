@@ -1,23 +1,51 @@
 from datetime import date
 from typing import TYPE_CHECKING, Optional
 
+from db.replica import replica_safe
+from db.statements import statements
 from models import CompanyHoliday
 
 if TYPE_CHECKING:
     from db.asyncpg_client import AsyncpgClient
 
 
+GET_HOLIDAYS_BY_YEAR = statements.register(
+    "company.get_holidays_by_year",
+    "SELECT holiday_date, description FROM company_holidays WHERE holiday_date >= $1 AND holiday_date < $2 ORDER BY holiday_date",
+)
+
+GET_HOLIDAY_DATE_BY_YEAR = statements.register(
+    "company.get_holiday_date_by_year",
+    """
+    SELECT holiday_date
+    FROM company_holidays
+    WHERE holiday_date >= $1 AND holiday_date < $2
+    ORDER BY holiday_date;
+    """,
+)
+
+GET_HOLIDAY_DATE_BY_DATE = statements.register(
+    "company.get_holiday_date_by_date",
+    "SELECT holiday_date, description FROM company_holidays WHERE holiday_date = $1",
+)
+
+GET_HOLIDAYS_BY_DATE_RANGE = statements.register(
+    "company.get_holidays_by_date_range",
+    "SELECT holiday_date, description FROM company_holidays WHERE holiday_date BETWEEN $1 AND $2",
+)
+
+
 class CompanyRepository:
     def __init__(self, asyncpg_client: "AsyncpgClient"):
         self.asyncpg_client = asyncpg_client
 
+    @replica_safe
     async def get_holidays_by_year(self, year: int) -> list[CompanyHoliday]:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
             rows = await conn.fetch(
-                "SELECT holiday_date, description FROM company_holidays WHERE EXTRACT(YEAR FROM holiday_date) = $1 ORDER BY holiday_date",
-                year,
+                GET_HOLIDAYS_BY_YEAR, date(year, 1, 1), date(year + 1, 1, 1)
             )
             return [
                 CompanyHoliday(
@@ -29,6 +57,7 @@ class CompanyRepository:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    @replica_safe
     async def get_holiday_date_by_year(
         self, from_year: int, to_year: int
     ) -> set[date]:
@@ -36,16 +65,26 @@ class CompanyRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             rows = await conn.fetch(
-                """
-                SELECT holiday_date
-                FROM company_holidays
-                WHERE EXTRACT(YEAR FROM holiday_date) BETWEEN $1 AND $2
-                ORDER BY holiday_date;
-                """,
-                from_year,
-                to_year,
+                GET_HOLIDAY_DATE_BY_YEAR, date(from_year, 1, 1), date(to_year + 1, 1, 1)
+            )
+
+            return {row["holiday_date"] for row in rows} if rows else set()
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
+    async def get_holiday_date_by_year_primary(
+        self, from_year: int, to_year: int
+    ) -> set[date]:
+        # Not replica-safe: the calendar reloads on company_holidays
+        # notifications and must see the write that triggered them.
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            rows = await conn.fetch(
+                GET_HOLIDAY_DATE_BY_YEAR, date(from_year, 1, 1), date(to_year + 1, 1, 1)
             )
-            
+
             return {row["holiday_date"] for row in rows} if rows else set()
         finally:
             if conn:
@@ -57,10 +96,7 @@ class CompanyRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            row = await conn.fetchrow(
-                "SELECT holiday_date, description FROM company_holidays WHERE holiday_date = $1",
-                target_date,
-            )
+            row = await conn.fetchrow(GET_HOLIDAY_DATE_BY_DATE, target_date)
             if row:
                 return CompanyHoliday(
                     holiday_date=row["holiday_date"],
@@ -71,17 +107,14 @@ class CompanyRepository:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    @replica_safe
     async def get_holidays_by_date_range(
         self, from_date: date, to_date: date
     ) -> list[CompanyHoliday]:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            rows = await conn.fetch(
-                "SELECT holiday_date, description FROM company_holidays WHERE holiday_date BETWEEN $1 AND $2",
-                from_date,
-                to_date,
-            )
+            rows = await conn.fetch(GET_HOLIDAYS_BY_DATE_RANGE, from_date, to_date)
             return [
                 CompanyHoliday(
                     holiday_date=row["holiday_date"], description=row["description"]
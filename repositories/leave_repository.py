@@ -1,17 +1,154 @@
 from datetime import date
 from typing import TYPE_CHECKING, Optional
 
+from db.replica import replica_safe
+from db.row_mapping import map_row, map_rows
+from db.statements import statements
 from models import DailyLeaveSummary, LeaveByDateChannel, LeaveRequest
 
 if TYPE_CHECKING:
     from db.asyncpg_client import AsyncpgClient
 
 
+GET_FULLDAY_LEAVE_DATE_BY_USERID_AND_YEAR = statements.register(
+    "leave.get_fullday_leave_date_by_userid_and_year",
+    """
+    SELECT absent_date
+        FROM attendance
+        WHERE  author_id = $1 AND absent_date >= $2 AND absent_date < $3
+        GROUP BY author_id, absent_date
+        HAVING
+            COUNT(*) FILTER (WHERE partial_leave IS NULL) > 0
+            OR (
+                COUNT(*) FILTER (WHERE partial_leave = 'morning') > 0
+                AND COUNT(*) FILTER (WHERE partial_leave = 'afternoon') > 0
+            )
+    """,
+)
+
+IS_USER_ON_LEAVE_FULLDAY = statements.register(
+    "leave.is_user_on_leave_fullday",
+    """
+    SELECT EXISTS (
+        SELECT 1
+        FROM attendance
+        WHERE  author_id = $1 AND absent_date = $2
+        GROUP BY author_id, absent_date
+        HAVING
+            COUNT(*) FILTER (WHERE partial_leave IS NULL) > 0
+            OR (
+                COUNT(*) FILTER (WHERE partial_leave = 'morning') > 0
+                AND COUNT(*) FILTER (WHERE partial_leave = 'afternoon') > 0
+            )
+    );
+    """,
+)
+
+GET_USER_INLEAVE = statements.register(
+    "leave.get_user_inleave",
+    """
+    SELECT author_id, leave_type, partial_leave, leave_content AS content
+    FROM daily_member_status
+    WHERE date = $1 AND channel_id = $2 AND leave_type IS NOT NULL
+    ORDER BY server_name asc;
+    """,
+)
+
+GET_DAILY_LEAVES = statements.register(
+    "leave.get_daily_leaves",
+    """
+    SELECT author_id, leave_type, partial_leave, team_name
+    FROM public.daily_member_status
+    WHERE date = $1 AND leave_type IS NOT NULL
+    ORDER BY team_name asc, server_name asc;
+    """,
+)
+
+INSERT_LEAVE = statements.register(
+    "leave.insert_leave",
+    """
+    INSERT INTO attendance (message_id, author_id, channel_id, content, leave_type, partial_leave, absent_date, created_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    """,
+)
+
+GET_LEAVE_CONTENT_HASH = statements.register(
+    "leave.get_leave_content_hash",
+    "SELECT content_hash FROM attendance WHERE message_id = $1 LIMIT 1",
+)
+
+GET_LEAVE_BY_MESSAGE_ID = statements.register(
+    "leave.get_leave_by_message_id",
+    """
+    SELECT message_id, author_id, channel_id, content, leave_type, partial_leave, absent_date, created_at
+    FROM attendance
+    WHERE message_id = $1
+    """,
+)
+
+GET_TRACKED_LEAVE_MESSAGE_IDS = statements.register(
+    "leave.get_tracked_leave_message_ids",
+    "SELECT DISTINCT message_id FROM attendance WHERE message_id = ANY($1::text[])",
+)
+
+DELETE_LEAVE_BY_MESSAGE_ID = statements.register(
+    "leave.delete_leave_by_message_id",
+    "DELETE FROM attendance WHERE message_id = $1",
+)
+
+GET_LEAVE_BY_USERID_AND_DATE = statements.register(
+    "leave.get_leave_by_userid_and_date",
+    """
+    SELECT absent_date, message_id, created_at, author_id, content, leave_type, partial_leave, channel_id
+    FROM attendance
+    WHERE author_id = $1 AND absent_date >= $2 AND absent_date <= $3
+    ORDER BY absent_date ASC
+    """,
+)
+
+CREATE_LEAVE_STAGING = """
+    CREATE TEMP TABLE attendance_staging (
+        message_id text,
+        author_id text,
+        channel_id text,
+        content text,
+        leave_type text,
+        partial_leave text,
+        absent_date date,
+        created_at timestamptz
+    ) ON COMMIT DROP
+"""
+
+MERGE_LEAVE_STAGING = """
+    INSERT INTO attendance (message_id, author_id, channel_id, content, leave_type, partial_leave, absent_date, created_at)
+    SELECT
+        s.message_id,
+        s.author_id,
+        s.channel_id,
+        s.content,
+        s.leave_type::leave_type_enum,
+        NULLIF(s.partial_leave, 'fullday')::partial_leave_enum,
+        s.absent_date,
+        s.created_at
+    FROM attendance_staging s
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM attendance a
+        WHERE a.message_id = s.message_id
+            AND a.author_id = s.author_id
+            AND a.absent_date = s.absent_date
+            AND a.partial_leave IS NOT DISTINCT FROM NULLIF(s.partial_leave, 'fullday')::partial_leave_enum
+    )
+    ORDER BY s.absent_date, s.message_id
+"""
+
+
 class LeaveRepository:
 
     def __init__(self, asyncpg_client: "AsyncpgClient"):
         self.asyncpg_client = asyncpg_client
 
+    @replica_safe
     async def get_fullday_leave_date_by_userid_and_year(
         self, user_id: str, from_year: int, to_year: int
     ) -> set[date]:
@@ -19,49 +156,22 @@ class LeaveRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             rows = await conn.fetch(
-                """
-                SELECT absent_date
-                    FROM attendance
-                    WHERE  author_id = $1 AND EXTRACT(YEAR FROM absent_date) BETWEEN $2 AND $3
-                    GROUP BY author_id, absent_date
-                    HAVING 
-                        COUNT(*) FILTER (WHERE partial_leave IS NULL) > 0
-                        OR (
-                            COUNT(*) FILTER (WHERE partial_leave = 'morning') > 0
-                            AND COUNT(*) FILTER (WHERE partial_leave = 'afternoon') > 0
-                        )
-                """,
+                GET_FULLDAY_LEAVE_DATE_BY_USERID_AND_YEAR,
                 user_id,
-                from_year,
-                to_year,
+                date(from_year, 1, 1),
+                date(to_year + 1, 1, 1),
             )
             return {row["absent_date"] for row in rows} if rows else set()
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    @replica_safe
     async def is_user_on_leave_fullday(self, author_id: str, target_date: date) -> bool:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            row = await conn.fetchrow(
-                """
-                SELECT EXISTS (
-                    SELECT 1
-                    FROM attendance
-                    WHERE  author_id = $1 AND absent_date = $2
-                    GROUP BY author_id, absent_date
-                    HAVING 
-                        COUNT(*) FILTER (WHERE partial_leave IS NULL) > 0
-                        OR (
-                            COUNT(*) FILTER (WHERE partial_leave = 'morning') > 0
-                            AND COUNT(*) FILTER (WHERE partial_leave = 'afternoon') > 0
-                        )
-                );
-                """,
-                author_id,
-                target_date,
-            )
+            row = await conn.fetchrow(IS_USER_ON_LEAVE_FULLDAY, author_id, target_date)
             return row[0] if row else False
         finally:
             if conn:
@@ -71,18 +181,8 @@ class LeaveRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            rows = await conn.fetch(
-                """
-                SELECT a.author_id, a.leave_type, a.partial_leave, a.content
-                FROM attendance a
-                JOIN member_team m ON a.author_id = m.author_id
-                WHERE a.absent_date = $1 AND m.channel_id = $2
-                ORDER BY m.server_name asc;
-                """,
-                target_date,
-                channel_id,
-            )
-            return [LeaveByDateChannel(**dict(row)) for row in rows] if rows else []
+            rows = await conn.fetch(GET_USER_INLEAVE, target_date, channel_id)
+            return map_rows(LeaveByDateChannel, rows)
         except Exception as e:
             print(f"Error fetching user in leave: {e}")
             return []
@@ -94,22 +194,8 @@ class LeaveRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            rows = await conn.fetch(
-                """
-                SELECT
-                    a.author_id,
-                    a.leave_type,
-                    a.partial_leave,
-                    t.team_name
-                FROM public.attendance a
-                JOIN public.member_team mt on a.author_id = mt.author_id 
-                JOIN public.team t on mt.channel_id = t.channel_id
-                WHERE a.absent_date = $1
-                ORDER BY t.team_name asc, mt.server_name asc;
-                """,
-                target_date,
-            )
-            return [DailyLeaveSummary(**dict(row)) for row in rows] if rows else []
+            rows = await conn.fetch(GET_DAILY_LEAVES, target_date)
+            return map_rows(DailyLeaveSummary, rows)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -119,10 +205,7 @@ class LeaveRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             await conn.execute(
-                """
-                INSERT INTO attendance (message_id, author_id, channel_id, content, leave_type, partial_leave, absent_date, created_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                """,
+                INSERT_LEAVE,
                 leave_request.message_id,
                 leave_request.author_id,
                 leave_request.channel_id,
@@ -136,19 +219,63 @@ class LeaveRepository:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    async def bulk_insert_leaves(self, leave_requests: list[LeaveRequest]) -> int:
+        """Backfill leaves with COPY and one set-based merge, skipping rows already stored."""
+        if not leave_requests:
+            return 0
+
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            async with conn.transaction():
+                await conn.execute(CREATE_LEAVE_STAGING)
+                await conn.copy_records_to_table(
+                    "attendance_staging",
+                    records=[
+                        (
+                            leave.message_id,
+                            leave.author_id,
+                            leave.channel_id,
+                            leave.content,
+                            leave.leave_type,
+                            leave.partial_leave,
+                            leave.absent_date,
+                            leave.created_at,
+                        )
+                        for leave in leave_requests
+                    ],
+                )
+                status = await conn.execute(MERGE_LEAVE_STAGING)
+            return int(status.split()[-1])
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
+    async def get_tracked_leave_message_ids(self, message_ids: list[str]) -> set[str]:
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            rows = await conn.fetch(GET_TRACKED_LEAVE_MESSAGE_IDS, message_ids)
+            return {row["message_id"] for row in rows}
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
+    async def get_leave_content_hash(self, message_id: str) -> Optional[str]:
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            return await conn.fetchval(GET_LEAVE_CONTENT_HASH, message_id)
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
     async def get_leave_by_message_id(self, message_id: str) -> Optional[LeaveRequest]:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            row = await conn.fetchrow(
-                """
-                SELECT message_id, author_id, channel_id, content, leave_type, partial_leave, absent_date, created_at
-                FROM attendance
-                WHERE message_id = $1
-                """,
-                message_id,
-            )
-            return LeaveRequest(**dict(row)) if row else None
+            row = await conn.fetchrow(GET_LEAVE_BY_MESSAGE_ID, message_id)
+            return map_row(LeaveRequest, row)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -157,13 +284,12 @@ class LeaveRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            await conn.execute(
-                "DELETE FROM attendance WHERE message_id = $1", message_id
-            )
+            await conn.execute(DELETE_LEAVE_BY_MESSAGE_ID, message_id)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    @replica_safe
     async def get_leave_by_userid_and_date(
         self, user_id: str, from_date: date, to_date: date
     ) -> list[LeaveRequest]:
@@ -171,17 +297,9 @@ class LeaveRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             rows = await conn.fetch(
-                """
-                SELECT absent_date, message_id, created_at, author_id, content, leave_type, partial_leave, channel_id
-                FROM attendance
-                WHERE author_id = $1 AND absent_date >= $2 AND absent_date <= $3
-                ORDER BY absent_date ASC
-                """,
-                user_id,
-                from_date,
-                to_date,
+                GET_LEAVE_BY_USERID_AND_DATE, user_id, from_date, to_date
             )
-            return [LeaveRequest(**dict(row)) for row in rows] if rows else []
+            return map_rows(LeaveRequest, rows)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
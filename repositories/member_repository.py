@@ -1,37 +1,120 @@
 from typing import TYPE_CHECKING, Optional
 
+from db.replica import replica_safe
+from db.row_mapping import map_rows
+from db.statements import statements
 from models import MemberTeam, StandupMember, Team
 
 if TYPE_CHECKING:
     from db.asyncpg_client import AsyncpgClient
 
 
+GET_ALL_STANDUP_MEMBERS = statements.register(
+    "member.get_all_standup_members",
+    "SELECT author_id, server_name FROM member_team",
+)
+
+GET_MEMBER_ROSTER = statements.register(
+    "member.get_member_roster",
+    "SELECT channel_id, author_id, server_name FROM member_team",
+)
+
+GET_STANDUP_MEMBERS_BY_CHANNELID = statements.register(
+    "member.get_standup_members_by_channelid",
+    "SELECT author_id, server_name FROM member_team WHERE channel_id = $1",
+)
+
+ADD_MEMBER_TO_STANDUP_CHANNEL = statements.register(
+    "member.add_member_to_standup_channel",
+    """
+    INSERT INTO member_team (channel_id, author_id, server_name, created_at)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (channel_id, author_id) DO UPDATE
+    SET server_name = EXCLUDED.server_name, created_at = EXCLUDED.created_at
+    """,
+)
+
+IS_USER_ADDED_TO_STANDUP_CHANNEL = statements.register(
+    "member.is_user_added_to_standup_channel",
+    "SELECT author_id FROM member_team WHERE channel_id = $1 AND author_id = $2",
+)
+
+REMOVE_MEMBER_FROM_STANDUP_CHANNEL = statements.register(
+    "member.remove_member_from_standup_channel",
+    "DELETE FROM member_team WHERE channel_id = $1 AND author_id = $2",
+)
+
+REMOVE_MEMBER_FROM_ALL_STANDUP_CHANNELS = statements.register(
+    "member.remove_member_from_all_standup_channels",
+    "DELETE FROM member_team WHERE author_id = $1",
+)
+
+GET_USER_ROLE = statements.register(
+    "member.get_user_role",
+    "SELECT role FROM member_team WHERE author_id = $1 LIMIT 1",
+)
+
+UPDATE_USER_ROLE = statements.register(
+    "member.update_user_role",
+    "UPDATE member_team SET role = $1 WHERE author_id = $2",
+)
+
+GET_STANDUP_CHANNELS_BY_USER_ID = statements.register(
+    "member.get_standup_channels_by_user_id",
+    """
+    SELECT t.channel_id, t.server_id, t.server_name, t.team_name
+    FROM member_team mt
+    JOIN team t ON mt.channel_id = t.channel_id
+    WHERE mt.author_id = $1
+    """,
+)
+
+IS_USER_EXISTS = statements.register(
+    "member.is_user_exists",
+    "SELECT author_id FROM member_team WHERE author_id = $1 LIMIT 1",
+)
+
+UPDATE_MEMBER_DISPLAY_NAME = statements.register(
+    "member.update_member_display_name",
+    "UPDATE member_team SET server_name = $1 WHERE author_id = $2",
+)
+
+
 class MemberRepository:
 
     def __init__(self, asyncpg_client: "AsyncpgClient"):
         self.asyncpg_client = asyncpg_client
 
+    @replica_safe
     async def get_all_standup_members(self) -> list[MemberTeam]:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            rows = await conn.fetch("SELECT author_id, server_name FROM member_team")
-            return [MemberTeam(**dict(row)) for row in rows] if rows else []
+            rows = await conn.fetch(GET_ALL_STANDUP_MEMBERS)
+            return map_rows(MemberTeam, rows)
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
+    async def get_member_roster(self) -> list[dict]:
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            rows = await conn.fetch(GET_MEMBER_ROSTER)
+            return [dict(row) for row in rows]
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    @replica_safe
     async def get_standup_members_by_channelid(
         self, channel_id: str
     ) -> list[MemberTeam]:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            rows = await conn.fetch(
-                "SELECT author_id, server_name FROM member_team WHERE channel_id = $1",
-                channel_id,
-            )
-            return [MemberTeam(**dict(row)) for row in rows] if rows else []
+            rows = await conn.fetch(GET_STANDUP_MEMBERS_BY_CHANNELID, channel_id)
+            return map_rows(MemberTeam, rows)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -43,12 +126,7 @@ class MemberRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             await conn.execute(
-                """
-                INSERT INTO member_team (channel_id, author_id, server_name, created_at)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (channel_id, author_id) DO UPDATE
-                SET server_name = EXCLUDED.server_name, created_at = EXCLUDED.created_at
-                """,
+                ADD_MEMBER_TO_STANDUP_CHANNEL,
                 standup_member.channel_id,
                 standup_member.author_id,
                 standup_member.server_name,
@@ -65,9 +143,7 @@ class MemberRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             row = await conn.fetchrow(
-                "SELECT author_id FROM member_team WHERE channel_id = $1 AND author_id = $2",
-                str(channel_id),
-                str(user_id),
+                IS_USER_ADDED_TO_STANDUP_CHANNEL, str(channel_id), str(user_id)
             )
             return bool(row)
         finally:
@@ -81,9 +157,7 @@ class MemberRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             await conn.execute(
-                "DELETE FROM member_team WHERE channel_id = $1 AND author_id = $2",
-                str(channel_id),
-                str(user_id),
+                REMOVE_MEMBER_FROM_STANDUP_CHANNEL, str(channel_id), str(user_id)
             )
         finally:
             if conn:
@@ -93,7 +167,7 @@ class MemberRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            await conn.execute("DELETE FROM member_team WHERE author_id = $1", user_id)
+            await conn.execute(REMOVE_MEMBER_FROM_ALL_STANDUP_CHANNELS, user_id)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -102,9 +176,7 @@ class MemberRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            row = await conn.fetchrow(
-                "SELECT role FROM member_team WHERE author_id = $1 LIMIT 1", user_id
-            )
+            row = await conn.fetchrow(GET_USER_ROLE, user_id)
             return row["role"] if row else None
         finally:
             if conn:
@@ -114,9 +186,7 @@ class MemberRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            await conn.execute(
-                "UPDATE member_team SET role = $1 WHERE author_id = $2", role, user_id
-            )
+            await conn.execute(UPDATE_USER_ROLE, role, user_id)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -125,16 +195,8 @@ class MemberRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            rows = await conn.fetch(
-                """
-                SELECT t.channel_id, t.server_id, t.server_name, t.team_name
-                FROM member_team mt
-                JOIN team t ON mt.channel_id = t.channel_id
-                WHERE mt.author_id = $1
-                """,
-                user_id,
-            )
-            return [Team(**dict(row)) for row in rows] if rows else []
+            rows = await conn.fetch(GET_STANDUP_CHANNELS_BY_USER_ID, user_id)
+            return map_rows(Team, rows)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -143,10 +205,7 @@ class MemberRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            row = await conn.fetchrow(
-                "SELECT author_id FROM member_team WHERE author_id = $1 LIMIT 1",
-                user_id,
-            )
+            row = await conn.fetchrow(IS_USER_EXISTS, user_id)
             return bool(row)
         finally:
             if conn:
@@ -158,11 +217,7 @@ class MemberRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            await conn.execute(
-                "UPDATE member_team SET server_name = $1 WHERE author_id = $2",
-                new_display_name,
-                user_id,
-            )
+            await conn.execute(UPDATE_MEMBER_DISPLAY_NAME, new_display_name, user_id)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
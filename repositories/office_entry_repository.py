@@ -1,12 +1,44 @@
 from datetime import date
 from typing import TYPE_CHECKING
 
+from db.row_mapping import map_row
+from db.statements import statements
 from models import DailyOfficeEntrySummary, OfficeEntry
 
 if TYPE_CHECKING:
     from db.asyncpg_client import AsyncpgClient
 
 
+INSERT_OFFICE_ENTRY = statements.register(
+    "office_entry.insert_office_entry",
+    """
+    INSERT INTO office_entries (author_id, message_id, date, created_at)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (author_id, date) DO NOTHING
+    """,
+)
+
+GET_DAILY_OFFICE_ENTRIES = statements.register(
+    "office_entry.get_daily_office_entries",
+    """
+    SELECT author_id, server_name, team_name
+    FROM public.daily_member_status
+    WHERE date = $1 AND office_entry
+    ORDER BY team_name asc, server_name asc;
+    """,
+)
+
+GET_OFFICE_ENTRY_BY_AUTHOR_ID_AND_DATE = statements.register(
+    "office_entry.get_office_entry_by_author_id_and_date",
+    """
+    SELECT author_id, message_id, date, created_at
+    FROM office_entries
+    WHERE author_id = $1 AND date = $2
+    LIMIT 1
+    """,
+)
+
+
 class OfficeEntryRepository:
     def __init__(self, asyncpg_client: "AsyncpgClient"):
         self.asyncpg_client = asyncpg_client
@@ -16,11 +48,7 @@ class OfficeEntryRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             await conn.execute(
-                """
-                INSERT INTO office_entries (author_id, message_id, date, created_at)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (author_id, date) DO NOTHING
-                """,
+                INSERT_OFFICE_ENTRY,
                 entry.author_id,
                 entry.message_id,
                 entry.date,
@@ -36,20 +64,7 @@ class OfficeEntryRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            rows = await conn.fetch(
-                """
-                SELECT
-                    oe.author_id,
-                    mt.server_name,
-                    t.team_name
-                FROM public.office_entries oe
-                JOIN public.member_team mt on oe.author_id = mt.author_id
-                JOIN public.team t on mt.channel_id = t.channel_id
-                WHERE oe.date = $1
-                ORDER BY t.team_name asc, mt.server_name asc;
-                """,
-                target_date,
-            )
+            rows = await conn.fetch(GET_DAILY_OFFICE_ENTRIES, target_date)
             return (
                 [DailyOfficeEntrySummary(**dict(row)) for row in rows] if rows else []
             )
@@ -64,16 +79,9 @@ class OfficeEntryRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             row = await conn.fetchrow(
-                """
-                SELECT author_id, message_id, date, created_at
-                FROM office_entries
-                WHERE author_id = $1 AND date = $2
-                LIMIT 1
-                """,
-                author_id,
-                target_date,
+                GET_OFFICE_ENTRY_BY_AUTHOR_ID_AND_DATE, author_id, target_date
             )
-            return OfficeEntry(**dict(row)) if row else None
+            return map_row(OfficeEntry, row)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
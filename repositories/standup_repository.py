@@ -1,14 +1,270 @@
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 from uuid import UUID
 from typing_extensions import Literal
 
+from db.query_stats import rows_from_status
+from db.replica import replica_safe
+from db.row_mapping import map_row, map_rows
+from db.statements import statements
 from models import StandupChannel, StandupMessage, StandupTask, UserStandupReport
+from repositories.office_entry_repository import INSERT_OFFICE_ENTRY
+from utils.standup_utils import diff_standup_tasks
 
 if TYPE_CHECKING:
     from db.asyncpg_client import AsyncpgClient
 
 
+GET_TASK_BY_ID = statements.register(
+    "standup.get_task_by_id",
+    """
+    SELECT id, message_id, author_id, message_date, task, status
+    FROM tasks
+    WHERE id = $1
+        AND message_date = (SELECT message_date FROM task_dates WHERE id = $1)
+    """,
+)
+
+UPDATE_TASK_STATUS = statements.register(
+    "standup.update_task_status",
+    """
+    UPDATE tasks SET status = $1 WHERE id = $2 AND message_date = $3
+    """,
+)
+
+GET_STANDUP_TASKS_BY_USER_AND_DATE = statements.register(
+    "standup.get_standup_tasks_by_user_and_date",
+    """
+    SELECT id, message_id, author_id, message_date, task, status
+    FROM tasks
+    WHERE author_id = $1 AND message_date >= $2 AND message_date <= $3
+    """,
+)
+
+INSERT_STANDUP_TASK = statements.register(
+    "standup.insert_standup_task",
+    """
+    INSERT INTO tasks (message_id, author_id, message_date, task)
+    VALUES ($1, $2, $3, $4)
+    """,
+)
+
+GET_STANDUP_CHANNEL_IDS = statements.register(
+    "standup.get_standup_channel_ids",
+    "SELECT channel_id FROM team ORDER BY team_name ASC",
+)
+
+GET_USERID_WROTE_STANDUP_BY_DATE = statements.register(
+    "standup.get_userid_wrote_standup_by_date",
+    """
+    SELECT author_id FROM daily_member_status
+    WHERE channel_id = $1 AND date >= $2 AND date <= $3 AND wrote_standup
+    """,
+)
+
+USERID_IN_STANDUP_CHANNEL = statements.register(
+    "standup.userid_in_standup_channel",
+    "SELECT author_id FROM member_team WHERE channel_id = $1 ORDER BY server_name ASC",
+)
+
+GET_STANDUP_CONTENT_HASH = statements.register(
+    "standup.get_standup_content_hash",
+    "SELECT content_hash FROM message WHERE message_id = $1 LIMIT 1",
+)
+
+GET_STANDUP_BY_MESSAGE_ID = statements.register(
+    "standup.get_standup_by_message_id",
+    """
+    SELECT message_id, author_id, username, servername, channel_id, content, timestamp, last_updated_at, message_date
+    FROM message
+    WHERE message_id = $1
+    """,
+)
+
+TRACK_STANDUP = statements.register(
+    "standup.track_standup",
+    """
+    INSERT INTO message (message_id, author_id, username, servername, channel_id, content, timestamp, last_updated_at, message_date)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    ON CONFLICT (message_id, author_id, message_date) DO UPDATE
+    SET username = EXCLUDED.username, servername = EXCLUDED.servername, content = EXCLUDED.content, timestamp = EXCLUDED.timestamp, last_updated_at = EXCLUDED.last_updated_at
+    """,
+)
+
+# message is partitioned by message_date (db/migations/5.sql), so a stand-up whose
+# date was edited is moved by updating it in place; tasks and the office entry
+# follow through ON UPDATE CASCADE.
+UPDATE_STANDUP = statements.register(
+    "standup.update_standup",
+    """
+    UPDATE message
+    SET username = $3, servername = $4, channel_id = $5, content = $6, timestamp = $7, last_updated_at = $8, message_date = $9
+    WHERE message_id = $1 AND author_id = $2
+    """,
+)
+
+INGEST_STANDUP_SQL = """
+    WITH upserted AS (
+        INSERT INTO message (message_id, author_id, username, servername, channel_id, content, timestamp, last_updated_at, message_date)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+        ON CONFLICT (message_id, author_id, message_date) {on_conflict}
+        RETURNING message_id, author_id, message_date
+    ),
+    inserted_tasks AS (
+        INSERT INTO tasks (message_id, author_id, message_date, task)
+        SELECT u.message_id, u.author_id, u.message_date, t.task
+        FROM upserted u
+        CROSS JOIN unnest($10::text[]) WITH ORDINALITY AS t(task, ord)
+        ORDER BY t.ord
+        RETURNING 1
+    ),
+    office_entry AS (
+        INSERT INTO office_entries (author_id, message_id, date, created_at)
+        SELECT u.author_id, u.message_id, $9, $12
+        FROM upserted u
+        WHERE $11::boolean
+        ON CONFLICT (author_id, date) DO NOTHING
+        RETURNING 1
+    )
+    SELECT
+        EXISTS (SELECT 1 FROM upserted) AS written,
+        (SELECT count(*) FROM inserted_tasks) AS tasks,
+        EXISTS (SELECT 1 FROM office_entry) AS office_entry
+"""
+
+INGEST_STANDUP = statements.register(
+    "standup.ingest_standup",
+    INGEST_STANDUP_SQL.format(
+        on_conflict="DO UPDATE SET username = EXCLUDED.username, servername = EXCLUDED.servername, content = EXCLUDED.content, timestamp = EXCLUDED.timestamp, last_updated_at = EXCLUDED.last_updated_at"
+    ),
+)
+
+INGEST_NEW_STANDUP = statements.register(
+    "standup.ingest_new_standup",
+    INGEST_STANDUP_SQL.format(on_conflict="DO NOTHING"),
+)
+
+DELETE_STANDUP_OF_OTHER_AUTHORS = statements.register(
+    "standup.delete_standup_of_other_authors",
+    "DELETE FROM message WHERE message_id = $1 AND author_id <> $2",
+)
+
+LOCK_STANDUP_TASKS = statements.register(
+    "standup.lock_standup_tasks",
+    """
+    SELECT id, task
+    FROM tasks
+    WHERE message_id = $1 AND author_id = $2 AND message_date = $3
+    FOR UPDATE
+    """,
+)
+
+UPDATE_TASK_TEXT = statements.register(
+    "standup.update_task_text",
+    "UPDATE tasks SET task = $2 WHERE id = $1 AND message_date = $3",
+)
+
+DELETE_TASKS_BY_IDS = statements.register(
+    "standup.delete_tasks_by_ids",
+    "DELETE FROM tasks WHERE id = ANY($1::uuid[]) AND message_date = $2",
+)
+
+DELETE_STALE_OFFICE_ENTRY = statements.register(
+    "standup.delete_stale_office_entry",
+    """
+    DELETE FROM office_entries
+    WHERE message_id = $1 AND author_id = $2 AND (NOT $3::boolean OR date <> $4)
+    """,
+)
+
+# The bulk paths (here and LeaveRepository.bulk_insert_leaves) work on
+# per-transaction temp tables, which do not exist when the pool prepares the
+# registry, so their staging SQL runs as plain strings.
+CREATE_STANDUP_STAGING = """
+    CREATE TEMP TABLE message_staging (
+        message_id text,
+        author_id text,
+        username text,
+        servername text,
+        channel_id text,
+        content text,
+        timestamp timestamptz,
+        last_updated_at timestamptz,
+        message_date date,
+        entry_office boolean
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE task_staging (
+        message_id text,
+        author_id text,
+        task text,
+        ord int
+    ) ON COMMIT DROP;
+"""
+
+MERGE_STANDUP_STAGING = """
+    WITH inserted AS (
+        INSERT INTO message (message_id, author_id, username, servername, channel_id, content, timestamp, last_updated_at, message_date)
+        SELECT DISTINCT ON (message_id, author_id)
+            message_id, author_id, username, servername, channel_id, content, timestamp, last_updated_at, message_date
+        FROM message_staging
+        ORDER BY message_id, author_id
+        ON CONFLICT (message_id, author_id, message_date) DO NOTHING
+        RETURNING message_id, author_id, message_date
+    ),
+    inserted_tasks AS (
+        INSERT INTO tasks (message_id, author_id, message_date, task)
+        SELECT t.message_id, t.author_id, i.message_date, t.task
+        FROM task_staging t
+        JOIN inserted i ON i.message_id = t.message_id AND i.author_id = t.author_id
+        ORDER BY t.message_id, t.author_id, t.ord
+        RETURNING 1
+    ),
+    inserted_office_entries AS (
+        INSERT INTO office_entries (author_id, message_id, date, created_at)
+        SELECT DISTINCT ON (s.author_id, s.message_date)
+            s.author_id, s.message_id, s.message_date, s.timestamp
+        FROM message_staging s
+        JOIN inserted i ON i.message_id = s.message_id AND i.author_id = s.author_id
+        WHERE s.entry_office
+        ORDER BY s.author_id, s.message_date, s.timestamp
+        ON CONFLICT (author_id, date) DO NOTHING
+        RETURNING 1
+    )
+    SELECT
+        (SELECT count(*) FROM inserted) AS messages,
+        (SELECT count(*) FROM inserted_tasks) AS tasks,
+        (SELECT count(*) FROM inserted_office_entries) AS office_entries
+"""
+
+CREATE_STANDUP_PARTITIONS = statements.register(
+    "standup.create_standup_partitions",
+    "SELECT public.create_standup_partitions($1, $2)",
+)
+
+REGIS_NEW_STANDUP_CHANNEL = statements.register(
+    "standup.regis_new_standup_channel",
+    """
+    INSERT INTO team (channel_id, team_name, server_id, server_name, timestamp)
+    VALUES ($1, $2, $3, $4, $5)
+    ON CONFLICT (channel_id) DO NOTHING
+    """,
+)
+
+DELETE_STANDUP_BY_MESSAGE_ID = statements.register(
+    "standup.delete_standup_by_message_id",
+    "DELETE FROM message WHERE message_id = $1",
+)
+
+GET_STANDUPS_BY_USER_AND_DATE = statements.register(
+    "standup.get_standups_by_user_and_date",
+    """
+    SELECT content, message_date, timestamp, last_updated_at FROM message
+    WHERE author_id = $1 AND message_date >= $2 AND message_date <= $3
+    ORDER BY timestamp ASC
+    """,
+)
+
+
 class StandupRepository:
 
     def __init__(self, asyncpg_client: "AsyncpgClient"):
@@ -19,21 +275,17 @@ class StandupRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            row = await conn.fetchrow(
-                """
-                SELECT id, message_id, author_id, task, status
-                FROM tasks
-                WHERE id = $1
-                """,
-                str(task_id),
-            )
-            return StandupTask(**dict(row)) if row else None
+            row = await conn.fetchrow(GET_TASK_BY_ID, str(task_id))
+            return map_row(StandupTask, row)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
     async def update_task_status(
-        self, task_id: UUID, status: Literal["todo", "in_progress", "done"]
+        self,
+        task_id: UUID,
+        message_date: date,
+        status: Literal["todo", "in_progress", "done"],
     ) -> None:
         if status not in ["todo", "in_progress", "done"]:
             raise ValueError(f"Invalid task status: {status}")
@@ -41,49 +293,33 @@ class StandupRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            await conn.execute(
-                """
-                UPDATE tasks SET status = $1 WHERE id = $2
-                """,
-                status,
-                task_id,
-            )
+            await conn.execute(UPDATE_TASK_STATUS, status, task_id, message_date)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    @replica_safe
     async def get_standup_tasks_by_user_and_date(
         self, author_id: str, from_date: date, to_date: date) -> list[StandupTask]:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
             rows = await conn.fetch(
-                """
-                SELECT t.id, t.message_id, t.author_id, t.task , t.status
-                FROM tasks t
-                JOIN message m ON t.message_id = m.message_id AND t.author_id = m.author_id
-                WHERE t.author_id = $1 AND m.message_date >= $2 AND m.message_date <= $3
-                """,
-                author_id,
-                from_date,
-                to_date,
+                GET_STANDUP_TASKS_BY_USER_AND_DATE, author_id, from_date, to_date
             )
-            return [StandupTask(**dict(row)) for row in rows] if rows else []
+            return map_rows(StandupTask, rows)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
     async def insert_standup_tasks(
-        self, message_id: str, author_id: str, tasks: list[str]) -> None:
+        self, message_id: str, author_id: str, message_date: date, tasks: list[str]) -> None:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
             await conn.executemany(
-                """
-                INSERT INTO tasks (message_id, author_id, task)
-                VALUES ($1, $2, $3)
-                """,
-                [(message_id, author_id, task.strip()) for task in tasks],
+                INSERT_STANDUP_TASK,
+                [(message_id, author_id, message_date, task.strip()) for task in tasks],
             )
         finally:
             if conn:
@@ -93,9 +329,7 @@ class StandupRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            rows = await conn.fetch(
-                "SELECT channel_id FROM team ORDER BY team_name ASC"
-            )
+            rows = await conn.fetch(GET_STANDUP_CHANNEL_IDS)
             return [dict(row) for row in rows] if rows else []
         finally:
             if conn:
@@ -108,13 +342,7 @@ class StandupRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             rows = await conn.fetch(
-                """
-                SELECT author_id FROM message
-                WHERE channel_id = $1 AND message_date >= $2 AND message_date <= $3
-                """,
-                str(channel_id),
-                from_date,
-                to_data,
+                GET_USERID_WROTE_STANDUP_BY_DATE, str(channel_id), from_date, to_data
             )
             return [dict(row) for row in rows] if rows else []
         finally:
@@ -125,30 +353,29 @@ class StandupRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            rows = await conn.fetch(
-                "SELECT author_id FROM member_team WHERE channel_id = $1 ORDER BY server_name ASC",
-                str(channel_id),
-            )
+            rows = await conn.fetch(USERID_IN_STANDUP_CHANNEL, str(channel_id))
             return [dict(row) for row in rows] if rows else []
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    async def get_standup_content_hash(self, message_id: str) -> Optional[str]:
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            return await conn.fetchval(GET_STANDUP_CONTENT_HASH, message_id)
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
     async def get_standup_by_message_id(
         self, message_id: str
     ) -> Optional[StandupMessage]:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            row = await conn.fetchrow(
-                """
-                SELECT message_id, author_id, username, servername, channel_id, content, timestamp, last_updated_at, message_date
-                FROM message
-                WHERE message_id = $1
-                """,
-                message_id,
-            )
-            return StandupMessage(**dict(row)) if row else None
+            row = await conn.fetchrow(GET_STANDUP_BY_MESSAGE_ID, message_id)
+            return map_row(StandupMessage, row)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -158,12 +385,7 @@ class StandupRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             await conn.execute(
-                """
-                INSERT INTO message (message_id, author_id, username, servername, channel_id, content, timestamp, last_updated_at, message_date)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                ON CONFLICT (message_id, author_id) DO UPDATE
-                SET username = EXCLUDED.username, servername = EXCLUDED.servername, content = EXCLUDED.content, timestamp = EXCLUDED.timestamp, last_updated_at = EXCLUDED.last_updated_at, message_date = EXCLUDED.message_date
-                """,
+                TRACK_STANDUP,
                 standup_message.message_id,
                 standup_message.author_id,
                 standup_message.username,
@@ -178,16 +400,202 @@ class StandupRepository:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    async def ingest_standup(
+        self,
+        standup_message: StandupMessage,
+        tasks: list[str],
+        entry_office: bool,
+        office_entry_created_at: datetime,
+        skip_if_exists: bool = False,
+    ) -> bool:
+        """Upsert the message, its tasks and the office entry in one statement.
+
+        Returns False when ``skip_if_exists`` is set and the message was already
+        tracked, in which case nothing is written.
+        """
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            row = await conn.fetchrow(
+                INGEST_NEW_STANDUP if skip_if_exists else INGEST_STANDUP,
+                standup_message.message_id,
+                standup_message.author_id,
+                standup_message.username,
+                standup_message.servername,
+                standup_message.channel_id,
+                standup_message.content,
+                standup_message.timestamp,
+                standup_message.last_updated_at,
+                standup_message.message_date,
+                [task.strip() for task in tasks],
+                entry_office,
+                office_entry_created_at,
+            )
+            return bool(row and row["written"])
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
+    async def sync_standup(
+        self,
+        standup_message: StandupMessage,
+        tasks: list[str],
+        entry_office: bool,
+        office_entry_created_at: datetime,
+    ) -> tuple[int, int, int]:
+        """Bring an edited stand-up in line with its new content without recreating it.
+
+        The message row is updated in place, only the tasks that changed are
+        touched (reworded tasks keep their id and status) and the office entry
+        follows the new content. Returns ``(updated, deleted, inserted)`` task counts.
+        """
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            async with conn.transaction():
+                await conn.execute(
+                    DELETE_STANDUP_OF_OTHER_AUTHORS,
+                    standup_message.message_id,
+                    standup_message.author_id,
+                )
+                # Before the message moves: an entry left on the old date would be
+                # cascaded onto the new one and could collide with (author_id, date).
+                await conn.execute(
+                    DELETE_STALE_OFFICE_ENTRY,
+                    standup_message.message_id,
+                    standup_message.author_id,
+                    entry_office,
+                    standup_message.message_date,
+                )
+                message_values = (
+                    standup_message.message_id,
+                    standup_message.author_id,
+                    standup_message.username,
+                    standup_message.servername,
+                    standup_message.channel_id,
+                    standup_message.content,
+                    standup_message.timestamp,
+                    standup_message.last_updated_at,
+                    standup_message.message_date,
+                )
+                status = await conn.execute(UPDATE_STANDUP, *message_values)
+                if rows_from_status(status) == 0:
+                    await conn.execute(TRACK_STANDUP, *message_values)
+
+                rows = await conn.fetch(
+                    LOCK_STANDUP_TASKS,
+                    standup_message.message_id,
+                    standup_message.author_id,
+                    standup_message.message_date,
+                )
+                updates, deletes, inserts = diff_standup_tasks(
+                    [(row["id"], row["task"]) for row in rows], tasks
+                )
+                if updates:
+                    await conn.executemany(
+                        UPDATE_TASK_TEXT,
+                        [
+                            (task_id, task, standup_message.message_date)
+                            for task_id, task in updates
+                        ],
+                    )
+                if deletes:
+                    await conn.execute(
+                        DELETE_TASKS_BY_IDS, deletes, standup_message.message_date
+                    )
+                if inserts:
+                    await conn.executemany(
+                        INSERT_STANDUP_TASK,
+                        [
+                            (
+                                standup_message.message_id,
+                                standup_message.author_id,
+                                standup_message.message_date,
+                                task,
+                            )
+                            for task in inserts
+                        ],
+                    )
+
+                if entry_office:
+                    await conn.execute(
+                        INSERT_OFFICE_ENTRY,
+                        standup_message.author_id,
+                        standup_message.message_id,
+                        standup_message.message_date,
+                        office_entry_created_at,
+                    )
+
+            return len(updates), len(deletes), len(inserts)
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
+    async def bulk_ingest_standups(
+        self,
+        standups: list[tuple[StandupMessage, list[str], bool]],
+    ) -> tuple[int, int, int]:
+        """Backfill ``(message, tasks, entry_office)`` triples with COPY and one set-based merge.
+
+        Messages that are already tracked are left untouched, so a backfill can be
+        re-run safely. Office entries are stamped with the message time. Returns the
+        number of messages, tasks and office entries written.
+        """
+        if not standups:
+            return 0, 0, 0
+
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            async with conn.transaction():
+                await conn.execute(CREATE_STANDUP_STAGING)
+                await conn.copy_records_to_table(
+                    "message_staging",
+                    records=[
+                        (
+                            message.message_id,
+                            message.author_id,
+                            message.username,
+                            message.servername,
+                            message.channel_id,
+                            message.content,
+                            message.timestamp,
+                            message.last_updated_at,
+                            message.message_date,
+                            entry_office,
+                        )
+                        for message, _, entry_office in standups
+                    ],
+                )
+                await conn.copy_records_to_table(
+                    "task_staging",
+                    records=[
+                        (message.message_id, message.author_id, task.strip(), position)
+                        for message, tasks, _ in standups
+                        for position, task in enumerate(tasks)
+                    ],
+                )
+                row = await conn.fetchrow(MERGE_STANDUP_STAGING)
+            return row["messages"], row["tasks"], row["office_entries"]
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
+    async def create_standup_partitions(self, from_date: date, to_date: date) -> int:
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            return await conn.fetchval(CREATE_STANDUP_PARTITIONS, from_date, to_date)
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
     async def regis_new_standup_channel(self, standup_channel: StandupChannel) -> None:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
             await conn.execute(
-                """
-                INSERT INTO team (channel_id, team_name, server_id, server_name, timestamp)
-                VALUES ($1, $2, $3, $4, $5)
-                ON CONFLICT (channel_id) DO NOTHING
-                """,
+                REGIS_NEW_STANDUP_CHANNEL,
                 standup_channel.channel_id,
                 standup_channel.team_name,
                 standup_channel.server_id,
@@ -202,13 +610,12 @@ class StandupRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            await conn.execute(
-                "DELETE FROM message WHERE message_id = $1", str(message_id)
-            )
+            await conn.execute(DELETE_STANDUP_BY_MESSAGE_ID, str(message_id))
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
 
+    @replica_safe
     async def get_standups_by_user_and_date(
         self, user_id: str, from_date: date, to_date: date
     ) -> list[UserStandupReport]:
@@ -216,16 +623,29 @@ class StandupRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             rows = await conn.fetch(
-                """
-                SELECT content, message_date, timestamp, last_updated_at FROM message
-                WHERE author_id = $1 AND message_date >= $2 AND message_date <= $3
-                ORDER BY timestamp ASC
-                """,
-                user_id,
-                from_date,
-                to_date,
+                GET_STANDUPS_BY_USER_AND_DATE, user_id, from_date, to_date
             )
-            return [UserStandupReport(**dict(row)) for row in rows] if rows else []
+            return map_rows(UserStandupReport, rows)
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
+    @replica_safe
+    async def iter_standups_by_user_and_date(
+        self, user_id: str, from_date: date, to_date: date
+    ) -> AsyncIterator[UserStandupReport]:
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            async with conn.transaction(readonly=True):
+                async for row in conn.stream(
+                    GET_STANDUPS_BY_USER_AND_DATE,
+                    user_id,
+                    from_date,
+                    to_date,
+                    prefetch=self.asyncpg_client.cursor_prefetch,
+                ):
+                    yield map_row(UserStandupReport, row)
         finally:
             if conn:
                 await self.asyncpg_client.release_connection(conn)
@@ -0,0 +1,63 @@
+from datetime import date
+from typing import TYPE_CHECKING
+
+from db.row_mapping import map_rows
+from db.statements import statements
+from models import DailySummaryMessage
+
+if TYPE_CHECKING:
+    from db.asyncpg_client import AsyncpgClient
+
+
+GET_SUMMARY_MESSAGES_SINCE = statements.register(
+    "summary_message.get_summary_messages_since",
+    """
+    SELECT summary_kind, date, channel_id, message_id
+    FROM daily_summary_message
+    WHERE date >= $1
+    """,
+)
+
+UPSERT_SUMMARY_MESSAGE = statements.register(
+    "summary_message.upsert_summary_message",
+    """
+    INSERT INTO daily_summary_message (summary_kind, date, channel_id, message_id, created_at)
+    VALUES ($1, $2, $3, $4, NOW())
+    ON CONFLICT (summary_kind, date) DO UPDATE
+    SET channel_id = EXCLUDED.channel_id, message_id = EXCLUDED.message_id, created_at = EXCLUDED.created_at
+    """,
+)
+
+
+class SummaryMessageRepository:
+    def __init__(self, asyncpg_client: "AsyncpgClient"):
+        self.asyncpg_client = asyncpg_client
+
+    async def get_summary_messages_since(
+        self, from_date: date
+    ) -> list[DailySummaryMessage]:
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            rows = await conn.fetch(GET_SUMMARY_MESSAGES_SINCE, from_date)
+            return map_rows(DailySummaryMessage, rows)
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
+
+    async def upsert_summary_message(
+        self, summary: DailySummaryMessage
+    ) -> None:
+        conn = None
+        try:
+            conn = await self.asyncpg_client.get_connection()
+            await conn.execute(
+                UPSERT_SUMMARY_MESSAGE,
+                summary.summary_kind,
+                summary.date,
+                summary.channel_id,
+                summary.message_id,
+            )
+        finally:
+            if conn:
+                await self.asyncpg_client.release_connection(conn)
@@ -2,12 +2,99 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING
 from typing_extensions import Literal
 
+from db.statements import statements
 from models import DailyVoiceAttendance
 
 if TYPE_CHECKING:
     from db.asyncpg_client import AsyncpgClient
 
 
+GET_DAILY_ATTENDANCE_SUMMARY_BY_CHANNEL_ID_AND_DATE = statements.register(
+    "voice_attendance.get_daily_attendance_summary_by_channel_id_and_date",
+    """
+    WITH joined AS (
+        SELECT
+            author_id,
+            date,
+            event_type,
+            event_time AT TIME ZONE 'Asia/Bangkok' AS local_time,
+            LEAD(event_time) OVER (PARTITION BY author_id, date ORDER BY event_time) AS next_time_utc,
+            LEAD(event_type) OVER (PARTITION BY author_id, date ORDER BY event_time) AS next_type
+        FROM attendance_activity
+        WHERE date = $2::date
+    ),
+    intervals AS (
+        SELECT
+            author_id,
+            date,
+            local_time AS join_time,
+            CASE
+                WHEN next_type = 'leave' THEN (next_time_utc AT TIME ZONE 'Asia/Bangkok')
+                WHEN next_time_utc IS NULL THEN (now() AT TIME ZONE 'Asia/Bangkok')
+                ELSE NULL
+            END AS leave_time
+        FROM joined
+        WHERE event_type = 'join'
+        AND (next_type = 'leave' OR next_time_utc IS NULL)
+    ),
+    users AS (
+        SELECT author_id, server_name
+        FROM member_team
+        WHERE channel_id = $1
+    )
+    SELECT
+        u.author_id,
+        u.server_name,
+        CASE
+            WHEN EXTRACT(DOW FROM $2::date) IN (0,6) THEN 'weekend'
+            WHEN EXISTS (SELECT 1 FROM company_holidays h WHERE h.holiday_date = $2::date) THEN 'holiday'
+            WHEN EXISTS (
+                SELECT 1 FROM attendance a
+                WHERE a.author_id = u.author_id
+                AND a.absent_date = $2::date
+                AND (a.partial_leave = 'morning' OR a.partial_leave IS NULL)
+            ) THEN 'leave'
+            WHEN EXISTS (
+                SELECT 1 FROM intervals iv
+                WHERE iv.author_id = u.author_id
+                AND iv.date = $2::date
+                AND iv.join_time >= ($2::date + interval '8 hours')
+                AND iv.join_time <=  ($2::date + interval '9 hours')
+                AND iv.leave_time > ($2::date + interval '9 hours')
+            ) THEN 'on_time'
+            WHEN EXISTS (
+                SELECT 1 FROM intervals iv
+                WHERE iv.author_id = u.author_id
+                AND iv.date = $2::date
+                AND iv.join_time > ($2::date + interval '9 hours')
+                AND iv.join_time <  ($2::date + interval '9 hours 30 minutes')
+            ) THEN 'late'
+            ELSE 'absent'
+        END AS status
+    FROM users u
+    ORDER BY status DESC, u.server_name;
+    """,
+)
+
+INSERT_VOICE_LOG = statements.register(
+    "voice_attendance.insert_voice_log",
+    """
+    INSERT INTO attendance_activity (author_id, event_time, event_type, date)
+    VALUES ($1, $2, $3, $4)
+    """,
+)
+
+GET_LESTED_EVENT_TYPE_BY_AUTHOR_ID = statements.register(
+    "voice_attendance.get_lested_event_type_by_author_id",
+    """
+    SELECT event_type FROM attendance_activity
+    WHERE author_id = $1
+    ORDER BY event_time DESC
+    LIMIT 1
+    """,
+)
+
+
 class VoiceAttendanceRepository:
     def __init__(self, asyncpg_client: "AsyncpgClient"):
         self.asyncpg_client = asyncpg_client
@@ -19,69 +106,7 @@ class VoiceAttendanceRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             rows = await conn.fetch(
-                """
-                WITH joined AS (
-                    SELECT
-                        author_id,
-                        date,
-                        event_type,
-                        event_time AT TIME ZONE 'Asia/Bangkok' AS local_time,
-                        LEAD(event_time) OVER (PARTITION BY author_id, date ORDER BY event_time) AS next_time_utc,
-                        LEAD(event_type) OVER (PARTITION BY author_id, date ORDER BY event_time) AS next_type
-                    FROM attendance_activity
-                    WHERE date = $2::date
-                ),
-                intervals AS (
-                    SELECT
-                        author_id,
-                        date,
-                        local_time AS join_time,
-                        CASE
-                            WHEN next_type = 'leave' THEN (next_time_utc AT TIME ZONE 'Asia/Bangkok')
-                            WHEN next_time_utc IS NULL THEN (now() AT TIME ZONE 'Asia/Bangkok')
-                            ELSE NULL
-                        END AS leave_time
-                    FROM joined
-                    WHERE event_type = 'join'
-                    AND (next_type = 'leave' OR next_time_utc IS NULL)
-                ),
-                users AS (
-                    SELECT author_id, server_name
-                    FROM member_team
-                    WHERE channel_id = $1
-                )
-                SELECT
-                    u.author_id,
-                    u.server_name,
-                    CASE
-                        WHEN EXTRACT(DOW FROM $2::date) IN (0,6) THEN 'weekend'
-                        WHEN EXISTS (SELECT 1 FROM company_holidays h WHERE h.holiday_date = $2::date) THEN 'holiday'
-                        WHEN EXISTS (
-                            SELECT 1 FROM attendance a
-                            WHERE a.author_id = u.author_id
-                            AND a.absent_date = $2::date
-                            AND (a.partial_leave = 'morning' OR a.partial_leave IS NULL)
-                        ) THEN 'leave'
-                        WHEN EXISTS (
-                            SELECT 1 FROM intervals iv
-                            WHERE iv.author_id = u.author_id
-                            AND iv.date = $2::date
-                            AND iv.join_time >= ($2::date + interval '8 hours')
-                            AND iv.join_time <=  ($2::date + interval '9 hours')
-                            AND iv.leave_time > ($2::date + interval '9 hours')
-                        ) THEN 'on_time'
-                        WHEN EXISTS (
-                            SELECT 1 FROM intervals iv
-                            WHERE iv.author_id = u.author_id
-                            AND iv.date = $2::date
-                            AND iv.join_time > ($2::date + interval '9 hours')
-                            AND iv.join_time <  ($2::date + interval '9 hours 30 minutes')
-                        ) THEN 'late'
-                        ELSE 'absent'
-                    END AS status
-                FROM users u
-                ORDER BY status DESC, u.server_name;
-                """,
+                GET_DAILY_ATTENDANCE_SUMMARY_BY_CHANNEL_ID_AND_DATE,
                 str(channel_id),
                 date,
             )
@@ -97,14 +122,7 @@ class VoiceAttendanceRepository:
         try:
             conn = await self.asyncpg_client.get_connection()
             await conn.execute(
-                """
-                INSERT INTO attendance_activity (author_id, event_time, event_type, date)
-                VALUES ($1, $2, $3, $4)
-                """,
-                author_id,
-                event_time,
-                event_type,
-                date,
+                INSERT_VOICE_LOG, author_id, event_time, event_type, date
             )
         finally:
             if conn:
@@ -116,15 +134,7 @@ class VoiceAttendanceRepository:
         conn = None
         try:
             conn = await self.asyncpg_client.get_connection()
-            row = await conn.fetchrow(
-                """
-                SELECT event_type FROM attendance_activity
-                WHERE author_id = $1
-                ORDER BY event_time DESC
-                LIMIT 1
-                """,
-                str(author_id),
-            )
+            row = await conn.fetchrow(GET_LESTED_EVENT_TYPE_BY_AUTHOR_ID, str(author_id))
             return row["event_type"] if row else None
         finally:
             if conn:
@@ -4,6 +4,7 @@ import discord
 
 from config import BOT_PANEL_IMG_URL
 from models import BotPanel
+from utils.message_utils import edit_if_changed
 from views.bot_panel_view import BotPanelView
 
 if TYPE_CHECKING:
@@ -24,7 +25,7 @@ class BotPanelService:
     async def delete_bot_panel(self) -> None:
         bot_panel = await self.botPanelRepository.get_bot_panel()
         if bot_panel:
-            channel = await self.client.fetch_channel(bot_panel.channel_id)
+            channel = await self.client.channel_resolver.resolve(bot_panel.channel_id)
             if channel and isinstance(channel, discord.TextChannel):
                 try:
                     message = await channel.fetch_message(bot_panel.message_id)
@@ -103,22 +104,19 @@ class BotPanelService:
             print("Bot panel does not exist. Cannot refresh.")
             return
 
-        channel = await self.client.fetch_channel(bot_panel.channel_id)
+        channel = await self.client.channel_resolver.resolve(bot_panel.channel_id)
         if not channel or not isinstance(channel, discord.TextChannel):
             await self.delete_bot_panel()
             return
 
+        # Edited through a partial message: an unchanged panel (same embed and
+        # same button custom_ids) costs no REST call at all, and a deleted one
+        # surfaces as NotFound from the edit.
+        message = channel.get_partial_message(bot_panel.message_id)
+        embed = self.get_bot_panel_embed(botAlive=botAlive)
         try:
-            message = await channel.fetch_message(bot_panel.message_id)
+            await edit_if_changed(message, embed, view=BotPanelView(self.client))
         except discord.NotFound:
             await self.delete_bot_panel()
-            return
-        except Exception as e:
-            print(f"Failed to fetch bot panel message: {e}")
-            return
-
-        embed = self.get_bot_panel_embed(botAlive=botAlive)
-        try:
-            await message.edit(embed=embed, view=BotPanelView(self.client))
         except Exception as e:
             print(f"Failed to edit bot panel message: {e}")
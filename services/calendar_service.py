@@ -0,0 +1,140 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Collection
+
+from utils.datetime_utils import get_date_now
+
+if TYPE_CHECKING:
+    from repositories.company_repository import CompanyRepository
+
+# company_holidays is cached for this many whole years around the current one.
+CALENDAR_YEARS_BEHIND = 2
+CALENDAR_YEARS_AHEAD = 1
+
+
+class CalendarService:
+    """Working days (Mon-Fri, not a company holiday) answered from memory.
+
+    ``refresh`` loads the holidays of the window and precomputes the sorted
+    working days plus, for every day of the window, how many working days
+    precede it. Lookups are then O(1) or a bisect. ``is_working_day`` and
+    ``previous_working_day`` retry ``refresh`` when the window is missing or
+    stale (e.g. the startup load failed) and ask the database if it still does
+    not cover the date, so a failed load never turns a holiday into a working
+    day.
+    """
+
+    def __init__(self, company_repository: "CompanyRepository"):
+        self.company_repository = company_repository
+        self.loaded = False
+        self._start = date.min
+        self._end = date.min
+        self._holidays: set[date] = set()
+        self._working_days: list[date] = []
+        self._working_before: list[int] = [0]
+
+    async def refresh(self, today: date | None = None) -> None:
+        today = today or get_date_now()
+        from_year = max(today.year - CALENDAR_YEARS_BEHIND, 1)
+        to_year = today.year + CALENDAR_YEARS_AHEAD
+        holidays = await self.company_repository.get_holiday_date_by_year_primary(
+            from_year, to_year
+        )
+        self._build(date(from_year, 1, 1), date(to_year, 12, 31), holidays)
+
+    def _build(self, start: date, end: date, holidays: set[date]) -> None:
+        working_days: list[date] = []
+        working_before: list[int] = []
+        day = start
+        while day <= end:
+            working_before.append(len(working_days))
+            if day.weekday() < 5 and day not in holidays:
+                working_days.append(day)
+            day += timedelta(days=1)
+        working_before.append(len(working_days))
+
+        self._start, self._end = start, end
+        self._holidays = holidays
+        self._working_days = working_days
+        self._working_before = working_before
+        self.loaded = True
+
+    def covers(self, from_date: date, to_date: date) -> bool:
+        return self.loaded and self._start <= from_date and to_date <= self._end
+
+    async def ensure_covers(self, from_date: date, to_date: date) -> bool:
+        """``covers``, after reloading the window if it is missing or no longer holds today."""
+        if self.covers(from_date, to_date):
+            return True
+        today = get_date_now()
+        if not self.covers(today, today):
+            try:
+                await self.refresh(today)
+            except Exception as e:
+                print(f"Error refreshing company calendar: {e}")
+        return self.covers(from_date, to_date)
+
+    def _in_window(self, day: date) -> bool:
+        if self.covers(day, day):
+            return True
+        print(f"Calendar has no holidays for {day}, counting weekdays only.")
+        return False
+
+    async def is_working_day(self, day: date) -> bool:
+        if day.weekday() >= 5:
+            return False
+        if await self.ensure_covers(day, day):
+            return day not in self._holidays
+        holiday = await self.company_repository.get_holiday_date_by_date(day)
+        return holiday is None
+
+    async def previous_working_day(
+        self, day: date, n: int = 1, skip: Collection[date] = ()
+    ) -> date:
+        """The ``n``-th working day before ``day`` (exclusive), also passing over ``skip``."""
+        if not await self.ensure_covers(day, day):
+            holidays = await self.company_repository.get_holiday_date_by_year_primary(
+                max(day.year - 1, 1), day.year
+            )
+            return _previous_weekday(day, n, holidays.union(skip))
+
+        index = self._working_before[(day - self._start).days]
+        while index > 0:
+            index -= 1
+            candidate = self._working_days[index]
+            if candidate in skip:
+                continue
+            n -= 1
+            if n == 0:
+                return candidate
+        return _previous_weekday(self._start, n, skip)
+
+    def working_days_in(self, from_date: date, to_date: date) -> list[date]:
+        """Working days in ``[from_date, to_date]``, in order."""
+        if not (self._in_window(from_date) and self._in_window(to_date)):
+            return [
+                from_date + timedelta(days=i)
+                for i in range((to_date - from_date).days + 1)
+                if (from_date + timedelta(days=i)).weekday() < 5
+            ]
+        return self._working_days[
+            bisect_left(self._working_days, from_date) : bisect_right(
+                self._working_days, to_date
+            )
+        ]
+
+    def format_status(self) -> str:
+        if not self.loaded:
+            return "Calendar: not loaded"
+        return (
+            f"Calendar: {self._start}..{self._end} holidays={len(self._holidays)}"
+            f" working_days={len(self._working_days)}"
+        )
+
+
+def _previous_weekday(day: date, n: int, skip: Collection[date]) -> date:
+    while n > 0:
+        day -= timedelta(days=1)
+        if day.weekday() < 5 and day not in skip:
+            n -= 1
+    return day
@@ -4,10 +4,18 @@ from typing import TYPE_CHECKING, Optional
 
 import discord
 
-from config import LEAVE_TYPE_MAP, PARTIAL_LEAVE_MAP
+from config import (
+    LEAVE_TYPE_MAP,
+    PARTIAL_LEAVE_MAP,
+    SUMMARY_MIN_EDIT_INTERVAL_SECONDS,
+    SUMMARY_REFRESH_DELAY_SECONDS,
+)
+from core.coalescing_refresher import CoalescingRefresher
 from datacache import DataCache
 from models import DailyLeaveSummary, LeaveByDateChannel, LeaveInfo, LeaveRequest
 from utils.datetime_utils import get_date_now, get_datetime_now
+from utils.message_utils import edit_if_changed
+from utils.string_utils import content_fingerprint
 
 if TYPE_CHECKING:
     from core.custom_bot import CustomBot
@@ -25,6 +33,12 @@ class LeaveService:
         self.leave_repository = leave_repository
         self.gemini_service = gemini_service
         self.client = client
+        self.summary_refresher = CoalescingRefresher(
+            "Leave summary",
+            self.update_daily_leave_summary,
+            delay=SUMMARY_REFRESH_DELAY_SECONDS,
+            min_interval=SUMMARY_MIN_EDIT_INTERVAL_SECONDS,
+        )
 
     async def is_user_on_leave_fullday(
         self, author_id: str, date: date ) -> bool:
@@ -78,7 +92,9 @@ class LeaveService:
 
         return embed
 
-    async def track_leave(self, message: discord.Message) -> list[LeaveInfo]:
+    async def analyze_leave(
+        self, message: discord.Message
+    ) -> tuple[list[LeaveInfo], list[LeaveRequest]]:
         leave_request_analyzed = await asyncio.to_thread(
             self.gemini_service.analyze_leave_request, message.content
         )
@@ -91,8 +107,8 @@ class LeaveService:
 
         created_at = get_datetime_now()
 
-        for leave in leave_request_analyzed.leave_request:
-            leave_request = LeaveRequest(
+        leave_requests = [
+            LeaveRequest(
                 message_id=str(message.id),
                 author_id=str(message.author.id),
                 channel_id=str(message.channel.id),
@@ -102,10 +118,41 @@ class LeaveService:
                 absent_date=leave.absent_date,
                 created_at=created_at,
             )
+            for leave in leave_request_analyzed.leave_request
+        ]
+        return leave_request_analyzed.leave_request, leave_requests
 
+    async def track_leave(self, message: discord.Message) -> list[LeaveInfo]:
+        leave_info, leave_requests = await self.analyze_leave(message)
+
+        for leave_request in leave_requests:
             await self.leave_repository.insert_leave(leave_request)
 
-        return leave_request_analyzed.leave_request
+        return leave_info
+
+    async def bulk_track_leaves(
+        self, messages: list[discord.Message]
+    ) -> tuple[int, int, int]:
+        """Analyze and bulk insert leaves not tracked yet; returns (written, already_tracked, skipped)."""
+        tracked = await self.leave_repository.get_tracked_leave_message_ids(
+            [str(message.id) for message in messages]
+        )
+
+        leave_requests: list[LeaveRequest] = []
+        skipped = 0
+        for message in messages:
+            if str(message.id) in tracked:
+                continue
+            try:
+                _, requests = await self.analyze_leave(message)
+            except Exception as e:
+                print(f"Skipping leave message {message.id}: {e}")
+                skipped += 1
+                continue
+            leave_requests.extend(requests)
+
+        written = await self.leave_repository.bulk_insert_leaves(leave_requests)
+        return written, len(tracked), skipped
 
     async def send_leave_confirmation(
         self, leave_request: list[LeaveInfo], message: discord.Message
@@ -162,6 +209,13 @@ class LeaveService:
 
     #     await message.author.send(embed=embed)
 
+    async def is_leave_unchanged(self, message: discord.Message) -> bool:
+        """True when ``message`` is stored as a leave with this exact content."""
+        stored_hash = await self.leave_repository.get_leave_content_hash(
+            str(message.id)
+        )
+        return stored_hash == content_fingerprint(message.content)
+
     async def delete_leave_by_message_id(self, message_id: int) -> None:
         response = await self.leave_repository.get_leave_by_message_id(str(message_id))
         if response:
@@ -203,6 +257,12 @@ class LeaveService:
 
         await message.author.send(embed=embed)
 
+    def request_daily_leave_summary_update(self, date: Optional[date] = None) -> None:
+        """Schedule a coalesced update_daily_leave_summary; returns immediately."""
+        date = date or get_date_now()
+        if date in DataCache.daily_leave_summary:
+            self.summary_refresher.request(date)
+
     async def update_daily_leave_summary(self, date: Optional[date] = None) -> None:
         if not date:
             date = get_date_now()
@@ -214,7 +274,12 @@ class LeaveService:
         leaves = await self.get_daily_leaves(date)
         embed = await self.get_daily_leaves_embed(leaves, date)
 
-        await message.edit(embed=embed)
+        try:
+            await edit_if_changed(message, embed)
+        except discord.NotFound:
+            # Deleted by hand; the next send_leave posts and saves a new one.
+            print(f"Leave summary message for {date} not found.")
+            DataCache.daily_leave_summary.pop(date, None)
 
     async def get_leave_by_userid_and_date(
         self, user_id: int, from_date: date, to_date: date
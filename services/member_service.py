@@ -1,9 +1,14 @@
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import discord
 
-from config import RECEIVED_STANDUP_REMOVAL_NOTIFICATION_USERIDS
+from config import (
+    RECEIVED_STANDUP_REMOVAL_NOTIFICATION_USERIDS,
+    ROLE_CACHE_TTL_SECONDS,
+)
+from datacache import DataCache
 from models import MemberTeam, StandupMember
 
 if TYPE_CHECKING:
@@ -15,31 +20,63 @@ class MemberService:
     def __init__(self, member_repository: "MemberRepository", client: "CustomBot"):
         self.member_repository = member_repository
         self.client = client
+        # user_id -> (role, expires_at); role is None for users outside member_team.
+        self._role_cache: dict[str, tuple[Optional[str], float]] = {}
+        # Bumped by every invalidation so a lookup that raced one is not cached.
+        self._role_generation = 0
+
+    # Roster reads are served from DataCache.member_roster, which the writes
+    # below update write-through and member_team NOTIFYs keep in sync across
+    # instances. They fall back to the database until the roster has loaded.
 
     async def get_all_standup_members(self) -> list[MemberTeam]:
-        return await self.member_repository.get_all_standup_members()
+        roster = DataCache.member_roster
+        if not roster.loaded:
+            return await self.member_repository.get_all_standup_members()
+        return [
+            MemberTeam(author_id=author_id, server_name=server_name)
+            for author_id, server_name in roster.all_memberships()
+        ]
 
     async def get_standup_members_by_channelid(
         self, channel_id: int
     ) -> list[MemberTeam]:
-        return await self.member_repository.get_standup_members_by_channelid(
-            str(channel_id)
-        )
+        roster = DataCache.member_roster
+        if not roster.loaded:
+            return await self.member_repository.get_standup_members_by_channelid(
+                str(channel_id)
+            )
+        return [
+            MemberTeam(author_id=author_id, server_name=server_name)
+            for author_id, server_name in roster.members_of(str(channel_id))
+        ]
 
     async def is_user_added_to_standup_channel(
         self, channel_id: int, user_id: int
     ) -> bool:
+        roster = DataCache.member_roster
+        if roster.loaded:
+            return roster.is_member(str(channel_id), str(user_id))
         response = await self.member_repository.is_user_added_to_standup_channel(
             channel_id=channel_id, user_id=user_id
         )
         return response
 
     async def is_user_in_any_standup_channel(self, user_id: int) -> bool:
+        roster = DataCache.member_roster
+        if roster.loaded:
+            return roster.exists(str(user_id))
         response = await self.member_repository.get_standup_channels_by_user_id(
             str(user_id)
         )
         return bool(response)
 
+    async def is_user_exists(self, user_id: int) -> bool:
+        roster = DataCache.member_roster
+        if roster.loaded:
+            return roster.exists(str(user_id))
+        return await self.member_repository.is_user_exists(str(user_id))
+
     async def add_member_to_standup_channel(
         self, channel_id: int, user_id: int, user_name: str, created_at: datetime
     ) -> None:
@@ -56,6 +93,10 @@ class MemberService:
         )
 
         await self.member_repository.add_member_to_standup_channel(standup_member)
+        DataCache.member_roster.add(
+            standup_member.channel_id, standup_member.author_id, user_name
+        )
+        self.invalidate_role(user_id)
 
     async def remove_member_from_standup_channel(
         self, channel_id: int, user_id: int
@@ -68,11 +109,15 @@ class MemberService:
         await self.member_repository.remove_member_from_standup_channel(
             channel_id=channel_id, user_id=user_id
         )
+        DataCache.member_roster.remove(str(channel_id), str(user_id))
+        self.invalidate_role(user_id)
 
     async def remove_member_from_all_standup_channels(self, user_id: int) -> None:
         await self.member_repository.remove_member_from_all_standup_channels(
             str(user_id)
         )
+        DataCache.member_roster.remove_member(str(user_id))
+        self.invalidate_role(user_id)
 
     async def send_standup_removal_notification(
         self, member: discord.User, reason: str
@@ -138,9 +183,28 @@ class MemberService:
         except Exception as e:
             print(f"Error sending standup removal notification: {e}")
 
+    async def get_user_role(self, user_id: int) -> Optional[str]:
+        key = str(user_id)
+        cached = self._role_cache.get(key)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        generation = self._role_generation
+        role = await self.member_repository.get_user_role(key)
+        if generation == self._role_generation:
+            self._role_cache[key] = (role, time.monotonic() + ROLE_CACHE_TTL_SECONDS)
+        return role
+
+    def invalidate_role(self, user_id: Optional[int | str] = None) -> None:
+        """Forget the cached role of ``user_id``, or of everyone when omitted."""
+        self._role_generation += 1
+        if user_id is None:
+            self._role_cache.clear()
+        else:
+            self._role_cache.pop(str(user_id), None)
+
     async def is_admin(self, user_id: int) -> bool:
-        role = await self.member_repository.get_user_role(str(user_id))
-        return role == "admin"
+        return await self.get_user_role(user_id) == "admin"
 
     async def promote_user_to_admin(self, user_id: int) -> None:
         if not await self.is_user_in_any_standup_channel(user_id):
@@ -152,6 +216,7 @@ class MemberService:
             raise ValueError("User is already an admin.")
 
         await self.member_repository.update_user_role(str(user_id), "admin")
+        self.invalidate_role(user_id)
 
     async def demote_admin_to_user(self, user_id: int) -> None:
         if not await self.is_user_in_any_standup_channel(user_id):
@@ -163,11 +228,13 @@ class MemberService:
             raise ValueError("User is not an admin.")
 
         await self.member_repository.update_user_role(str(user_id), "user")
+        self.invalidate_role(user_id)
 
     async def update_member_display_name(self, user_id: int, new_display_name: str) -> None:
-        if not await self.member_repository.is_user_exists(str(user_id)):
+        if not await self.is_user_exists(user_id):
             raise ValueError(f"User with ID {user_id} does not exist.")
 
         await self.member_repository.update_member_display_name(
             str(user_id), new_display_name
         )
+        DataCache.member_roster.rename_member(str(user_id), new_display_name)
@@ -3,9 +3,12 @@ from typing import TYPE_CHECKING, Optional
 
 import discord
 
+from config import SUMMARY_MIN_EDIT_INTERVAL_SECONDS, SUMMARY_REFRESH_DELAY_SECONDS
+from core.coalescing_refresher import CoalescingRefresher
 from datacache import DataCache
 from models import DailyOfficeEntrySummary, OfficeEntry
 from utils.datetime_utils import get_date_now, get_datetime_now
+from utils.message_utils import edit_if_changed
 
 if TYPE_CHECKING:
     from repositories.member_repository import MemberRepository
@@ -20,6 +23,12 @@ class OfficeEntryService:
     ):
         self.office_entry_repository = office_entry_repository
         self.member_repository = member_repository
+        self.summary_refresher = CoalescingRefresher(
+            "Office entry summary",
+            self.update_daily_office_entry_summary,
+            delay=SUMMARY_REFRESH_DELAY_SECONDS,
+            min_interval=SUMMARY_MIN_EDIT_INTERVAL_SECONDS,
+        )
 
     async def track_office_entry(
         self, author_id: str, message_id: str, date: date
@@ -80,6 +89,14 @@ class OfficeEntryService:
         embed.set_footer(text=f"รวม {total_members} คน เข้าบริษัทวันนี้")
         return embed
 
+    def request_daily_office_entry_summary_update(
+        self, date: Optional[date] = None
+    ) -> None:
+        """Schedule a coalesced update_daily_office_entry_summary; returns immediately."""
+        date = date or get_date_now()
+        if date in DataCache.daily_office_entry_summary:
+            self.summary_refresher.request(date)
+
     async def update_daily_office_entry_summary(
         self, date: Optional[date] = None
     ) -> None:
@@ -94,4 +111,9 @@ class OfficeEntryService:
         entries = await self.get_daily_office_entries(date)
         embed = await self.get_daily_office_entries_embed(entries, date)
 
-        await message.edit(embed=embed)
+        try:
+            await edit_if_changed(message, embed)
+        except discord.NotFound:
+            # Deleted by hand; the next send_office_entry posts and saves a new one.
+            print(f"Office entry summary message for {date} not found.")
+            DataCache.daily_office_entry_summary.pop(date, None)
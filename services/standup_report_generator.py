@@ -1,5 +1,6 @@
 from datetime import datetime
 from io import BytesIO
+from typing import AsyncIterator, Optional
 
 import pandas as pd
 import pytz
@@ -8,32 +9,45 @@ from openpyxl.styles import Alignment
 from models import UserStandupReport
 from utils.standup_utils import extract_bullet_points
 
+BANGKOK_TZ = pytz.timezone("Asia/Bangkok")
+
 
 class StandupReportGenerator:
 
     def generate_report(
         self, user_name: str, month: str, standups: list[UserStandupReport]
     ) -> BytesIO:
-        data = []
-        bangkok_tz = pytz.timezone("Asia/Bangkok")
-
-        for standup in standups:
-            date_obj_bkk = standup.timestamp.astimezone(bangkok_tz)
-            datetime_formatted = date_obj_bkk.strftime("%d/%m/%Y %H:%M:%S")
-            month_formatted = date_obj_bkk.strftime("%Y-%m")
-            data.append(
-                {
-                    f"Report {month_formatted}: {user_name}": standup.message_date.strftime(
-                        "%d/%m/%Y"
-                    ),
-                    "content": "\n".join(
-                        f"- {x}" for x in extract_bullet_points(standup.content)
-                    ),
-                    "created_at": datetime_formatted,
-                    "last_updated_at": standup.last_updated_at.astimezone(bangkok_tz).strftime("%d/%m/%Y %H:%M:%S") if standup.last_updated_at else "N/A",
-                }
-            )
+        return self._write_workbook(
+            user_name,
+            month,
+            [self._report_row(user_name, standup) for standup in standups],
+        )
+
+    async def generate_report_from_stream(
+        self, user_name: str, month: str, standups: AsyncIterator[UserStandupReport]
+    ) -> Optional[BytesIO]:
+        # Only the formatted cells are kept, each model is dropped as soon as it is read.
+        data = [self._report_row(user_name, standup) async for standup in standups]
+        if not data:
+            return None
+        return self._write_workbook(user_name, month, data)
+
+    def _report_row(self, user_name: str, standup: UserStandupReport) -> dict:
+        date_obj_bkk = standup.timestamp.astimezone(BANGKOK_TZ)
+        datetime_formatted = date_obj_bkk.strftime("%d/%m/%Y %H:%M:%S")
+        month_formatted = date_obj_bkk.strftime("%Y-%m")
+        return {
+            f"Report {month_formatted}: {user_name}": standup.message_date.strftime(
+                "%d/%m/%Y"
+            ),
+            "content": "\n".join(
+                f"- {x}" for x in extract_bullet_points(standup.content)
+            ),
+            "created_at": datetime_formatted,
+            "last_updated_at": standup.last_updated_at.astimezone(BANGKOK_TZ).strftime("%d/%m/%Y %H:%M:%S") if standup.last_updated_at else "N/A",
+        }
 
+    def _write_workbook(self, user_name: str, month: str, data: list[dict]) -> BytesIO:
         df = pd.DataFrame(data)
 
         buffer = BytesIO()
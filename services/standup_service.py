@@ -1,7 +1,7 @@
 import math
 import re
-from datetime import date, datetime
-from typing import TYPE_CHECKING, Literal, Optional
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, AsyncIterator, Literal, Optional
 from uuid import UUID
 
 import discord
@@ -11,8 +11,10 @@ from config import (
     IGNORED_BOT_IDS,
     LEAVE_TYPE_MAP,
     PARTIAL_LEAVE_MAP,
+    STANDUP_PARTITION_MONTHS_AHEAD,
     TASK_STATUS_MAP,
 )
+from datacache import DataCache
 from models import (
     LeaveByDateChannel,
     LeaveRequest,
@@ -28,12 +30,14 @@ from utils.datetime_utils import (
     compare_date_with_today,
     convert_to_bangkok,
     get_date_now,
-    get_previous_weekdays,
+    get_datetime_now,
 )
 from utils.standup_utils import extract_bullet_points
+from utils.string_utils import content_fingerprint
 
 if TYPE_CHECKING:
     from repositories.standup_repository import StandupRepository
+    from services.calendar_service import CalendarService
     from services.leave_service import LeaveService
     from services.member_service import MemberService
     from services.office_entry_service import OfficeEntryService
@@ -47,11 +51,13 @@ class StandupService:
         memberService: "MemberService",
         leaveService: "LeaveService",
         officeEntryService: "OfficeEntryService",
+        calendarService: "CalendarService",
     ):
         self.standupRepository = standupRepository
         self.memberService = memberService
         self.leaveService = leaveService
         self.officeEntryService = officeEntryService
+        self.calendarService = calendarService
 
     async def get_task_by_id(self, task_id: UUID) -> Optional[StandupTask]:
         response = await self.standupRepository.get_task_by_id(task_id)
@@ -60,11 +66,15 @@ class StandupService:
         return None
 
     async def update_task_status(
-        self, task_id: UUID, status: Literal["todo", "in_progress", "done"]) -> None:
+        self,
+        task_id: UUID,
+        message_date: date,
+        status: Literal["todo", "in_progress", "done"],
+    ) -> None:
         if status not in TASK_STATUS_MAP:
             raise ValueError(f"Invalid task status: {status}")
 
-        await self.standupRepository.update_task_status(task_id, status)
+        await self.standupRepository.update_task_status(task_id, message_date, status)
 
     async def get_standup_tasks_by_user_and_date(self, author_id: str, from_date: date, to_date: date) -> list[StandupTask]:
         response = await self.standupRepository.get_standup_tasks_by_user_and_date(
@@ -99,6 +109,11 @@ class StandupService:
         ]
 
     async def userid_in_standup_channel(self, channel_id: int) -> list[int]:
+        roster = DataCache.member_roster
+        if roster.loaded:
+            return [
+                int(author_id) for author_id, _ in roster.members_of(str(channel_id))
+            ]
         response = await self.standupRepository.userid_in_standup_channel(channel_id)
         return [
             int(message["author_id"])
@@ -106,21 +121,11 @@ class StandupService:
             if "author_id" in message and message["author_id"]
         ]
 
-    async def track_standup(
+    def parse_standup_message(
         self,
         message: discord.Message,
-        check_is_exist: bool = True,
         bypass_check_date: bool = False,
-    ) -> Literal["today", "future", "past"]:
-        if check_is_exist:
-            response = await self.standupRepository.get_standup_by_message_id(
-                str(message.id)
-            )
-            if response:
-                raise ValueError(
-                    f"Message with ID {message.id} already exists in the standup database."
-                )
-
+    ) -> tuple[StandupMessage, list[str], Literal["today", "future", "past"]]:
         message_content = message.content.strip()
         pattern = r"\b\d{2}/\d{2}/\d{4}\b"
 
@@ -192,22 +197,85 @@ class StandupService:
 
         # content = message_contect.replace(date, "").strip()
 
-        await self.standupRepository.track_standup(standup_message)
-        await self.standupRepository.insert_standup_tasks(
-            message_id=str(message.id),
-            author_id=str(user_id),
-            tasks=standup_tasks,
+        return standup_message, standup_tasks, time_status
+
+    async def track_standup(
+        self,
+        message: discord.Message,
+        check_is_exist: bool = True,
+        bypass_check_date: bool = False,
+    ) -> Literal["today", "future", "past"]:
+        standup_message, standup_tasks, time_status = self.parse_standup_message(
+            message, bypass_check_date=bypass_check_date
         )
 
-        if self.is_standup_message_entry_office(message_content):
-            await self.officeEntryService.track_office_entry(
-                author_id=str(user_id),
-                message_id=str(message.id),
-                date=message_date,
+        written = await self.standupRepository.ingest_standup(
+            standup_message,
+            standup_tasks,
+            entry_office=self.is_standup_message_entry_office(standup_message.content),
+            office_entry_created_at=get_datetime_now(),
+            skip_if_exists=check_is_exist,
+        )
+        if not written:
+            raise ValueError(
+                f"Message with ID {message.id} already exists in the standup database."
             )
 
         return time_status
 
+    async def is_standup_unchanged(self, message: discord.Message) -> bool:
+        """True when ``message`` is stored as a stand-up with this exact content."""
+        stored_hash = await self.standupRepository.get_standup_content_hash(
+            str(message.id)
+        )
+        return stored_hash == content_fingerprint(message.content)
+
+    async def sync_edited_standup(
+        self, message: discord.Message
+    ) -> Literal["today", "future", "past"]:
+        try:
+            standup_message, standup_tasks, time_status = self.parse_standup_message(
+                message, bypass_check_date=True
+            )
+        except ValueError:
+            # An edit that no longer parses stops counting as a stand-up.
+            await self.delete_standup_by_message_id(message.id)
+            raise
+
+        await self.standupRepository.sync_standup(
+            standup_message,
+            standup_tasks,
+            entry_office=self.is_standup_message_entry_office(standup_message.content),
+            office_entry_created_at=get_datetime_now(),
+        )
+        return time_status
+
+    async def bulk_track_standups(
+        self, messages: list[discord.Message]
+    ) -> tuple[int, int, int, int]:
+        standups: list[tuple[StandupMessage, list[str], bool]] = []
+        skipped = 0
+        for message in messages:
+            try:
+                standup_message, standup_tasks, _ = self.parse_standup_message(
+                    message, bypass_check_date=True
+                )
+            except ValueError:
+                skipped += 1
+                continue
+            standups.append(
+                (
+                    standup_message,
+                    standup_tasks,
+                    self.is_standup_message_entry_office(standup_message.content),
+                )
+            )
+
+        messages_written, tasks_written, office_entries_written = (
+            await self.standupRepository.bulk_ingest_standups(standups)
+        )
+        return messages_written, tasks_written, office_entries_written, skipped
+
     async def get_standup_embed(
         self,
         user_inleaves: list[LeaveByDateChannel],
@@ -331,6 +399,19 @@ class StandupService:
         )
         return response
 
+    def iter_standups_by_user_and_date(
+        self, user_id: int, from_date: date, to_date: date
+    ) -> AsyncIterator[UserStandupReport]:
+        return self.standupRepository.iter_standups_by_user_and_date(
+            str(user_id), from_date, to_date
+        )
+
+    async def ensure_standup_partitions(self) -> int:
+        today = get_date_now()
+        return await self.standupRepository.create_standup_partitions(
+            today, today + timedelta(days=31 * STANDUP_PARTITION_MONTHS_AHEAD)
+        )
+
     async def get_monthly_standup_embed(
         self,
         user_standup_data: list[UserStandupReport],
@@ -408,9 +489,10 @@ class StandupService:
         inactive_members: list[MemberTeam] = []
 
         today = get_date_now()
-        previous_weekdays = get_previous_weekdays(today, num_days=num_days)
-        from_date = previous_weekdays[-1]
-        to_date = previous_weekdays[0]
+        from_date = await self.calendarService.previous_working_day(
+            today + timedelta(days=1), n=num_days
+        )
+        to_date = today
 
         for member in all_members:
             member_standups = await self.get_standups_by_user_and_date(
@@ -0,0 +1,66 @@
+from datetime import date
+from typing import TYPE_CHECKING, Literal
+
+import discord
+
+from datacache import DataCache
+from models import DailySummaryMessage
+from utils.datetime_utils import get_date_now
+
+if TYPE_CHECKING:
+    from core.custom_bot import CustomBot
+    from repositories.summary_message_repository import SummaryMessageRepository
+
+SummaryKind = Literal["leave", "office_entry"]
+
+
+class SummaryMessageService:
+    """Keeps DataCache's live summary messages in step with daily_summary_message."""
+
+    def __init__(
+        self,
+        summary_message_repository: "SummaryMessageRepository",
+        client: "CustomBot",
+    ):
+        self.summary_message_repository = summary_message_repository
+        self.client = client
+
+    @staticmethod
+    def _summaries(
+        summary_kind: SummaryKind,
+    ) -> dict[date, discord.Message | discord.PartialMessage]:
+        if summary_kind == "leave":
+            return DataCache.daily_leave_summary
+        return DataCache.daily_office_entry_summary
+
+    async def rehydrate(self) -> None:
+        """Restore today's summary messages as partial messages, without fetching them."""
+        summaries = await self.summary_message_repository.get_summary_messages_since(
+            get_date_now()
+        )
+        for summary in summaries:
+            message = self.client.get_partial_messageable(
+                summary.channel_id
+            ).get_partial_message(summary.message_id)
+            self._summaries(summary.summary_kind)[summary.date] = message
+
+    async def remember(
+        self,
+        summary_kind: SummaryKind,
+        date: date,
+        message: discord.Message | discord.PartialMessage,
+    ) -> None:
+        summaries = self._summaries(summary_kind)
+        summaries.clear()
+        summaries[date] = message
+        try:
+            await self.summary_message_repository.upsert_summary_message(
+                DailySummaryMessage(
+                    summary_kind=summary_kind,
+                    date=date,
+                    channel_id=message.channel.id,
+                    message_id=message.id,
+                )
+            )
+        except Exception as e:
+            print(f"Error saving {summary_kind} summary message {message.id}: {e}")
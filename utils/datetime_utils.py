@@ -33,6 +33,13 @@ def get_datetime_range(date: date | None = None) -> tuple[datetime, datetime]:
     return from_dt, to_dt
 
 
+def get_day_bounds(target_date: date) -> tuple[datetime, datetime]:
+    tz = timezone(timedelta(hours=7))
+
+    day_start = datetime.combine(target_date, time(0, 0, 0), tzinfo=tz)
+    return day_start, day_start + timedelta(days=1)
+
+
 def get_date_now() -> date:
     tz = timezone(timedelta(hours=7))
     now = datetime.now(tz).date()
@@ -1,11 +1,77 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Optional
+
 import discord
 
 
-async def clear_bot_reactions(msg: discord.Message, client: discord.Client):
-    for reaction in msg.reactions:
-        try:
-            async for user in reaction.users():
-                if client.user is not None and user.id == client.user.id:
-                    await msg.remove_reaction(reaction.emoji, user)
-        except discord.HTTPException:
-            pass
+class RenderedMessageCache:
+    """Fingerprint of the embed and view each bot message was last sent or edited with."""
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self.edits = 0
+        self.skipped = 0
+        self._fingerprints: OrderedDict[int, str] = OrderedDict()
+
+    @staticmethod
+    def fingerprint(
+        embed: Optional[discord.Embed], view: Optional[discord.ui.View]
+    ) -> str:
+        rendered = {
+            "embed": embed.to_dict() if embed else None,
+            "components": view.to_components() if view else None,
+        }
+        return hashlib.sha1(
+            json.dumps(rendered, sort_keys=True, default=str).encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+
+    def matches(self, message_id: int, fingerprint: str) -> bool:
+        return self._fingerprints.get(message_id) == fingerprint
+
+    def store(self, message_id: int, fingerprint: str) -> None:
+        self._fingerprints[message_id] = fingerprint
+        self._fingerprints.move_to_end(message_id)
+        if len(self._fingerprints) > self.max_size:
+            self._fingerprints.popitem(last=False)
+
+    def format_status(self) -> str:
+        return f"Message edits: sent={self.edits} skipped_unchanged={self.skipped}"
+
+
+rendered_messages = RenderedMessageCache()
+
+
+def remember_rendered(
+    message: discord.Message | discord.PartialMessage,
+    embed: Optional[discord.Embed] = None,
+    view: Optional[discord.ui.View] = None,
+) -> None:
+    """Record what a freshly sent message shows, so an identical edit is skipped."""
+    rendered_messages.store(message.id, rendered_messages.fingerprint(embed, view))
+
+
+async def edit_if_changed(
+    message: discord.Message | discord.PartialMessage,
+    embed: discord.Embed,
+    view: Optional[discord.ui.View] = None,
+) -> bool:
+    """Edit ``message`` unless it was last sent or edited with this same embed and view.
+
+    Returns whether the edit was sent. Without ``view`` the message's
+    components are left as they are, like ``message.edit(embed=...)``.
+    """
+    fingerprint = rendered_messages.fingerprint(embed, view)
+    if rendered_messages.matches(message.id, fingerprint):
+        rendered_messages.skipped += 1
+        return False
+
+    if view is None:
+        await message.edit(embed=embed)
+    else:
+        await message.edit(embed=embed, view=view)
+    rendered_messages.edits += 1
+    rendered_messages.store(message.id, fingerprint)
+    return True
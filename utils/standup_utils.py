@@ -1,4 +1,8 @@
 import re
+from difflib import SequenceMatcher
+from uuid import UUID
+
+TASK_SIMILARITY_THRESHOLD = 0.6
 
 
 def extract_bullet_points(text: str) -> list[str]:
@@ -8,3 +12,51 @@ def extract_bullet_points(text: str) -> list[str]:
     #     return "\n".join(f"- {x}" for x in results)
 
     return results
+
+
+def diff_standup_tasks(
+    existing_tasks: list[tuple[UUID, str]], new_tasks: list[str]
+) -> tuple[list[tuple[UUID, str]], list[UUID], list[str]]:
+    """Match an edited bullet list against the stored tasks.
+
+    Unchanged bullets keep their row. A reworded bullet is paired with the most
+    similar leftover task, so its id and status survive the edit. Returns the
+    ``(updates, deletes, inserts)`` needed to turn the stored rows into ``new_tasks``.
+    """
+    new_tasks = [task.strip() for task in new_tasks]
+
+    unmatched_existing: dict[str, list[UUID]] = {}
+    for task_id, task in existing_tasks:
+        unmatched_existing.setdefault(task, []).append(task_id)
+
+    leftover_new: list[str] = []
+    for task in new_tasks:
+        task_ids = unmatched_existing.get(task)
+        if task_ids:
+            task_ids.pop(0)
+        else:
+            leftover_new.append(task)
+
+    leftover_existing = [
+        (task_id, task)
+        for task, task_ids in unmatched_existing.items()
+        for task_id in task_ids
+    ]
+
+    updates: list[tuple[UUID, str]] = []
+    inserts: list[str] = []
+    for task in leftover_new:
+        best_index, best_ratio = None, 0.0
+        for index, (_, existing_task) in enumerate(leftover_existing):
+            ratio = SequenceMatcher(None, existing_task, task).ratio()
+            if ratio >= TASK_SIMILARITY_THRESHOLD and ratio > best_ratio:
+                best_index, best_ratio = index, ratio
+
+        if best_index is None:
+            inserts.append(task)
+        else:
+            task_id, _ = leftover_existing.pop(best_index)
+            updates.append((task_id, task))
+
+    deletes = [task_id for task_id, _ in leftover_existing]
+    return updates, deletes, inserts
@@ -1,3 +1,4 @@
+import hashlib
 import random
 import re
 import string
@@ -22,6 +23,11 @@ def remove_special_characters(string: str, allowed: str = "_") -> str:
 def make_name_safe(name: str) -> str:
     return convert_string_to_snake_case(remove_special_characters(name))
 
+
+def content_fingerprint(content: str) -> str:
+    """Same value as the content_hash columns (db/migations/8.sql) for stored content."""
+    return hashlib.md5(content.strip().encode("utf-8"), usedforsecurity=False).hexdigest()
+
 def random_text(length: int = 5, include_chars: list[str] | None = None) -> str:
     characters = string.ascii_uppercase + string.digits
 
@@ -27,6 +27,8 @@ class BotPanelView(discord.ui.View):
         label="Clock In",
         style=discord.ButtonStyle.green,
         emoji="🕒",
+        # Stable, so identical panels fingerprint the same in edit_if_changed.
+        custom_id="bot_panel:clock_in",
     )
     async def clock_in_button_callback(
         self, interaction: discord.Interaction, button: discord.ui.Button
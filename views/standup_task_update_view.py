@@ -27,9 +27,11 @@ class StandupTaskUpdateView(discord.ui.View):
     async def todo_button_callback(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        if self.task.id is not None:
+        if self.task.id is not None and self.task.message_date is not None:
             await self.client.standup_service.update_task_status(
-                task_id=self.task.id, status="todo"
+                task_id=self.task.id,
+                message_date=self.task.message_date,
+                status="todo",
             )
             await interaction.response.edit_message(
                 content=(
@@ -51,9 +53,11 @@ class StandupTaskUpdateView(discord.ui.View):
     async def in_progress_button_callback(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        if self.task.id is not None:
+        if self.task.id is not None and self.task.message_date is not None:
             await self.client.standup_service.update_task_status(
-                task_id=self.task.id, status="in_progress"
+                task_id=self.task.id,
+                message_date=self.task.message_date,
+                status="in_progress",
             )
             await interaction.response.edit_message(
                 content=(
@@ -75,9 +79,11 @@ class StandupTaskUpdateView(discord.ui.View):
     async def done_button_callback(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
-        if self.task.id is not None:
+        if self.task.id is not None and self.task.message_date is not None:
             await self.client.standup_service.update_task_status(
-                task_id=self.task.id, status="done"
+                task_id=self.task.id,
+                message_date=self.task.message_date,
+                status="done",
             )
             await interaction.response.edit_message(
                 content=(